@@ -5,3 +5,11 @@ class AiusescaleConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'AIUseScale'
     label = 'ai_use_scale'
+
+    def ready(self):
+        from common.search import register_search_index
+
+        register_search_index(
+            self.get_model('ScaleLevelContent'),
+            ('label', 'title', 'description', 'ai_usage', 'instructions'),
+        )
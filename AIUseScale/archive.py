@@ -0,0 +1,313 @@
+"""
+Binary archive of the versioned scale catalogue, written by ``dump_scales``
+and read by ``load_scales``.
+
+An archive is a gzip stream that starts with ``MAGIC``. The rest is a
+sequence of frames. Each frame is a one-byte kind and a four-byte big-endian
+payload length. The payload is a compact JSON array of rows, and each row
+lists the values of that kind's ``COLUMNS``. Frames come in dependency order
+(contents, records, versions, levels) and the archive ends with an ``END``
+frame holding the row counts. A loader can therefore insert every batch as
+soon as it is read, and memory stays bounded by the batch size rather than
+the size of the catalogue.
+"""
+
+from __future__ import annotations
+
+import datetime
+import gzip
+import json
+import struct
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, transaction
+from django.utils.dateparse import parse_datetime
+
+from usersystem.models import User
+
+from .models import ScaleLevel, ScaleLevelContent, ScaleRecord, ScaleVersion
+
+MAGIC = b"AIUSESCALES\x001\n"
+CONTENT, RECORD, VERSION, LEVEL, END = b"C", b"R", b"V", b"L", b"E"
+KIND_NAMES = {
+    CONTENT: "contents",
+    RECORD: "records",
+    VERSION: "versions",
+    LEVEL: "levels",
+}
+COLUMNS = {
+    CONTENT: ("digest", *ScaleLevelContent.FIELDS),
+    RECORD: (
+        "id",
+        "name",
+        "owner_type",
+        "owner_id",
+        "owner_username",
+        "is_public",
+        "created_at",
+        "updated_at",
+    ),
+    VERSION: ("id", "record_id", "version", "updated_at", "updated_by", "notes"),
+    LEVEL: ("uid", "version_id", "position", "level_code", "content_digest"),
+}
+# Model lookups for each archive column, where they differ.
+_LOOKUPS = {
+    "owner_username": "owner_user__username",
+    "content_digest": "content__digest",
+}
+_HEADER = struct.Struct(">cI")
+DEFAULT_BATCH_SIZE = 2000
+
+
+class ArchiveError(Exception):
+    pass
+
+
+class _ArchiveEncoder(DjangoJSONEncoder):
+    def default(self, o):
+        # DjangoJSONEncoder cuts datetimes to milliseconds; keep every digit.
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+def _sources():
+    # Only content that a level refers to; orphans are left for ``prune``.
+    contents = ScaleLevelContent.objects.filter(
+        pk__in=ScaleLevel.objects.values("content")
+    )
+    return (
+        (CONTENT, contents),
+        (RECORD, ScaleRecord.objects.all()),
+        (VERSION, ScaleVersion.objects.all()),
+        (LEVEL, ScaleLevel.objects.all()),
+    )
+
+
+def _write_frame(archive, kind: bytes, payload) -> None:
+    data = json.dumps(payload, cls=_ArchiveEncoder, separators=(",", ":")).encode()
+    archive.write(_HEADER.pack(kind, len(data)))
+    archive.write(data)
+
+
+def dump_catalogue(
+    stream: BinaryIO, *, batch_size: int = DEFAULT_BATCH_SIZE
+) -> dict[str, int]:
+    """Write every scale record with its full history to ``stream``."""
+    counts = {}
+    # One transaction so the archive is a consistent snapshot.
+    with transaction.atomic(), gzip.GzipFile(fileobj=stream, mode="wb") as archive:
+        archive.write(MAGIC)
+        for kind, queryset in _sources():
+            lookups = [_LOOKUPS.get(column, column) for column in COLUMNS[kind]]
+            rows = (
+                queryset.order_by()
+                .values_list(*lookups)
+                .iterator(chunk_size=batch_size)
+            )
+            count = 0
+            batch = []
+            for row in rows:
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    _write_frame(archive, kind, batch)
+                    count += len(batch)
+                    batch = []
+            if batch:
+                _write_frame(archive, kind, batch)
+                count += len(batch)
+            counts[KIND_NAMES[kind]] = count
+        _write_frame(archive, END, counts)
+    return counts
+
+
+def _read_frames(archive) -> Iterator[tuple[bytes, list]]:
+    while True:
+        header = archive.read(_HEADER.size)
+        if not header:
+            raise ArchiveError("archive ends before its END frame")
+        if len(header) < _HEADER.size:
+            raise ArchiveError("archive is truncated")
+        kind, length = _HEADER.unpack(header)
+        data = archive.read(length)
+        if len(data) < length:
+            raise ArchiveError("archive is truncated")
+        yield kind, json.loads(data)
+        if kind == END:
+            return
+
+
+@contextmanager
+def _explicit_timestamps():
+    """
+    Keep archived timestamps. ``bulk_create`` would otherwise stamp
+    ``auto_now``/``auto_now_add`` fields with the time of the load.
+    """
+    fields = [
+        ScaleRecord._meta.get_field("created_at"),
+        ScaleRecord._meta.get_field("updated_at"),
+        ScaleVersion._meta.get_field("updated_at"),
+    ]
+    saved = [(field, field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+def _defer_constraints() -> None:
+    # Django creates foreign keys as deferrable; make sure they are deferred
+    # for this transaction so batches are not checked row by row.
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute("SET CONSTRAINTS ALL DEFERRED")
+
+
+class _Loader:
+    def __init__(self, *, batch_size: int, replace: bool):
+        self.batch_size = batch_size
+        self.replace = replace
+        self.counts = {name: 0 for name in KIND_NAMES.values()}
+        self.replaced = 0
+        self.unmatched_owners = 0
+
+    def load(self, kind: bytes, rows: list) -> None:
+        columns = COLUMNS[kind]
+        if any(len(row) != len(columns) for row in rows):
+            raise ArchiveError(f"malformed {KIND_NAMES[kind]} frame")
+        values = [dict(zip(columns, row)) for row in rows]
+        getattr(self, f"_load_{KIND_NAMES[kind]}")(values)
+        self.counts[KIND_NAMES[kind]] += len(values)
+
+    def _load_contents(self, values):
+        contents = []
+        for value in values:
+            digest = value.pop("digest")
+            if ScaleLevelContent.compute_digest(value) != digest:
+                raise ArchiveError(f"content {digest[:12]} does not match its text")
+            contents.append(
+                ScaleLevelContent(digest=digest, **ScaleLevelContent.normalize(value))
+            )
+        # Text already present in this database is shared, not duplicated.
+        ScaleLevelContent.objects.bulk_create(
+            contents, batch_size=self.batch_size, ignore_conflicts=True
+        )
+
+    def _load_records(self, values):
+        existing = ScaleRecord.objects.filter(pk__in=[value["id"] for value in values])
+        if existing.exists():
+            if not self.replace:
+                raise ArchiveError(
+                    "scale records in the archive already exist; "
+                    "use --replace to overwrite them"
+                )
+            self.replaced += existing.count()
+            existing.delete()
+        usernames = {value["owner_username"] for value in values} - {None}
+        owners = dict(
+            User.objects.filter(username__in=usernames).values_list("username", "pk")
+        )
+        records = []
+        for value in values:
+            username = value.pop("owner_username")
+            if username and username not in owners:
+                self.unmatched_owners += 1
+            records.append(
+                ScaleRecord(
+                    owner_user_id=owners.get(username),
+                    created_at=parse_datetime(value.pop("created_at")),
+                    updated_at=parse_datetime(value.pop("updated_at")),
+                    **value,
+                )
+            )
+        self._check_owner_names(records, owners)
+        ScaleRecord.objects.bulk_create(records, batch_size=self.batch_size)
+
+    def _check_owner_names(self, records, owners):
+        """Report records that would break the (owner_user, name) constraint."""
+        owned = [record for record in records if record.owner_user_id is not None]
+        if not owned:
+            return
+        taken = set(
+            ScaleRecord.objects.filter(
+                owner_user_id__in={record.owner_user_id for record in owned},
+                name__in={record.name for record in owned},
+            ).values_list("owner_user_id", "name")
+        )
+        clashes = []
+        for record in owned:
+            key = (record.owner_user_id, record.name)
+            if key in taken:
+                clashes.append(record)
+            taken.add(key)
+        if clashes:
+            usernames = {pk: username for username, pk in owners.items()}
+            names = ", ".join(
+                f"{record.name!r} ({usernames[record.owner_user_id]})"
+                for record in clashes
+            )
+            raise ArchiveError(
+                f"coordinators already have scale records with these names: {names}"
+            )
+
+    def _load_versions(self, values):
+        ScaleVersion.objects.bulk_create(
+            [
+                ScaleVersion(
+                    updated_at=parse_datetime(value.pop("updated_at")), **value
+                )
+                for value in values
+            ],
+            batch_size=self.batch_size,
+        )
+
+    def _load_levels(self, values):
+        digests = {value["content_digest"] for value in values}
+        contents = dict(
+            ScaleLevelContent.objects.filter(digest__in=digests).values_list(
+                "digest", "pk"
+            )
+        )
+        if len(contents) < len(digests):
+            raise ArchiveError("levels refer to content missing from the archive")
+        ScaleLevel.objects.bulk_create(
+            [
+                ScaleLevel(content_id=contents[value.pop("content_digest")], **value)
+                for value in values
+            ],
+            batch_size=self.batch_size,
+        )
+
+
+def load_catalogue(
+    stream: BinaryIO, *, batch_size: int = DEFAULT_BATCH_SIZE, replace: bool = False
+) -> dict[str, int]:
+    """
+    Insert the archive in ``stream`` in one transaction. Records that already
+    exist abort the load unless ``replace`` is set, in which case they are
+    deleted (with their history) first. Owners are matched by username.
+    """
+    loader = _Loader(batch_size=batch_size, replace=replace)
+    with gzip.GzipFile(fileobj=stream, mode="rb") as archive:
+        if archive.read(len(MAGIC)) != MAGIC:
+            raise ArchiveError("not a scale archive")
+        with transaction.atomic(), _explicit_timestamps():
+            _defer_constraints()
+            for kind, rows in _read_frames(archive):
+                if kind == END:
+                    if rows != loader.counts:
+                        raise ArchiveError("archive row counts do not match")
+                elif kind in COLUMNS:
+                    loader.load(kind, rows)
+                else:
+                    raise ArchiveError(f"unknown frame kind {kind!r}")
+    return {
+        **loader.counts,
+        "replacedRecords": loader.replaced,
+        "unmatchedOwners": loader.unmatched_owners,
+    }
@@ -0,0 +1,34 @@
+import sys
+import time
+
+from django.core.management.base import BaseCommand
+
+from AIUseScale.archive import DEFAULT_BATCH_SIZE, dump_catalogue
+
+
+class Command(BaseCommand):
+    help = (
+        "Write every scale record with its full version history to a "
+        "compressed archive that load_scales can read. Rows are streamed in "
+        "batches, so memory use does not grow with the catalogue."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Archive to write, or - for stdout.")
+        parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        batch_size = max(1, options["batch_size"])
+        if options["path"] == "-":
+            counts = dump_catalogue(sys.stdout.buffer, batch_size=batch_size)
+            report = self.stderr
+        else:
+            with open(options["path"], "wb") as stream:
+                counts = dump_catalogue(stream, batch_size=batch_size)
+            report = self.stdout
+        for name, count in counts.items():
+            report.write(f"{name}: {count}")
+        report.write(
+            self.style.SUCCESS(f"dumped in {time.perf_counter() - started:.1f}s")
+        )
@@ -0,0 +1,43 @@
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from AIUseScale.archive import DEFAULT_BATCH_SIZE, ArchiveError, load_catalogue
+
+
+class Command(BaseCommand):
+    help = (
+        "Load a dump_scales archive in a single transaction. Owners are "
+        "matched by username. Records that already exist stop the load "
+        "unless --replace is given."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Archive to read, or - for stdin.")
+        parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+        parser.add_argument(
+            "--replace",
+            action="store_true",
+            help="Delete existing records with the same id, and their history.",
+        )
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        kwargs = {
+            "batch_size": max(1, options["batch_size"]),
+            "replace": options["replace"],
+        }
+        try:
+            if options["path"] == "-":
+                counts = load_catalogue(sys.stdin.buffer, **kwargs)
+            else:
+                with open(options["path"], "rb") as stream:
+                    counts = load_catalogue(stream, **kwargs)
+        except (OSError, EOFError, ValueError, ArchiveError) as exc:
+            raise CommandError(f"could not load {options['path']}: {exc}")
+        for name, count in counts.items():
+            self.stdout.write(f"{name}: {count}")
+        self.stdout.write(
+            self.style.SUCCESS(f"loaded in {time.perf_counter() - started:.1f}s")
+        )
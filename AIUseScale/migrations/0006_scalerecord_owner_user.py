@@ -0,0 +1,50 @@
+# Generated by Django 5.0.6 on 2026-10-19 15:16
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def link_owners(apps, schema_editor):
+    """Point SC records at their coordinator, matching owner_id as username or pk."""
+    ScaleRecord = apps.get_model("ai_use_scale", "ScaleRecord")
+    User = apps.get_model("usersystem", "User")
+    records = ScaleRecord.objects.filter(owner_type="sc", owner_user__isnull=True)
+    for record in records.exclude(owner_id__isnull=True).exclude(owner_id=""):
+        owner = User.objects.filter(username=record.owner_id).first()
+        if owner is None and record.owner_id.isdigit():
+            owner = User.objects.filter(pk=int(record.owner_id)).first()
+        if owner is None:
+            continue
+        record.owner_user_id = owner.pk
+        record.owner_id = owner.username
+        record.save(update_fields=["owner_user", "owner_id"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai_use_scale", "0005_alter_scalelevel_uid"),
+        ("usersystem", "0010_passwordresettoken_expires_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="scalerecord",
+            name="owner_user",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="scale_records",
+                to="usersystem.user",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="scalerecord",
+            index=models.Index(
+                fields=["owner_type", "owner_user"],
+                name="scale_recor_owner_t_683a06_idx",
+            ),
+        ),
+        migrations.RunPython(link_owners, migrations.RunPython.noop),
+    ]
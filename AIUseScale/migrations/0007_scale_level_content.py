@@ -0,0 +1,180 @@
+# Generated by Django 5.0.6 on 2026-10-19 15:21
+
+import hashlib
+import json
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+LEVEL_FIELDS = (
+    "label",
+    "title",
+    "description",
+    "ai_usage",
+    "instructions",
+    "acknowledgement",
+)
+
+
+def _normalize(level):
+    return {
+        "label": level.label or "",
+        "title": level.title or None,
+        "description": level.description or "",
+        "ai_usage": level.ai_usage or "",
+        "instructions": level.instructions or None,
+        "acknowledgement": level.acknowledgement or None,
+    }
+
+
+def move_level_text(apps, schema_editor):
+    """Deduplicate level text into content rows keyed by digest."""
+    ScaleLevel = apps.get_model("ai_use_scale", "ScaleLevel")
+    ScaleLevelContent = apps.get_model("ai_use_scale", "ScaleLevelContent")
+    content_ids = {}
+    batch = []
+    for level in ScaleLevel.objects.order_by("pk").iterator(chunk_size=1000):
+        values = _normalize(level)
+        payload = json.dumps([values[field] for field in LEVEL_FIELDS])
+        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        if digest not in content_ids:
+            content_ids[digest] = ScaleLevelContent.objects.create(
+                digest=digest, **values
+            ).pk
+        level.content_id = content_ids[digest]
+        batch.append(level)
+        if len(batch) >= 1000:
+            ScaleLevel.objects.bulk_update(batch, ["content"])
+            batch = []
+    if batch:
+        ScaleLevel.objects.bulk_update(batch, ["content"])
+
+
+def restore_level_text(apps, schema_editor):
+    """Copy content text back onto each level, undoing ``move_level_text``."""
+    ScaleLevel = apps.get_model("ai_use_scale", "ScaleLevel")
+    levels = ScaleLevel.objects.select_related("content").exclude(content=None)
+    batch = []
+    for level in levels.order_by("pk").iterator(chunk_size=1000):
+        for field in LEVEL_FIELDS:
+            setattr(level, field, getattr(level.content, field))
+        batch.append(level)
+        if len(batch) >= 1000:
+            ScaleLevel.objects.bulk_update(batch, LEVEL_FIELDS)
+            batch = []
+    if batch:
+        ScaleLevel.objects.bulk_update(batch, LEVEL_FIELDS)
+
+
+def drop_level_search_index(apps, schema_editor):
+    """
+    The full-text index moves to scale_level_content (installed after migrate);
+    the old one on scale_level would reference dropped columns.
+    """
+    connection = schema_editor.connection
+    qn = connection.ops.quote_name
+    if connection.vendor == "sqlite":
+        for suffix in ("_ai", "_ad", "_au"):
+            trigger = qn(f"scale_level_fts{suffix}")
+            schema_editor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        schema_editor.execute(f"DROP TABLE IF EXISTS {qn('scale_level_fts')}")
+    elif connection.vendor == "postgresql":
+        schema_editor.execute(f"DROP INDEX IF EXISTS {qn('scale_level_search')}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai_use_scale", "0006_scalerecord_owner_user"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ScaleLevelContent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("digest", models.CharField(max_length=64, unique=True)),
+                ("label", models.CharField(max_length=255)),
+                ("title", models.CharField(blank=True, max_length=255, null=True)),
+                ("description", models.TextField()),
+                ("ai_usage", models.TextField()),
+                ("instructions", models.TextField(blank=True, null=True)),
+                ("acknowledgement", models.TextField(blank=True, null=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "db_table": "scale_level_content",
+            },
+        ),
+        migrations.AddField(
+            model_name="scalelevel",
+            name="content",
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="levels",
+                to="ai_use_scale.scalelevelcontent",
+            ),
+        ),
+        migrations.RunPython(drop_level_search_index, migrations.RunPython.noop),
+        migrations.RunPython(move_level_text, restore_level_text),
+        migrations.AlterField(
+            model_name="scalelevel",
+            name="content",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="levels",
+                to="ai_use_scale.scalelevelcontent",
+            ),
+        ),
+        # Defaults for the required text columns so that, when migrating
+        # backwards, they can be re-added to existing rows before
+        # restore_level_text fills them in.
+        migrations.AlterField(
+            model_name="scalelevel",
+            name="label",
+            field=models.CharField(default="", max_length=255),
+        ),
+        migrations.AlterField(
+            model_name="scalelevel",
+            name="description",
+            field=models.TextField(default=""),
+        ),
+        migrations.AlterField(
+            model_name="scalelevel",
+            name="ai_usage",
+            field=models.TextField(default=""),
+        ),
+        migrations.RemoveField(
+            model_name="scalelevel",
+            name="acknowledgement",
+        ),
+        migrations.RemoveField(
+            model_name="scalelevel",
+            name="ai_usage",
+        ),
+        migrations.RemoveField(
+            model_name="scalelevel",
+            name="description",
+        ),
+        migrations.RemoveField(
+            model_name="scalelevel",
+            name="instructions",
+        ),
+        migrations.RemoveField(
+            model_name="scalelevel",
+            name="label",
+        ),
+        migrations.RemoveField(
+            model_name="scalelevel",
+            name="title",
+        ),
+    ]
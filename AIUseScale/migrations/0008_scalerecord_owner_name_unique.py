@@ -0,0 +1,47 @@
+# Generated by Django 5.0.6 on 2026-10-19 17:45
+
+from django.db import migrations, models
+
+
+def rename_duplicates(apps, schema_editor):
+    """Suffix repeated names per owner so the unique constraint can be added."""
+    ScaleRecord = apps.get_model("ai_use_scale", "ScaleRecord")
+    records = list(
+        ScaleRecord.objects.filter(owner_user__isnull=False).order_by(
+            "owner_user_id", "created_at"
+        )
+    )
+    # Names already in use are never handed out, so a record that is unique
+    # today keeps its name even if it looks like a generated suffix.
+    taken = {(record.owner_user_id, record.name) for record in records}
+    kept = set()
+    for record in records:
+        key = (record.owner_user_id, record.name)
+        if key not in kept:
+            kept.add(key)
+            continue
+        suffix = 2
+        while (record.owner_user_id, f"{record.name} ({suffix})") in taken:
+            suffix += 1
+        record.name = f"{record.name} ({suffix})"
+        taken.add((record.owner_user_id, record.name))
+        kept.add((record.owner_user_id, record.name))
+        record.save(update_fields=["name"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai_use_scale", "0007_scale_level_content"),
+        ("usersystem", "0011_widen_user_password"),
+    ]
+
+    operations = [
+        migrations.RunPython(rename_duplicates, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="scalerecord",
+            constraint=models.UniqueConstraint(
+                fields=("owner_user", "name"), name="scale_record_owner_name_unique"
+            ),
+        ),
+    ]
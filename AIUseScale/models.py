@@ -1,5 +1,9 @@
+import hashlib
+import json
 import uuid
+
 from django.db import models
+from django.db.models import Q
 
 
 # Legacy single version scale exposed under /scales/.
@@ -21,6 +25,40 @@ class AIUserScale(models.Model):
         return f"{self.username} - {self.name} ({self.level})"
 
 
+class ScaleRecordQuerySet(models.QuerySet):
+    """
+    Row visibility for scale records. Admins see everything. Coordinators see
+    the system scales and their own scale, and may only modify their own.
+    ``is_public`` does not widen this. Ownership is the indexed ``owner_user``
+    foreign key, not the free-form ``owner_id`` label.
+    """
+
+    def system(self):
+        return self.filter(owner_type=ScaleRecord.OWNER_SYSTEM)
+
+    def owned_by(self, user):
+        return self.filter(owner_type=ScaleRecord.OWNER_SC, owner_user=user)
+
+    def visible_to(self, user):
+        role = getattr(user, "role", None)
+        if role == "admin":
+            return self
+        if role == "sc":
+            return self.filter(
+                Q(owner_type=ScaleRecord.OWNER_SYSTEM)
+                | Q(owner_type=ScaleRecord.OWNER_SC, owner_user=user)
+            )
+        return self.none()
+
+    def editable_by(self, user):
+        role = getattr(user, "role", None)
+        if role == "admin":
+            return self
+        if role == "sc":
+            return self.owned_by(user)
+        return self.none()
+
+
 # Versioned scale set used by /scale-records/.
 class ScaleRecord(models.Model):
     OWNER_SYSTEM = "system"
@@ -33,7 +71,15 @@ class ScaleRecord(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     name = models.CharField(max_length=255)
     owner_type = models.CharField(max_length=10, choices=OWNER_CHOICES)
+    # Label shown to clients (the coordinator's username for SC records).
     owner_id = models.CharField(max_length=128, null=True, blank=True)
+    owner_user = models.ForeignKey(
+        "usersystem.User",
+        related_name="scale_records",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+    )
     is_public = models.BooleanField(default=False)
 
     created_at = models.DateTimeField(auto_now_add=True)  # Internal ordering field
@@ -43,13 +89,32 @@ class ScaleRecord(models.Model):
         db_table = "scale_record"
         indexes = [
             models.Index(fields=["owner_type", "owner_id"]),
+            models.Index(fields=["owner_type", "owner_user"]),
             models.Index(fields=["is_public"]),
         ]
+        constraints = [
+            # System records have no owner_user, and NULLs never collide.
+            models.UniqueConstraint(
+                fields=["owner_user", "name"], name="scale_record_owner_name_unique"
+            ),
+        ]
         ordering = ["-updated_at"]
 
+    objects = ScaleRecordQuerySet.as_manager()
+
     def __str__(self):
         return f"{self.name} ({self.owner_type}/{self.owner_id})"
 
+    def is_editable_by(self, user) -> bool:
+        role = getattr(user, "role", None)
+        if role == "admin":
+            return True
+        return (
+            role == "sc"
+            and self.owner_type == self.OWNER_SC
+            and self.owner_user_id == getattr(user, "pk", None)
+        )
+
 
 class ScaleVersion(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -68,17 +133,72 @@ class ScaleVersion(models.Model):
         return f"{self.record_id} v{self.version}"
 
 
-class ScaleLevel(models.Model):
-    uid = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    version = models.ForeignKey(ScaleVersion, related_name="levels", on_delete=models.CASCADE)
-    position = models.IntegerField()
-    level_code = models.CharField(max_length=64)
+class ScaleLevelContent(models.Model):
+    """
+    Text of a scale level, stored once per distinct content. Levels reference
+    it by digest, so versions that repeat a level (unchanged levels, SC copies
+    of the default scale) add no new text rows.
+    """
+
+    FIELDS = (
+        "label", "title", "description", "ai_usage", "instructions", "acknowledgement",
+    )
+
+    digest = models.CharField(max_length=64, unique=True)
     label = models.CharField(max_length=255)
     title = models.CharField(max_length=255, null=True, blank=True)
     description = models.TextField()
     ai_usage = models.TextField()  # = aiUsage
     instructions = models.TextField(null=True, blank=True)
     acknowledgement = models.TextField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "scale_level_content"
+
+    def __str__(self):
+        return f"{self.label} ({self.digest[:12]})"
+
+    @classmethod
+    def normalize(cls, values: dict) -> dict:
+        return {
+            "label": values.get("label") or "",
+            "title": values.get("title") or None,
+            "description": values.get("description") or "",
+            "ai_usage": values.get("ai_usage") or "",
+            "instructions": values.get("instructions") or None,
+            "acknowledgement": values.get("acknowledgement") or None,
+        }
+
+    @classmethod
+    def compute_digest(cls, values: dict) -> str:
+        normalized = cls.normalize(values)
+        payload = json.dumps([normalized[field] for field in cls.FIELDS])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _content_field(name: str) -> property:
+    return property(lambda level: getattr(level.content, name), doc=f"content.{name}")
+
+
+class ScaleLevel(models.Model):
+    uid = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    version = models.ForeignKey(
+        ScaleVersion, related_name="levels", on_delete=models.CASCADE
+    )
+    position = models.IntegerField()
+    level_code = models.CharField(max_length=64)
+    content = models.ForeignKey(
+        ScaleLevelContent, related_name="levels", on_delete=models.PROTECT
+    )
+
+    # Read-through accessors; select or prefetch ``content`` when listing.
+    label = _content_field("label")
+    title = _content_field("title")
+    description = _content_field("description")
+    ai_usage = _content_field("ai_usage")
+    instructions = _content_field("instructions")
+    acknowledgement = _content_field("acknowledgement")
 
     class Meta:
         db_table = "scale_level"
@@ -1,4 +1,8 @@
+from functools import cached_property
+
 from rest_framework import serializers
+
+from common.serializers import ReadSerializer
 from .models import AIUserScale, ScaleRecord, ScaleVersion, ScaleLevel
 
 
@@ -33,6 +37,11 @@ class AIUserScaleSerializer(serializers.ModelSerializer):
 # Serializers backing the versioned /scale-records/ endpoints.
 class ScaleLevelSerializer(serializers.ModelSerializer):
     id = serializers.CharField(source="level_code", max_length=64)
+    # Stored on ScaleLevelContent and read through ScaleLevel properties.
+    label = serializers.CharField(max_length=255)
+    title = serializers.CharField(
+        max_length=255, required=False, allow_blank=True, allow_null=True
+    )
     description = serializers.CharField(required=False, allow_blank=True, allow_null=True)
     aiUsage = serializers.CharField(
         source="ai_usage",
@@ -87,17 +96,74 @@ class ScaleRecordSerializer(serializers.ModelSerializer):
             "currentVersion", "history",
         ]
 
+    def _versions(self, obj: ScaleRecord):
+        # Sorted in Python so ``prefetch_related("versions__levels")`` on the
+        # caller's queryset is reused instead of issuing queries per record.
+        return sorted(obj.versions.all(), key=lambda v: v.version, reverse=True)
+
     def get_currentVersion(self, obj: ScaleRecord):
-        latest = obj.versions.order_by("-version").first()
-        return ScaleVersionSerializer(latest).data if latest else None
+        versions = self._versions(obj)
+        return ScaleVersionSerializer(versions[0]).data if versions else None
 
     def get_history(self, obj: ScaleRecord):
-        qs = obj.versions.order_by("-version")
-        latest = qs.first()
-        if not latest:
-            return []
-        others = qs.exclude(pk=latest.pk)
-        return ScaleVersionSerializer(others, many=True).data
+        return ScaleVersionSerializer(self._versions(obj)[1:], many=True).data
+
+
+# Read-only twins of the serializers above for list responses. They build the
+# same output by attribute access instead of running each declared field, and
+# expect ``versions__levels__content`` to be prefetched.
+class ScaleLevelReadSerializer(ReadSerializer):
+    def to_representation(self, level: ScaleLevel):
+        content = level.content
+        return {
+            "id": level.level_code,
+            "label": content.label,
+            "title": content.title,
+            "description": content.description,
+            "aiUsage": content.ai_usage,
+            "instructions": content.instructions,
+            "acknowledgement": content.acknowledgement,
+        }
+
+
+class ScaleVersionReadSerializer(ReadSerializer):
+    datetime_format = "%Y-%m-%d %H:%M:%S"
+
+    @cached_property
+    def _level(self):
+        return ScaleLevelReadSerializer().to_representation
+
+    def to_representation(self, version: ScaleVersion):
+        return {
+            "id": str(version.pk),
+            "version": version.version,
+            "updatedAt": self.datetime(version.updated_at),
+            "updatedBy": version.updated_by,
+            "notes": version.notes,
+            "levels": [
+                self._level(level) for level in self.related(version, "levels")
+            ],
+        }
+
+
+class ScaleRecordReadSerializer(ReadSerializer):
+    @cached_property
+    def _version(self):
+        return ScaleVersionReadSerializer().to_representation
+
+    def to_representation(self, record: ScaleRecord):
+        versions = sorted(
+            self.related(record, "versions"), key=lambda v: v.version, reverse=True
+        )
+        return {
+            "id": str(record.pk),
+            "name": record.name,
+            "ownerType": record.owner_type,
+            "ownerId": record.owner_id,
+            "isPublic": record.is_public,
+            "currentVersion": self._version(versions[0]) if versions else None,
+            "history": [self._version(version) for version in versions[1:]],
+        }
 
 
 class SaveScaleVersionRequestSerializer(serializers.Serializer):
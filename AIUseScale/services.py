@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from typing import Iterable, Sequence
+
+from django.db import transaction
+from django.db.transaction import TransactionManagementError
+
+from .models import ScaleLevel, ScaleLevelContent, ScaleRecord, ScaleVersion
+
+
+def _require_transaction(name: str) -> None:
+    if not transaction.get_connection().in_atomic_block:
+        raise TransactionManagementError(f"{name} must run inside transaction.atomic()")
+
+
+def intern_level_contents(levels: Sequence[dict]) -> list[ScaleLevelContent]:
+    """
+    Content rows for ``levels`` (dicts keyed by model field names), in the same
+    order. Existing content is looked up by digest and only unseen content is
+    inserted, so this is two or three queries however many levels repeat.
+
+    Must run inside a transaction (TransactionManagementError otherwise): the
+    rows are locked until it ends, so ``manage.py prune`` cannot delete reused
+    content before the levels that point at it are committed.
+    """
+    _require_transaction("intern_level_contents")
+    digests = [ScaleLevelContent.compute_digest(level) for level in levels]
+    locked = ScaleLevelContent.objects.select_for_update().order_by("pk")
+    found = {
+        content.digest: content for content in locked.filter(digest__in=set(digests))
+    }
+    missing = {}
+    for digest, level in zip(digests, levels):
+        if digest not in found and digest not in missing:
+            missing[digest] = ScaleLevelContent(
+                digest=digest, **ScaleLevelContent.normalize(level)
+            )
+    if missing:
+        # A concurrent writer may insert the same content first; keep theirs.
+        ScaleLevelContent.objects.bulk_create(
+            missing.values(), batch_size=500, ignore_conflicts=True
+        )
+        found.update(
+            (content.digest, content)
+            for content in locked.filter(digest__in=list(missing))
+        )
+    return [found[digest] for digest in digests]
+
+
+def build_levels(
+    version: ScaleVersion, levels: Sequence[dict], contents: Iterable[ScaleLevelContent]
+) -> list[ScaleLevel]:
+    return [
+        ScaleLevel(
+            version=version,
+            position=position,
+            level_code=level["level_code"],
+            content=content,
+        )
+        for position, (level, content) in enumerate(zip(levels, contents))
+    ]
+
+
+def create_version(
+    record: ScaleRecord,
+    levels: Sequence[dict],
+    *,
+    updated_by: str,
+    notes: str | None = None,
+) -> ScaleVersion:
+    """
+    Append the next version of ``record`` with ``levels`` in order. Must run
+    inside a transaction, like ``intern_level_contents``.
+    """
+    _require_transaction("create_version")
+    last = record.versions.order_by("-version").first()
+    version = ScaleVersion.objects.create(
+        record=record,
+        version=(last.version + 1) if last else 1,
+        updated_by=updated_by,
+        notes=notes,
+    )
+    ScaleLevel.objects.bulk_create(
+        build_levels(version, levels, intern_level_contents(levels))
+    )
+    return version
+
+
+def diff_levels(
+    before: Sequence[ScaleLevel], after: Sequence[ScaleLevel]
+) -> dict[str, list]:
+    """
+    Compare two versions' levels, matched by ``level_code``. Levels that share
+    a content row are equal without comparing their text. ``changed`` entries
+    carry each differing field as ``(old, new)`` and whether the level moved.
+    """
+    old_by_code = {level.level_code: level for level in before}
+    new_codes = {level.level_code for level in after}
+    diff: dict[str, list] = {"added": [], "removed": [], "changed": [], "unchanged": []}
+    for level in after:
+        old = old_by_code.get(level.level_code)
+        if old is None:
+            diff["added"].append(level)
+            continue
+        fields = {}
+        if old.content_id != level.content_id:
+            for name in ScaleLevelContent.FIELDS:
+                old_value, new_value = getattr(old, name), getattr(level, name)
+                if old_value != new_value:
+                    fields[name] = (old_value, new_value)
+        moved = old.position != level.position
+        if fields or moved:
+            diff["changed"].append((old, level, fields, moved))
+        else:
+            diff["unchanged"].append(level)
+    diff["removed"] = [level for level in before if level.level_code not in new_codes]
+    return diff
@@ -1,24 +1,88 @@
 from uuid import UUID
 
-from django.db import transaction
-from django.db.models import Q
+from django.db import IntegrityError, transaction
+from django.db.models import OuterRef, Q, Subquery, prefetch_related_objects
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.http import parse_etags, quote_etag
 from rest_framework import viewsets, filters, status
 from rest_framework.decorators import action
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
-from rest_framework.exceptions import PermissionDenied
-
-from .models import AIUserScale, ScaleRecord, ScaleVersion, ScaleLevel
+from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
+from rest_framework.settings import api_settings
+
+from common.compression import precompressed_response
+from common.search import build_snippet, full_text_search
+from .models import (
+    AIUserScale,
+    ScaleLevel,
+    ScaleLevelContent,
+    ScaleRecord,
+    ScaleVersion,
+)
 from .serializer import (
     AIUserScaleSerializer,
+    ScaleLevelSerializer,
+    ScaleRecordReadSerializer,
     ScaleRecordSerializer,
+    ScaleVersionReadSerializer,
     SaveScaleVersionRequestSerializer,
 )
+from .services import create_version, diff_levels
 from usersystem.models import User
 from usersystem.permissions import ActiveUserPermission, RolePermission, resolve_active_user
 from notifications.services import send_notifications
 from notifications.utils import user_display_name
-from Assignment.models import Assignment
+
+
+SEARCH_RESULT_LIMIT = 50
+MAX_SEARCH_RESULT_LIMIT = 200
+SEARCHABLE_LEVEL_FIELDS = ("label", "title", "description", "ai_usage", "instructions")
+# Versions are never edited once saved, so anything built from them is final.
+IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+
+
+def _render_json(data) -> bytes:
+    # The configured JSON renderer, so DJANGO_JSON_BACKEND applies here too.
+    renderer = next(
+        renderer
+        for renderer in api_settings.DEFAULT_RENDERER_CLASSES
+        if renderer.format == "json"
+    )
+    return renderer().render(data, "application/json", {})
+
+
+def _client_field(name):
+    return "aiUsage" if name == "ai_usage" else name
+
+
+def _level_snippet(level, query):
+    for field in SEARCHABLE_LEVEL_FIELDS:
+        snippet = build_snippet(getattr(level, field), query)
+        if snippet:
+            return field, snippet
+    return None, None
+
+
+def _diff_payload(diff):
+    return {
+        "added": ScaleLevelSerializer(diff["added"], many=True).data,
+        "removed": ScaleLevelSerializer(diff["removed"], many=True).data,
+        "changed": [
+            {
+                "id": level.level_code,
+                "fromPosition": old.position,
+                "toPosition": level.position,
+                "moved": moved,
+                "fields": {
+                    _client_field(name): {"from": old_value, "to": new_value}
+                    for name, (old_value, new_value) in fields.items()
+                },
+            }
+            for old, level, fields, moved in diff["changed"]
+        ],
+        "unchanged": [level.level_code for level in diff["unchanged"]],
+    }
 
 
 class DefaultPagination(PageNumberPagination):
@@ -73,7 +137,7 @@ class AIUserScaleViewSet(viewsets.ModelViewSet):
 
 
 class ScaleRecordViewSet(viewsets.ModelViewSet):
-    queryset = ScaleRecord.objects.all().prefetch_related("versions__levels")
+    queryset = ScaleRecord.objects.all().prefetch_related("versions__levels__content")
     serializer_class = ScaleRecordSerializer
     permission_classes = [ActiveUserPermission, RolePermission]
     pagination_class = DefaultPagination
@@ -88,30 +152,27 @@ class ScaleRecordViewSet(viewsets.ModelViewSet):
     }
 
     def get_queryset(self):
-        qs = super().get_queryset()
+        acting_user = self._resolve_request_user(self.request)
+        qs = super().get_queryset().visible_to(acting_user)
         owner_type = self.request.query_params.get("ownerType")
         owner_id = self.request.query_params.get("ownerId")
         is_public = self.request.query_params.get("isPublic")
+        if owner_type == ScaleRecord.OWNER_SC and not owner_id:
+            if getattr(acting_user, "role", None) == "sc":
+                qs = qs.owned_by(acting_user)
         if owner_type:
             qs = qs.filter(owner_type=owner_type)
         if owner_id:
             qs = qs.filter(owner_id=owner_id)
         if is_public in ("1", "true", "True"):
             qs = qs.filter(is_public=True)
-
-        acting_user = self._resolve_request_user(self.request)
-        if acting_user and getattr(acting_user, "role", None) == "sc":
-            owner_key = self._owner_key_for(acting_user)
-            if owner_type == ScaleRecord.OWNER_SC and not owner_id:
-                qs = qs.filter(owner_id=owner_key)
-            elif not owner_type and not owner_id:
-                qs = qs.filter(
-                    Q(owner_type=ScaleRecord.OWNER_SYSTEM)
-                    | Q(owner_type=ScaleRecord.OWNER_SC, owner_id=owner_key)
-                )
-
         return qs
 
+    def get_serializer_class(self):
+        if self.action == "list":
+            return ScaleRecordReadSerializer
+        return super().get_serializer_class()
+
     def list(self, request, *args, **kwargs):
         no_page = request.query_params.get("nopage") in ("1", "true", "True")
         if request.query_params.get("page_size") == "0":
@@ -133,35 +194,21 @@ class ScaleRecordViewSet(viewsets.ModelViewSet):
     def _resolve_request_user(self, request):
         return resolve_active_user(request)
 
-    def _owner_key_for(self, user):
-        username = getattr(user, "username", None)
-        if username:
-            return username
-        return str(getattr(user, "pk", ""))
-
     def _resolve_record_by_alias(self, alias: str, acting_user):
         normalized = (alias or "").strip().lower()
         if not normalized:
             return None
 
         if normalized == "system_default":
-            return (
-                ScaleRecord.objects.filter(owner_type=ScaleRecord.OWNER_SYSTEM)
-                .order_by("-updated_at")
-                .first()
-            )
+            return ScaleRecord.objects.system().order_by("-updated_at").first()
 
         if (
             normalized in {"sc_personal", "personal", "owner_default"}
             and acting_user
             and getattr(acting_user, "role", None) == "sc"
         ):
-            owner_key = self._owner_key_for(acting_user)
             return (
-                ScaleRecord.objects.filter(
-                    owner_type=ScaleRecord.OWNER_SC,
-                    owner_id=owner_key,
-                )
+                ScaleRecord.objects.owned_by(acting_user)
                 .order_by("-updated_at")
                 .first()
             )
@@ -169,37 +216,80 @@ class ScaleRecordViewSet(viewsets.ModelViewSet):
         return None
 
     def _assert_can_modify_record(self, record: ScaleRecord, user):
-        if not user:
-            return
-        role = getattr(user, "role", None)
-        if role == "admin":
+        if record.is_editable_by(user):
             return
-        if role == "sc":
-            owner_key = self._owner_key_for(user)
-            if record.owner_type == ScaleRecord.OWNER_SYSTEM:
-                raise PermissionDenied("SC users cannot modify the default scale.")
-            if record.owner_type == ScaleRecord.OWNER_SC and record.owner_id != owner_key:
-                raise PermissionDenied("You can only modify your own scale.")
-        else:
+        if getattr(user, "role", None) != "sc":
             raise PermissionDenied("You do not have permission to modify this scale.")
+        if record.owner_type == ScaleRecord.OWNER_SYSTEM:
+            raise PermissionDenied("SC users cannot modify the default scale.")
+        raise PermissionDenied("You can only modify your own scale.")
+
+    def _resolve_sc_owner(self, owner_id, acting_user):
+        """Coordinator owning a new or re-owned SC record."""
+        if getattr(acting_user, "role", None) == "sc":
+            return acting_user
+        lookup = Q(username=owner_id)
+        if owner_id and str(owner_id).isdigit():
+            lookup |= Q(pk=int(owner_id))
+        owner = User.objects.filter(lookup, role="sc").first() if owner_id else None
+        if owner is None:
+            raise ValidationError({"ownerId": "must name an existing coordinator"})
+        return owner
+
+    def _save_with_owner(self, serializer, **kwargs):
+        acting_user = self._resolve_request_user(self.request)
+        owner_type = serializer.validated_data.get(
+            "owner_type", getattr(serializer.instance, "owner_type", None)
+        )
+        if owner_type == ScaleRecord.OWNER_SC:
+            owner_id = serializer.validated_data.get(
+                "owner_id", getattr(serializer.instance, "owner_id", None)
+            )
+            owner = self._resolve_sc_owner(owner_id, acting_user)
+            kwargs.update(owner_user=owner, owner_id=owner.username)
+        else:
+            kwargs["owner_user"] = None
+        try:
+            with transaction.atomic():
+                return serializer.save(**kwargs)
+        except IntegrityError:
+            raise ValidationError(
+                {"name": "This owner already has a scale with this name."}
+            )
 
-    def update(self, request, *args, **kwargs):
-        instance = self.get_object()
-        user = self._resolve_request_user(request)
-        self._assert_can_modify_record(instance, user)
-        return super().update(request, *args, **kwargs)
+    def perform_create(self, serializer):
+        acting_user = self._resolve_request_user(self.request)
+        if getattr(acting_user, "role", None) == "sc" and (
+            serializer.validated_data.get("owner_type") != ScaleRecord.OWNER_SC
+        ):
+            raise PermissionDenied("SC users cannot modify the default scale.")
+        self._save_with_owner(serializer)
 
-    def partial_update(self, request, *args, **kwargs):
-        instance = self.get_object()
-        user = self._resolve_request_user(request)
-        self._assert_can_modify_record(instance, user)
-        return super().partial_update(request, *args, **kwargs)
+    def perform_update(self, serializer):
+        acting_user = self._resolve_request_user(self.request)
+        self._assert_can_modify_record(serializer.instance, acting_user)
+        if getattr(acting_user, "role", None) == "sc":
+            serializer.validated_data.pop("owner_type", None)
+            serializer.validated_data.pop("owner_id", None)
+        self._save_with_owner(serializer)
 
-    def destroy(self, request, *args, **kwargs):
+    def update(self, request, *args, **kwargs):
+        partial = kwargs.pop("partial", False)
         instance = self.get_object()
-        user = self._resolve_request_user(request)
-        self._assert_can_modify_record(instance, user)
-        return super().destroy(request, *args, **kwargs)
+        serializer = self.get_serializer(instance, data=request.data, partial=partial)
+        serializer.is_valid(raise_exception=True)
+        self.perform_update(serializer)
+        # The saved instance may carry stale prefetched versions; reload them
+        # in one pass so the response does not query per version and level.
+        instance._prefetched_objects_cache = {}
+        prefetch_related_objects([instance], "versions__levels__content")
+        return Response(serializer.data)
+
+    def perform_destroy(self, instance):
+        self._assert_can_modify_record(
+            instance, self._resolve_request_user(self.request)
+        )
+        instance.delete()
 
     @action(methods=["get"], detail=False, url_path="sc-view")
     def sc_view(self, request, *args, **kwargs):
@@ -207,25 +297,22 @@ class ScaleRecordViewSet(viewsets.ModelViewSet):
         if not user or getattr(user, "role", None) != "sc":
             raise PermissionDenied("Only SC users can access this view.")
 
-        owner_key = self._owner_key_for(user)
-
         default_qs = (
-            ScaleRecord.objects.filter(owner_type=ScaleRecord.OWNER_SYSTEM)
-            .prefetch_related("versions__levels")
+            ScaleRecord.objects.system()
+            .prefetch_related("versions__levels__content")
             .order_by("-updated_at")
         )
         personal = (
-            ScaleRecord.objects.filter(
-                owner_type=ScaleRecord.OWNER_SC,
-                owner_id=owner_key,
-            )
-            .prefetch_related("versions__levels")
+            ScaleRecord.objects.owned_by(user)
+            .prefetch_related("versions__levels__content")
             .order_by("-updated_at")
             .first()
         )
 
-        default_payload = ScaleRecordSerializer(default_qs, many=True).data
-        personal_payload = ScaleRecordSerializer(personal).data if personal else None
+        default_payload = ScaleRecordReadSerializer(default_qs, many=True).data
+        personal_payload = (
+            ScaleRecordReadSerializer(personal).data if personal else None
+        )
 
         return Response(
             {
@@ -234,6 +321,174 @@ class ScaleRecordViewSet(viewsets.ModelViewSet):
             }
         )
 
+    @action(methods=["get"], detail=False, url_path="search")
+    def search(self, request, *args, **kwargs):
+        query = (request.query_params.get("q") or "").strip()
+        if not query:
+            return Response(
+                {"detail": "q is required"}, status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            limit = int(request.query_params.get("limit", SEARCH_RESULT_LIMIT))
+        except (TypeError, ValueError):
+            limit = SEARCH_RESULT_LIMIT
+        limit = max(1, min(limit, MAX_SEARCH_RESULT_LIMIT))
+
+        latest_version = (
+            ScaleVersion.objects.filter(record=OuterRef("record"))
+            .order_by("-version")
+            .values("version")[:1]
+        )
+        current_versions = ScaleVersion.objects.filter(
+            record__in=self.get_queryset().values("pk"),
+            version=Subquery(latest_version),
+        )
+        current_levels = ScaleLevel.objects.filter(
+            version__in=current_versions.values("pk")
+        )
+        # Level text is shared between versions, so the index lives on the
+        # content rows; the best ``limit`` contents cover the best levels.
+        ranks = dict(
+            full_text_search(
+                ScaleLevelContent.objects.filter(
+                    pk__in=current_levels.values("content")
+                ),
+                query,
+            ).values_list("pk", "search_rank")[:limit]
+        )
+        levels = sorted(
+            current_levels.filter(content__in=list(ranks)).select_related(
+                "version__record", "content"
+            ),
+            key=lambda level: (-ranks[level.content_id], level.position),
+        )[:limit]
+
+        results = []
+        for level in levels:
+            field, snippet = _level_snippet(level, query)
+            record = level.version.record
+            results.append(
+                {
+                    "recordId": str(record.pk),
+                    "recordName": record.name,
+                    "ownerType": record.owner_type,
+                    "ownerId": record.owner_id,
+                    "version": level.version.version,
+                    "levelId": level.level_code,
+                    "label": level.label,
+                    "title": level.title,
+                    "field": _client_field(field),
+                    "snippet": snippet,
+                    "rank": ranks[level.content_id],
+                }
+            )
+        return Response({"query": query, "count": len(results), "results": results})
+
+    def _version_number(self, request, name):
+        value = request.query_params.get(name)
+        try:
+            number = int(value)
+        except (TypeError, ValueError):
+            raise ValidationError({name: "must be a version number"})
+        if number < 1:
+            raise ValidationError({name: "must be a version number"})
+        return number
+
+    def _record_id(self, pk):
+        try:
+            return UUID(str(pk))
+        except ValueError:
+            raise NotFound("ScaleRecord not found")
+
+    def _visible_versions(self, record_id, numbers):
+        return ScaleVersion.objects.filter(
+            record__in=self.get_queryset().values("pk"),
+            record_id=record_id,
+            version__in=numbers,
+        )
+
+    def _immutable_response(self, request, key, etag, render):
+        """
+        Response for a payload derived only from saved versions, which never
+        change. Clients may cache it indefinitely and revalidate with
+        ``If-None-Match``; the body itself is rendered and compressed once
+        and then served from the cache.
+        """
+        etag = quote_etag(etag)
+        # Compressed responses carry a weak tag; both forms match.
+        sent = {
+            tag.removeprefix("W/")
+            for tag in parse_etags(request.headers.get("If-None-Match", ""))
+        }
+        if etag in sent:
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+            response["ETag"] = etag
+        else:
+            response = precompressed_response(request, key, render, etag=etag)
+        patch_cache_control(
+            response, private=True, max_age=IMMUTABLE_MAX_AGE, immutable=True
+        )
+        patch_vary_headers(response, ["Authorization"])
+        return response
+
+    @action(
+        methods=["get"],
+        detail=True,
+        url_path=r"versions/(?P<number>[0-9]+)",
+        url_name="version-detail",
+    )
+    def version_detail(self, request, pk=None, number=None, *args, **kwargs):
+        """One saved version of a record, without the rest of its history."""
+        version = self._visible_versions(self._record_id(pk), [int(number)]).first()
+        if version is None:
+            raise NotFound("Scale version not found")
+
+        def render():
+            prefetch_related_objects([version], "levels__content")
+            return _render_json(ScaleVersionReadSerializer(version).data)
+
+        # Version ids are never reused, so they identify the payload exactly.
+        return self._immutable_response(
+            request, f"scale-version:{version.pk}", str(version.pk), render
+        )
+
+    @action(methods=["get"], detail=True, url_path="diff")
+    def diff(self, request, pk=None, *args, **kwargs):
+        """
+        Level changes between versions ``from`` and ``to`` of one record,
+        matched by level id. Only the two versions are read, and the response
+        is cacheable indefinitely since saved versions never change.
+        """
+        from_number = self._version_number(request, "from")
+        to_number = self._version_number(request, "to")
+        record_id = self._record_id(pk)
+        versions = {
+            version.version: version
+            for version in self._visible_versions(record_id, {from_number, to_number})
+        }
+        if from_number not in versions or to_number not in versions:
+            raise NotFound("Scale version not found")
+        before, after = versions[from_number], versions[to_number]
+
+        def render():
+            levels = {before.pk: [], after.pk: []}
+            for level in ScaleLevel.objects.filter(
+                version__in=[before.pk, after.pk]
+            ).select_related("content"):
+                levels[level.version_id].append(level)
+            diff = diff_levels(levels[before.pk], levels[after.pk])
+            return _render_json(
+                {
+                    "recordId": str(record_id),
+                    "from": from_number,
+                    "to": to_number,
+                    **_diff_payload(diff),
+                }
+            )
+
+        key = f"{before.pk}:{after.pk}"
+        return self._immutable_response(request, f"scale-diff:{key}", key, render)
+
     @action(methods=["post"], detail=False, url_path="save_version")
     def save_version(self, request, *args, **kwargs):
         serializer = SaveScaleVersionRequestSerializer(data=request.data)
@@ -249,72 +504,50 @@ class ScaleRecordViewSet(viewsets.ModelViewSet):
         updated_by = data.get("updatedBy") or getattr(acting_user, "username", "system")
 
         try:
-            record = ScaleRecord.objects.get(pk=record_id)
+            record = ScaleRecord.objects.select_related("owner_user").get(pk=record_id)
         except ScaleRecord.DoesNotExist:
             return Response({"detail": "ScaleRecord not found"}, status=status.HTTP_404_NOT_FOUND)
 
-        record_owner = record.owner_type
-
-        if acting_user and getattr(acting_user, "role", None) == "sc":
-            owner_key = self._owner_key_for(acting_user)
-            if record_owner == ScaleRecord.OWNER_SYSTEM:
-                record, _created = ScaleRecord.objects.get_or_create(
-                    owner_type=ScaleRecord.OWNER_SC,
-                    owner_id=owner_key,
-                    defaults={
-                        "name": record.name,
-                        "is_public": False,
-                    },
-                )
-            elif record_owner == ScaleRecord.OWNER_SC and record.owner_id != owner_key:
+        forks_default = (
+            getattr(acting_user, "role", None) == "sc"
+            and record.owner_type == ScaleRecord.OWNER_SYSTEM
+        )
+        if not forks_default and not record.is_editable_by(acting_user):
+            if getattr(acting_user, "role", None) == "sc":
                 raise PermissionDenied("You can only save versions of your own scale.")
-        elif acting_user and getattr(acting_user, "role", None) != "admin":
             raise PermissionDenied("You do not have permission to modify this scale.")
 
-        owner_user = None
-        if record.owner_type == ScaleRecord.OWNER_SC and record.owner_id:
-            owner_lookup = Q(username=record.owner_id)
-            try:
-                owner_lookup |= Q(pk=int(record.owner_id))
-            except (TypeError, ValueError):
-                pass
-            owner_user = (
-                User.objects.filter(role="sc", status=User.STATUS_ACTIVE)
-                .filter(owner_lookup)
-                .first()
-            )
-
         with transaction.atomic():
-            last = record.versions.order_by("-version").first()
-            next_version_num = (last.version + 1) if last else 1
-
-            version = ScaleVersion.objects.create(
-                record=record,
-                version=next_version_num,
-                updated_by=updated_by,
-                notes=notes,
+            if forks_default:
+                # Saving over the default scale forks it into the SC's own
+                # record. The (owner_user, name) constraint makes concurrent
+                # first saves share one fork instead of creating two.
+                default_record = record
+                record = ScaleRecord.objects.owned_by(acting_user).first()
+                if record is None:
+                    record, _ = ScaleRecord.objects.get_or_create(
+                        owner_user=acting_user,
+                        name=default_record.name,
+                        defaults={
+                            "owner_type": ScaleRecord.OWNER_SC,
+                            "owner_id": acting_user.username,
+                            "is_public": False,
+                        },
+                    )
+                record.owner_user = acting_user  # already loaded; skip the lookup
+            version = create_version(
+                record, levels, updated_by=updated_by, notes=notes
             )
 
-            bulk_levels = []
-            for idx, lv in enumerate(levels):
-                bulk_levels.append(
-                    ScaleLevel(
-                        version=version,
-                        position=idx,
-                        level_code=lv["level_code"],
-                        label=lv["label"],
-                        title=lv.get("title") or None,
-                        description=lv.get("description") or "",
-                        ai_usage=lv.get("aiUsage") or "",
-                        instructions=lv.get("instructions") or None,
-                        acknowledgement=lv.get("acknowledgement") or None,
-                    )
-                )
-            ScaleLevel.objects.bulk_create(bulk_levels)
+        owner_user = None
+        if record.owner_type == ScaleRecord.OWNER_SC and record.owner_user:
+            owner_user = record.owner_user
+        next_version_num = version.version
 
         actor_for_notifications = acting_user or owner_user
         actor_name = user_display_name(actor_for_notifications, default=(updated_by or "system"))
         version_label = f"v{next_version_num}"
+        prefetch_related_objects([record], "versions__levels__content")
         response_payload = ScaleRecordSerializer(record).data
 
         if record.owner_type == ScaleRecord.OWNER_SYSTEM:
@@ -336,68 +569,15 @@ class ScaleRecordViewSet(viewsets.ModelViewSet):
                 related_id=str(record.id),
             )
         elif record.owner_type == ScaleRecord.OWNER_SC:
-            sc_identifiers = set()
-            if record.owner_id:
-                sc_identifiers.add(str(record.owner_id))
-            if owner_user:
-                sc_identifiers.add(str(getattr(owner_user, "pk", "")))
-                username = getattr(owner_user, "username", "")
-                if username:
-                    sc_identifiers.add(username)
-            if acting_user and getattr(acting_user, "role", None) == "sc":
-                sc_identifiers.add(str(getattr(acting_user, "pk", "")))
-                username = getattr(acting_user, "username", "")
-                if username:
-                    sc_identifiers.add(username)
-            sc_identifiers = {value for value in sc_identifiers if value}
-
-            pk_identifiers: set[int] = set()
-            username_identifiers: set[str] = set()
-            for value in sc_identifiers:
-                try:
-                    pk_identifiers.add(int(value))
-                except (TypeError, ValueError):
-                    if value:
-                        username_identifiers.add(value)
-
-            assignment_qs = Assignment.objects.filter(
-                Q(course__coordinator__pk__in=pk_identifiers)
-                | Q(course__coordinator__username__in=username_identifiers)
-            ).prefetch_related("tutors")
-            tutor_candidates = set()
-            for assignment in assignment_qs:
-                for tutor in assignment.tutors.all():
-                    if getattr(tutor, "status", None) == User.STATUS_ACTIVE:
-                        tutor_candidates.add(tutor.pk)
-
             recipients = []
-            if tutor_candidates:
+            if owner_user:
                 recipients.extend(
                     User.objects.filter(
-                        pk__in=tutor_candidates,
                         role="tutor",
                         status=User.STATUS_ACTIVE,
-                    )
-                )
-
-            fallback_tutors = (
-                User.objects.filter(
-                    role="tutor",
-                    status=User.STATUS_ACTIVE,
+                        assignments__course__coordinator=owner_user,
+                    ).distinct()
                 )
-                .filter(
-                    Q(assignments__course__coordinator__pk__in=pk_identifiers)
-                    | Q(assignments__course__coordinator__username__in=username_identifiers)
-                )
-                .distinct()
-            )
-            existing_ids = {getattr(user, "pk", None) for user in recipients}
-            for tutor in fallback_tutors:
-                pk = getattr(tutor, "pk", None)
-                if pk is None or pk in existing_ids:
-                    continue
-                recipients.append(tutor)
-                existing_ids.add(pk)
 
             if owner_user and getattr(owner_user, "status", None) == User.STATUS_ACTIVE:
                 recipients.append(owner_user)
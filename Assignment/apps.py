@@ -2,6 +2,16 @@ from django.apps import AppConfig
 
 
 class AssignmentConfig(AppConfig):
-    default_auto_field = 'django.db.models.BigAutoField'
-    name = 'Assignment'
-    label = 'assignment'
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "Assignment"
+    label = "assignment"
+
+    def ready(self):
+        from common.search import register_search_index
+
+        # Token matching cannot find "say" in "essay"; keep icontains on names.
+        register_search_index(
+            self.get_model("Assignment"),
+            ("name", "description"),
+            substring_fields=("name",),
+        )
@@ -0,0 +1,22 @@
+# Generated by Django 5.0.6 on 2026-10-19 14:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assignment", "0001_initial"),
+        ("courses", "0004_coordinator_foreign_key"),
+        ("usersystem", "0009_passwordresettoken"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="assignment",
+            index=models.Index(
+                fields=["course", "ai_declaration_status"],
+                name="assignment__course__8384ad_idx",
+            ),
+        ),
+    ]
@@ -40,6 +40,9 @@ class Assignment(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['course', 'ai_declaration_status']),
+        ]
 
     def __str__(self):
         course_code = getattr(self.course, 'code', 'Unknown course')
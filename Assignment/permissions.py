@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+from usersystem.models import User
+from usersystem.permissions import resolve_active_user
+
+from .models import Assignment
+
+_CACHE_ATTR = "_assignment_permissions"
+
+
+class AssignmentPermissionContext:
+    """
+    Which assignments ``user`` may edit. Admins may edit every assignment,
+    coordinators the assignments of courses they coordinate, and tutors the
+    assignments they are attached to. The ids are loaded with a single query
+    the first time they are needed, so each check after that is a set lookup.
+    Coordinator checks on an assignment whose course is loaded compare the
+    coordinator id directly.
+    """
+
+    def __init__(self, user: User | None, editable_ids: Iterable[int] | None = None):
+        self.user = user
+        self.role = getattr(user, "role", None)
+        self.active = getattr(user, "status", None) == User.STATUS_ACTIVE
+        self._editable_ids = (
+            frozenset(editable_ids) if editable_ids is not None else None
+        )
+
+    @classmethod
+    def for_request(cls, request) -> "AssignmentPermissionContext":
+        context = getattr(request, _CACHE_ATTR, None)
+        if context is None:
+            context = cls(resolve_active_user(request))
+            setattr(request, _CACHE_ATTR, context)
+        return context
+
+    @classmethod
+    def scoped_to(
+        cls, user: User, assignment: Assignment, active_tutor_ids: Iterable[int]
+    ) -> "AssignmentPermissionContext":
+        """
+        Context for ``user`` that only knows about ``assignment``, built from
+        its loaded course and active tutor ids without touching the database.
+        """
+        role = getattr(user, "role", None)
+        course = getattr(assignment, "course", None)
+        if role == "sc":
+            editable = course is not None and course.coordinator_id == user.pk
+        elif role == "tutor":
+            editable = user.pk in set(active_tutor_ids)
+        else:
+            editable = False
+        return cls(user, editable_ids=[assignment.pk] if editable else [])
+
+    @property
+    def editable_ids(self) -> frozenset[int]:
+        if self._editable_ids is None:
+            self._editable_ids = frozenset(self._load_editable_ids())
+        return self._editable_ids
+
+    def _load_editable_ids(self) -> Iterable[int]:
+        if not self.active:
+            return ()
+        if self.role == "sc":
+            queryset = Assignment.objects.filter(course__coordinator=self.user)
+        elif self.role == "tutor":
+            queryset = Assignment.objects.filter(tutors=self.user)
+        else:
+            return ()
+        return queryset.values_list("pk", flat=True)
+
+    def can_edit(self, assignment: Assignment) -> bool:
+        if not self.active:
+            return False
+        if self.role == "admin":
+            return True
+        if self.role == "sc" and Assignment.course.is_cached(assignment):
+            # The loaded course already answers it; no need for the id set.
+            course = assignment.course
+            return course is not None and course.coordinator_id == self.user.pk
+        if self.role not in {"sc", "tutor"}:
+            return False
+        return assignment.pk in self.editable_ids
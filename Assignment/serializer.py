@@ -2,6 +2,7 @@ from datetime import datetime
 
 from rest_framework import serializers
 
+from common.serializers import BulkPrimaryKeyRelatedField, ReadSerializer
 from courses.models import Course
 from usersystem.models import User
 from .models import Assignment
@@ -20,7 +21,7 @@ class AssignmentSerializer(serializers.ModelSerializer):
     name = serializers.CharField()
     type = serializers.CharField()
     description = serializers.CharField(allow_blank=True, required=False)
-    tutorIds = serializers.PrimaryKeyRelatedField(
+    tutorIds = BulkPrimaryKeyRelatedField(
         queryset=User.objects.filter(role='tutor'),
         source='tutors',
         many=True,
@@ -130,3 +131,33 @@ class AssignmentSerializer(serializers.ModelSerializer):
         if tutors is not None:
             assignment.tutors.set(tutors)
         return assignment
+
+
+class AssignmentReadSerializer(ReadSerializer):
+    """
+    Read-only twin of ``AssignmentSerializer`` for list responses. Produces
+    the same output by reading attributes directly instead of running each
+    declared field. Expects ``course`` selected and ``tutors`` prefetched.
+    """
+
+    def to_representation(self, instance):
+        course = instance.course
+        return {
+            'id': instance.pk,
+            'courseId': (
+                str(instance.course_id) if instance.course_id is not None else None
+            ),
+            'courseName': course.course_name if course else '',
+            'courseCode': course.code if course else '',
+            'courseTerm': course.semester if course else '',
+            'name': instance.name,
+            'type': instance.type,
+            'description': instance.description,
+            'tutorIds': [str(tutor.pk) for tutor in self.related(instance, 'tutors')],
+            'dueDate': self.datetime(instance.due_date),
+            'hasTemplate': instance.has_template,
+            'templateUpdatedAt': self.datetime(instance.template_updated_at),
+            'aiDeclarationStatus': instance.ai_declaration_status,
+            'createdAt': self.datetime(instance.created_at),
+            'updatedAt': self.datetime(instance.updated_at),
+        }
@@ -1,4 +1,3 @@
-from django.db.models import Q
 from django.utils import timezone
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
@@ -6,13 +5,15 @@ from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 
 from common.responses import error_response
+from common.search import full_text_search
 from usersystem.models import User
 from usersystem.permissions import ActiveUserPermission, RolePermission, resolve_active_user
 from notifications.services import send_notifications
 from notifications.utils import user_display_name
 from template.serializers import AssignmentTemplateSerializer
 from .models import Assignment
-from .serializer import AssignmentSerializer
+from .permissions import AssignmentPermissionContext
+from .serializer import AssignmentReadSerializer, AssignmentSerializer
 
 
 class DefaultPagination(PageNumberPagination):
@@ -37,7 +38,7 @@ class AssignmentViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         queryset = (
-            Assignment.objects.select_related("course")
+            Assignment.objects.select_related("course__coordinator")
             .prefetch_related("tutors")
             .order_by("-created_at")
         )
@@ -53,9 +54,7 @@ class AssignmentViewSet(viewsets.ModelViewSet):
         if course_id:
             queryset = queryset.filter(course_id=course_id)
         if keyword:
-            queryset = queryset.filter(
-                Q(name__icontains=keyword) | Q(description__icontains=keyword)
-            )
+            queryset = full_text_search(queryset, keyword)
         if assignment_type:
             queryset = queryset.filter(type__iexact=assignment_type)
         if status_param:
@@ -76,16 +75,20 @@ class AssignmentViewSet(viewsets.ModelViewSet):
 
         return queryset.distinct()
 
+    def get_serializer_class(self):
+        if self.action == "list":
+            return AssignmentReadSerializer
+        return super().get_serializer_class()
+
     def list(self, request, *args, **kwargs):
         queryset = self.filter_queryset(self.get_queryset())
-        request_user = self._resolve_request_user(request)
-        if request_user and getattr(request_user, "role", None) == "sc":
-            queryset = list(queryset)
+        permissions = self._permissions()
+        if permissions.role == "sc":
             queryset = [
                 assignment
                 for assignment in queryset
                 if assignment.ai_declaration_status != Assignment.STATUS_PUBLISHED
-                or self._can_user_edit_assignment(request_user, assignment)
+                or permissions.can_edit(assignment)
             ]
         page = self.paginate_queryset(queryset)
         if page is not None:
@@ -98,6 +101,9 @@ class AssignmentViewSet(viewsets.ModelViewSet):
     def _resolve_request_user(self, request):
         return resolve_active_user(request)
 
+    def _permissions(self):
+        return AssignmentPermissionContext.for_request(self.request)
+
     def _resolve_assignment_coordinator(self, assignment):
         course = getattr(assignment, "course", None)
         if not course:
@@ -107,42 +113,14 @@ class AssignmentViewSet(viewsets.ModelViewSet):
             return coordinator
         return None
 
-    def _coordinator_identifiers(self, assignment):
-        course = getattr(assignment, "course", None)
-        if not course:
-            return set()
-        coordinator = self._resolve_assignment_coordinator(assignment)
-        if not coordinator:
-            return set()
-        identifiers = {str(coordinator.pk)}
-        username = getattr(coordinator, "username", "")
-        if username:
-            identifiers.add(username)
-        return identifiers
-
-    def _can_user_edit_assignment(self, user, assignment):
-        if not user:
-            return False
-        if getattr(user, "status", None) != User.STATUS_ACTIVE:
-            return False
-        role = getattr(user, "role", None)
-        if role == "admin":
-            return True
-        if role == "sc":
-            identifiers = self._coordinator_identifiers(assignment)
-            if not identifiers:
-                return False
-            return str(user.pk) in identifiers or getattr(user, "username", "") in identifiers
-        if role == "tutor":
-            return assignment.tutors.filter(pk=user.pk, status=User.STATUS_ACTIVE).exists()
-        return False
-
     def _gather_template_recipients(self, assignment, actor=None):
         # Build a unique set of active users who should be notified about template changes.
         recipients = []
         seen_ids = set()
         tutors = list(assignment.tutors.filter(status=User.STATUS_ACTIVE))
+        tutor_ids = {tutor.pk for tutor in tutors}
         coordinator = self._resolve_assignment_coordinator(assignment)
+        acting = self._permissions()
 
         candidates = tutors[:]
         if coordinator:
@@ -156,7 +134,13 @@ class AssignmentViewSet(viewsets.ModelViewSet):
             pk = getattr(user, "pk", None)
             if pk is not None and pk in seen_ids:
                 continue
-            if not self._can_user_edit_assignment(user, assignment):
+            if pk is not None and pk == getattr(acting.user, "pk", None):
+                permissions = acting
+            else:
+                permissions = AssignmentPermissionContext.scoped_to(
+                    user, assignment, tutor_ids
+                )
+            if not permissions.can_edit(assignment):
                 continue
             if pk is not None:
                 seen_ids.add(pk)
@@ -284,8 +268,7 @@ class AssignmentViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=["get"], url_path="template", url_name="template")
     def retrieve_template(self, request, pk=None):
         assignment = self.get_object()
-        acting_user = self._resolve_request_user(request)
-        if not self._can_user_edit_assignment(acting_user, assignment):
+        if not self._permissions().can_edit(assignment):
             return error_response(
                 "You do not have permission to view this template.",
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -313,7 +296,7 @@ class AssignmentViewSet(viewsets.ModelViewSet):
                 status_code=status.HTTP_401_UNAUTHORIZED,
             )
 
-        if not self._can_user_edit_assignment(acting_user, assignment):
+        if not self._permissions().can_edit(assignment):
             return error_response(
                 "You do not have permission to modify this template.",
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -394,7 +377,7 @@ class AssignmentViewSet(viewsets.ModelViewSet):
                 "Template not found.", status_code=status.HTTP_404_NOT_FOUND
             )
 
-        if not self._can_user_edit_assignment(acting_user, assignment):
+        if not self._permissions().can_edit(assignment):
             return error_response(
                 "You do not have permission to publish this template.",
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -446,8 +429,7 @@ class AssignmentViewSet(viewsets.ModelViewSet):
                 "Template not found.", status_code=status.HTTP_404_NOT_FOUND
             )
 
-        acting_user = self._resolve_request_user(request)
-        if not self._can_user_edit_assignment(acting_user, assignment):
+        if not self._permissions().can_edit(assignment):
             return error_response(
                 "You do not have permission to unpublish this template.",
                 status_code=status.HTTP_403_FORBIDDEN,
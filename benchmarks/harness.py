@@ -0,0 +1,285 @@
+"""
+Scenario runner for ``run_bench``. Each scenario is one API call made through
+the Django test client as a seeded user. It is measured for latency, SQL
+queries per request and peak Python memory.
+"""
+
+from __future__ import annotations
+
+import random
+import subprocess
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from django.conf import settings
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from AIUseScale.models import ScaleRecord
+from Assignment.models import Assignment
+from usersystem.models import User
+
+from .seeding import BENCH_PREFIX, bench_token, template_rows
+from .utils import summarize_ms
+
+
+@dataclass
+class Scenario:
+    name: str
+    method: str
+    path: str
+    # None sends the request without credentials.
+    user: User | None
+    payload: Callable[[], Any] | None = None
+    expected_status: tuple[int, ...] = (200,)
+    writes: bool = False
+    # Untimed calls first; 0 for actions that cannot be repeated (deletes).
+    warmup: int = 1
+
+
+@dataclass
+class BenchContext:
+    admin: User
+    coordinator: User
+    tutor: User
+    sc_assignment: Assignment
+    system_record: ScaleRecord
+    extra: dict[str, Any] = field(default_factory=dict)
+
+
+class BenchDataMissing(RuntimeError):
+    pass
+
+
+def load_context() -> BenchContext:
+    prefix = f"{BENCH_PREFIX}-"
+    admin = User.objects.filter(username__startswith=f"{prefix}admin-").first()
+    coordinator = (
+        User.objects.filter(
+            username__startswith=f"{prefix}sc-", coordinated_courses__isnull=False
+        )
+        .distinct()
+        .order_by("username")
+        .first()
+    )
+    tutor = (
+        User.objects.filter(
+            username__startswith=f"{prefix}tutor-", assignments__isnull=False
+        )
+        .distinct()
+        .order_by("username")
+        .first()
+    )
+    system_record = ScaleRecord.objects.filter(
+        name__startswith=BENCH_PREFIX, owner_type=ScaleRecord.OWNER_SYSTEM
+    ).first()
+    if not all([admin, coordinator, tutor, system_record]):
+        raise BenchDataMissing("No benchmark data found; run `manage.py seed_bench`.")
+    sc_assignment = (
+        Assignment.objects.filter(course__coordinator=coordinator)
+        .order_by("pk")
+        .first()
+    )
+    return BenchContext(
+        admin=admin,
+        coordinator=coordinator,
+        tutor=tutor,
+        sc_assignment=sc_assignment,
+        system_record=system_record,
+    )
+
+
+def default_scenarios(context: BenchContext) -> list[Scenario]:
+    rng = random.Random(7)
+    latest = context.system_record.versions.order_by("-version").first()
+    levels = [
+        {
+            "id": level.level_code,
+            "label": level.label,
+            "title": level.title,
+            "description": level.description,
+            "aiUsage": level.ai_usage,
+            "instructions": level.instructions,
+            "acknowledgement": level.acknowledgement,
+        }
+        for level in latest.levels.select_related("content")
+    ]
+    table = {
+        "title": "Bench export",
+        "data": {
+            column: [f"{column} {row}" for row in range(200)]
+            for column in ("index", "course", "assignment", "level", "tutor", "status")
+        },
+    }
+    return [
+        Scenario("scale_records.list", "get", "/scale-records/", context.admin),
+        Scenario(
+            "scale_records.list.nopage",
+            "get",
+            "/scale-records/?nopage=1",
+            context.admin,
+        ),
+        Scenario(
+            "scale_records.sc_view",
+            "get",
+            "/scale-records/sc-view/",
+            context.coordinator,
+        ),
+        Scenario(
+            "assignments.list.admin",
+            "get",
+            "/assignments?page_size=50",
+            context.admin,
+        ),
+        Scenario(
+            "assignments.list.sc",
+            "get",
+            "/assignments?page_size=50",
+            context.coordinator,
+        ),
+        Scenario(
+            "assignments.list.tutor",
+            "get",
+            "/assignments?page_size=50",
+            context.tutor,
+        ),
+        Scenario("courses.summary", "get", "/courses/summary/", context.coordinator),
+        Scenario("notifications.list", "get", "/notifications/", context.tutor),
+        Scenario("dashboard.bootstrap", "get", "/bootstrap/", context.coordinator),
+        Scenario(
+            "scale_records.save_version",
+            "post",
+            "/scale-records/save_version/",
+            context.admin,
+            payload=lambda: {
+                "scaleId": str(context.system_record.pk),
+                "notes": "bench",
+                "levels": levels,
+            },
+            expected_status=(200, 201),
+            writes=True,
+        ),
+        Scenario(
+            "assignments.save_template",
+            "post",
+            f"/assignments/{context.sc_assignment.pk}/template",
+            context.coordinator,
+            payload=lambda: {"rows": template_rows(rng, 6), "publish": True},
+            expected_status=(200, 201),
+            writes=True,
+        ),
+        Scenario(
+            "exports.excel",
+            "post",
+            "/export/excel/",
+            context.coordinator,
+            payload=lambda: table,
+        ),
+        Scenario(
+            "exports.pdf",
+            "post",
+            "/export/pdf/",
+            context.coordinator,
+            payload=lambda: table,
+        ),
+    ]
+
+
+def prepare(scenario: Scenario) -> dict[str, Any]:
+    """
+    Client keyword arguments for one call. Payload factories may touch the
+    database, so this runs before any query counting starts.
+    """
+    kwargs: dict[str, Any] = {}
+    if scenario.user is not None:
+        token = bench_token(scenario.user.username)
+        kwargs["HTTP_AUTHORIZATION"] = f"Bearer {token}"
+    if scenario.payload is not None:
+        kwargs["data"] = scenario.payload()
+        kwargs["content_type"] = "application/json"
+    return kwargs
+
+
+def send(client: Client, scenario: Scenario, kwargs: dict[str, Any]):
+    response = getattr(client, scenario.method)(scenario.path, **kwargs)
+    if response.status_code not in scenario.expected_status:
+        raise RuntimeError(
+            f"{scenario.name}: expected {scenario.expected_status}, "
+            f"got {response.status_code}"
+        )
+    return response
+
+
+def _call(client: Client, scenario: Scenario):
+    return send(client, scenario, prepare(scenario))
+
+
+def warm_up(client: Client, scenario: Scenario) -> None:
+    for _ in range(scenario.warmup):
+        _call(client, scenario)
+
+
+def count_queries(client: Client, scenario: Scenario) -> int:
+    """SQL statements issued by one request after the scenario's warmup calls."""
+    warm_up(client, scenario)
+    kwargs = prepare(scenario)
+    with CaptureQueriesContext(connection) as captured:
+        send(client, scenario, kwargs)
+    return len(captured.captured_queries)
+
+
+def run_scenario(
+    client: Client, scenario: Scenario, *, iterations: int, warmup: int = 1
+) -> dict[str, Any]:
+    for _ in range(warmup):
+        _call(client, scenario)
+
+    samples: list[float] = []
+    queries: list[int] = []
+    size = 0
+    for _ in range(iterations):
+        with CaptureQueriesContext(connection) as captured:
+            started = time.perf_counter()
+            response = _call(client, scenario)
+            samples.append(time.perf_counter() - started)
+        queries.append(len(captured.captured_queries))
+        size = len(response.content)
+
+    # Measured on a separate call: tracing slows every allocation down.
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        _call(client, scenario)
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        **summarize_ms(samples),
+        "iterations": iterations,
+        "queriesPerRequest": round(sum(queries) / len(queries), 2),
+        "queriesMax": max(queries),
+        "peakMemoryKb": round(peak / 1024, 1),
+        "responseBytes": size,
+    }
+
+
+def environment_info() -> dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=settings.BASE_DIR,
+            capture_output=True,
+            text=True,
+            timeout=5,
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = ""
+    return {
+        "commit": commit or None,
+        "database": connection.vendor,
+        "debug": settings.DEBUG,
+    }
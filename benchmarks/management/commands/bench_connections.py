@@ -0,0 +1,118 @@
+import io
+import time
+
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.backends.signals import connection_created
+from django.test.utils import override_settings
+
+from benchmarks.harness import BenchDataMissing, environment_info, load_context
+from benchmarks.seeding import bench_token
+from benchmarks.utils import summarize_ms, write_report
+
+# (CONN_MAX_AGE, CONN_HEALTH_CHECKS) for each mode.
+MODES = {
+    "perRequest": (0, False),
+    "persistent": (None, False),
+    "persistentHealthChecks": (None, True),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Time GET --path (default /api/auth/me/, which only authenticates) "
+        "through the WSGI handler, so connections are closed after each request "
+        "exactly as under a real server. Compares a new connection per request "
+        "with a persistent one, with and without health checks, and counts the "
+        "connections opened."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=200)
+        parser.add_argument("--path", default="/api/auth/me/")
+        parser.add_argument("--output", help="Also write the JSON report here.")
+
+    def handle(self, *args, **options):
+        try:
+            context = load_context()
+        except BenchDataMissing as exc:
+            raise CommandError(str(exc)) from exc
+        if connection.settings_dict.get("OPTIONS", {}).get("pool"):
+            raise CommandError(
+                "DJANGO_DB_POOL is enabled; this benchmark compares persistent "
+                "connections, which Django does not combine with the pool."
+            )
+
+        environ = {
+            "REQUEST_METHOD": "GET",
+            "PATH_INFO": options["path"],
+            "QUERY_STRING": "",
+            "SERVER_NAME": "testserver",
+            "SERVER_PORT": "80",
+            "HTTP_HOST": "testserver",
+            "HTTP_AUTHORIZATION": f"Bearer {bench_token(context.tutor.username)}",
+            "wsgi.url_scheme": "http",
+        }
+        requests = max(1, options["requests"])
+        handler = WSGIHandler()
+        configured = {
+            key: connection.settings_dict[key]
+            for key in ("CONN_MAX_AGE", "CONN_HEALTH_CHECKS")
+        }
+        opened = []
+
+        def count_connection(sender, connection, **kwargs):
+            opened.append(connection.alias)
+
+        connection_created.connect(count_connection)
+        results = {}
+        try:
+            with override_settings(
+                ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]
+            ):
+                for name, (max_age, health_checks) in MODES.items():
+                    connection.close()
+                    connection.settings_dict["CONN_MAX_AGE"] = max_age
+                    connection.settings_dict["CONN_HEALTH_CHECKS"] = health_checks
+                    self._request(handler, environ)
+                    opened.clear()
+                    samples = []
+                    for _ in range(requests):
+                        started = time.perf_counter()
+                        self._request(handler, environ)
+                        samples.append(time.perf_counter() - started)
+                    results[name] = {
+                        **summarize_ms(samples),
+                        "connectionsOpened": len(opened),
+                    }
+        finally:
+            connection_created.disconnect(count_connection)
+            connection.close()
+            connection.settings_dict.update(configured)
+
+        saved = results["perRequest"]["p50Ms"] - results["persistent"]["p50Ms"]
+        report = {
+            "environment": environment_info(),
+            "path": options["path"],
+            "requests": requests,
+            "configured": configured,
+            "modes": results,
+            "savedMsPerRequest": round(saved, 3),
+        }
+        write_report(self, report, options["output"])
+
+    def _request(self, handler, environ):
+        status = []
+        response = handler(
+            {**environ, "wsgi.input": io.BytesIO()},
+            lambda code, headers, exc_info=None: status.append(code),
+        )
+        try:
+            b"".join(response)
+        finally:
+            # Fires request_finished, which closes connections that are due.
+            response.close()
+        if not status[0].startswith("200"):
+            raise CommandError(f"{environ['PATH_INFO']} returned {status[0]}")
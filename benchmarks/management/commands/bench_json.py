@@ -0,0 +1,85 @@
+import io
+import json
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from benchmarks.harness import BenchDataMissing, environment_info, load_context
+from benchmarks.seeding import bench_token
+from benchmarks.utils import client_environment, summarize_ms, write_report
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare DRF's JSON renderer and parser with the orjson ones "
+        "(DJANGO_JSON_BACKEND=orjson) on a real API payload, by default the "
+        "admin's /scale-records/?nopage=1 over the seed_bench data. Only "
+        "encoding and decoding are timed, not the request around them."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=50)
+        parser.add_argument("--path", default="/scale-records/?nopage=1")
+        parser.add_argument("--output", help="Also write the JSON report here.")
+
+    def handle(self, *args, **options):
+        try:
+            from common.fastjson import ORJSONParser, ORJSONRenderer
+        except ImportError as exc:
+            raise CommandError(str(exc)) from exc
+        try:
+            context = load_context()
+        except BenchDataMissing as exc:
+            raise CommandError(str(exc)) from exc
+
+        with client_environment():
+            response = Client().get(
+                options["path"],
+                HTTP_AUTHORIZATION=f"Bearer {bench_token(context.admin.username)}",
+            )
+        if response.status_code != 200 or not hasattr(response, "data"):
+            raise CommandError(f"{options['path']} returned {response.status_code}")
+        data = response.data
+
+        codecs = {
+            "stdlib": (JSONRenderer(), JSONParser()),
+            "orjson": (ORJSONRenderer(), ORJSONParser()),
+        }
+        iterations = max(1, options["iterations"])
+        results = {}
+        rendered = {}
+        for name, (renderer, parser) in codecs.items():
+            render_samples, parse_samples = [], []
+            for _ in range(iterations):
+                started = time.perf_counter()
+                body = renderer.render(data, "application/json", {})
+                render_samples.append(time.perf_counter() - started)
+                started = time.perf_counter()
+                parser.parse(io.BytesIO(body), "application/json", {})
+                parse_samples.append(time.perf_counter() - started)
+            rendered[name] = body
+            results[name] = {
+                "render": summarize_ms(render_samples),
+                "parse": summarize_ms(parse_samples),
+                "bytes": len(body),
+            }
+
+        def speedup(step):
+            fast = results["orjson"][step]["p50Ms"]
+            return round(results["stdlib"][step]["p50Ms"] / fast, 2) if fast else None
+
+        report = {
+            "environment": environment_info(),
+            "path": options["path"],
+            "iterations": iterations,
+            "codecs": results,
+            "speedup": {"render": speedup("render"), "parse": speedup("parse")},
+            # Both encoders must produce the same document.
+            "identical": (
+                json.loads(rendered["stdlib"]) == json.loads(rendered["orjson"])
+            ),
+        }
+        write_report(self, report, options["output"])
@@ -0,0 +1,115 @@
+import time
+
+from django.conf import settings
+from django.contrib.auth.hashers import get_hasher, identify_hasher
+from django.core.management.base import BaseCommand
+from django.test import Client
+from django.utils.module_loading import import_string
+
+from benchmarks.utils import client_environment, rolled_back, summarize_ms, write_report
+from usersystem.hashing import hash_pool_stats
+from usersystem.models import User
+
+PASSWORD = "bench-password-1"
+
+
+def _describe(hasher):
+    params = {
+        name: getattr(hasher, name)
+        for name in (
+            "iterations",
+            "time_cost",
+            "memory_cost",
+            "parallelism",
+            "rounds",
+            "work_factor",
+            "block_size",
+        )
+        if hasattr(hasher, name)
+    }
+    return {"hasher": f"{type(hasher).__module__}.{type(hasher).__name__}", **params}
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure password verification throughput (logins/sec/core) for a baseline "
+        "hasher and the configured PASSWORD_HASHERS policy, plus end-to-end logins "
+        "through LoginView. Nothing is written to the database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=20)
+        parser.add_argument("--requests", type=int, default=20)
+        parser.add_argument(
+            "--baseline",
+            default="django.contrib.auth.hashers.PBKDF2PasswordHasher",
+            help="Dotted path of the hasher to compare against.",
+        )
+        parser.add_argument("--output", help="Also write the JSON report here.")
+
+    def handle(self, *args, **options):
+        baseline = import_string(options["baseline"])()
+        current = get_hasher("default")
+        report = {
+            "before": self._measure_hasher(baseline, options["iterations"]),
+            "after": self._measure_hasher(current, options["iterations"]),
+        }
+        report["speedup"] = round(
+            report["after"]["loginsPerSecPerCore"]
+            / max(report["before"]["loginsPerSecPerCore"], 1e-9),
+            2,
+        )
+        report["endToEnd"] = self._measure_login_view(baseline, options["requests"])
+        report["hashPool"] = hash_pool_stats()
+        write_report(self, report, options["output"])
+
+    def _measure_hasher(self, hasher, iterations):
+        encoded = hasher.encode(PASSWORD, hasher.salt())
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        for _ in range(iterations):
+            hasher.verify(PASSWORD, encoded)
+        cpu = time.process_time() - cpu_start
+        wall = time.perf_counter() - wall_start
+        return {
+            **_describe(hasher),
+            "samples": iterations,
+            "cpuMsPerLogin": round(cpu / iterations * 1000, 3),
+            "wallMsPerLogin": round(wall / iterations * 1000, 3),
+            "loginsPerSecPerCore": round(iterations / cpu, 2) if cpu else None,
+        }
+
+    def _measure_login_view(self, baseline, requests):
+        client = Client()
+        samples = []
+        result = {}
+        with client_environment(), rolled_back():
+            user = User.objects.create(
+                username="bench-login-user",
+                role="tutor",
+                password=baseline.encode(PASSWORD, baseline.salt()),
+            )
+            payload = {"username": user.username, "password": PASSWORD}
+            # The first login rehashes the baseline hash with the current policy.
+            client.post("/api/auth/login/", payload, content_type="application/json")
+            user.refresh_from_db()
+            result["upgradedTo"] = identify_hasher(user.password).algorithm
+
+            cpu_start = time.process_time()
+            for _ in range(requests):
+                started = time.perf_counter()
+                response = client.post(
+                    "/api/auth/login/", payload, content_type="application/json"
+                )
+                samples.append(time.perf_counter() - started)
+                if response.status_code != 200:
+                    raise RuntimeError(f"login failed with {response.status_code}")
+            cpu = time.process_time() - cpu_start
+        result.update(summarize_ms(samples))
+        result["requests"] = requests
+        # Hashing runs in the pool's worker processes, so this is only the CPU
+        # spent by the request path itself.
+        result["requestCpuMsPerLogin"] = round(cpu / requests * 1000, 3)
+        result["loginsPerSec"] = round(requests / sum(samples), 2) if samples else None
+        result["passwordHashers"] = list(settings.PASSWORD_HASHERS[:1])
+        return result
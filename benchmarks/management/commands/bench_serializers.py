@@ -0,0 +1,95 @@
+import json
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+
+from AIUseScale.models import ScaleRecord
+from AIUseScale.serializer import ScaleRecordReadSerializer, ScaleRecordSerializer
+from Assignment.models import Assignment
+from Assignment.serializer import AssignmentReadSerializer, AssignmentSerializer
+from benchmarks.harness import environment_info
+from benchmarks.utils import summarize_ms, write_report
+from courses.models import Course
+from courses.serializer import CourseReadSerializer, CourseSerializer
+
+
+def _cases():
+    return {
+        "assignments": (
+            Assignment.objects.select_related("course__coordinator")
+            .prefetch_related("tutors")
+            .order_by("-created_at"),
+            AssignmentSerializer,
+            AssignmentReadSerializer,
+        ),
+        "courses": (
+            Course.objects.select_related("coordinator").order_by("-created_at"),
+            CourseSerializer,
+            CourseReadSerializer,
+        ),
+        "scale_records": (
+            ScaleRecord.objects.prefetch_related("versions__levels__content"),
+            ScaleRecordSerializer,
+            ScaleRecordReadSerializer,
+        ),
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "Check that the read-only list serializers render the same JSON as the "
+        "full serializers, then time both on up to --rows loaded rows "
+        "(queries excluded). Fails if any output differs."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1000)
+        parser.add_argument("--iterations", type=int, default=10)
+        parser.add_argument("--output", help="Also write the JSON report here.")
+
+    def handle(self, *args, **options):
+        rows = max(1, options["rows"])
+        iterations = max(1, options["iterations"])
+        renderer = JSONRenderer()
+        results = {}
+        mismatches = []
+        for name, (queryset, full, fast) in _cases().items():
+            instances = list(queryset[:rows])
+            if not instances:
+                continue
+            # Compared as parsed JSON: the full AssignmentSerializer moves
+            # the course keys to the end for assignments without a course.
+            expected = json.loads(renderer.render(full(instances, many=True).data))
+            actual = json.loads(renderer.render(fast(instances, many=True).data))
+            if expected != actual:
+                mismatches.append(name)
+
+            timings = {}
+            for label, serializer in (("full", full), ("read", fast)):
+                samples = []
+                for _ in range(iterations):
+                    started = time.perf_counter()
+                    serializer(instances, many=True).data
+                    samples.append(time.perf_counter() - started)
+                timings[label] = summarize_ms(samples)
+            read_ms = timings["read"]["p50Ms"]
+            results[name] = {
+                "rows": len(instances),
+                "identical": expected == actual,
+                **timings,
+                "speedup": (
+                    round(timings["full"]["p50Ms"] / read_ms, 2) if read_ms else None
+                ),
+            }
+
+        report = {
+            "environment": environment_info(),
+            "iterations": iterations,
+            "serializers": results,
+        }
+        write_report(self, report, options["output"])
+        if mismatches:
+            raise CommandError(
+                f"Read serializers differ from the full ones: {', '.join(mismatches)}"
+            )
@@ -0,0 +1,198 @@
+import argparse
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError, connection, transaction
+
+from AIUseScale.models import ScaleRecord
+from AIUseScale.services import create_version
+from benchmarks.harness import BenchDataMissing, environment_info, load_context
+from benchmarks.seeding import BENCH_PREFIX
+from benchmarks.utils import summarize_ms, write_report
+from notifications.models import Notification
+
+PROFILES = ("stock", "production")
+
+
+class Command(BaseCommand):
+    help = (
+        "Run --writers processes that each save --transactions scale versions "
+        "(plus a notification per save, like save_version) at the same time, "
+        "once with DJANGO_SQLITE_PROFILE=stock and once with production. Each "
+        "profile writes to its own scratch copy of the SQLite database, so the "
+        "configured database is left untouched."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--writers", type=int, default=8)
+        parser.add_argument("--transactions", type=int, default=50)
+        parser.add_argument("--levels", type=int, default=5)
+        parser.add_argument("--output", help="Also write the JSON report here.")
+        parser.add_argument("--worker", type=int, help=argparse.SUPPRESS)
+
+    def handle(self, *args, **options):
+        if options["worker"] is not None:
+            self._work(options)
+            return
+        if connection.vendor != "sqlite":
+            raise CommandError("bench_sqlite_writers needs a SQLite database.")
+        try:
+            load_context()
+        except BenchDataMissing as exc:
+            raise CommandError(str(exc)) from exc
+
+        writers = max(1, options["writers"])
+        results = {}
+        with tempfile.TemporaryDirectory() as scratch:
+            for profile in PROFILES:
+                path = Path(scratch) / f"{profile}.sqlite3"
+                self._copy_database(path, profile)
+                results[profile] = self._run_profile(path, profile, writers, options)
+
+        stock, production = results["stock"], results["production"]
+        report = {
+            "environment": environment_info(),
+            "writers": writers,
+            "transactionsPerWriter": options["transactions"],
+            "profiles": results,
+            "speedup": (
+                round(production["commitsPerSec"] / stock["commitsPerSec"], 2)
+                if stock["commitsPerSec"]
+                else None
+            ),
+        }
+        write_report(self, report, options["output"])
+
+    def _copy_database(self, path, profile):
+        source = sqlite3.connect(connection.settings_dict["NAME"])
+        target = sqlite3.connect(path)
+        try:
+            source.backup(target)
+            # The journal mode is stored in the file; start each run from the
+            # mode its profile would leave behind.
+            mode = "WAL" if profile == "production" else "DELETE"
+            target.execute(f"PRAGMA journal_mode={mode}")
+        finally:
+            target.close()
+            source.close()
+
+    def _run_profile(self, path, profile, writers, options):
+        env = {
+            **os.environ,
+            "DJANGO_SQLITE_PATH": str(path),
+            "DJANGO_SQLITE_PROFILE": profile,
+            "DJANGO_DEBUG": "false",
+        }
+        command = [
+            sys.executable,
+            str(Path(settings.BASE_DIR) / "manage.py"),
+            "bench_sqlite_writers",
+            f"--transactions={options['transactions']}",
+            f"--levels={options['levels']}",
+        ]
+        workers = [
+            subprocess.Popen(
+                [*command, f"--worker={index}"],
+                env=env,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                text=True,
+            )
+            for index in range(writers)
+        ]
+        # Start every writer at once, after Django has loaded in all of them.
+        for worker in workers:
+            if worker.stdout.readline().strip() != "ready":
+                raise CommandError(f"A {profile} writer failed to start.")
+        for worker in workers:
+            worker.stdin.write("go\n")
+            worker.stdin.flush()
+        reports = []
+        for worker in workers:
+            out, _ = worker.communicate()
+            if worker.returncode:
+                raise CommandError(
+                    f"A {profile} writer exited with {worker.returncode}."
+                )
+            reports.append(json.loads(out))
+
+        committed = sum(report["committed"] for report in reports)
+        errors = {}
+        for report in reports:
+            for name, count in report["errors"].items():
+                errors[name] = errors.get(name, 0) + count
+        elapsed = max(r["finishedAt"] for r in reports) - min(
+            r["startedAt"] for r in reports
+        )
+        return {
+            "committed": committed,
+            "failed": sum(errors.values()),
+            "errors": errors,
+            "elapsedSec": round(elapsed, 3),
+            "commitsPerSec": round(committed / elapsed, 1) if elapsed else None,
+            **summarize_ms([s for r in reports for s in r["samples"]]),
+        }
+
+    def _work(self, options):
+        records = list(
+            ScaleRecord.objects.filter(name__startswith=BENCH_PREFIX).order_by("pk")
+        )
+        if not records:
+            raise CommandError("No benchmark scale records found.")
+        record = records[options["worker"] % len(records)]
+        recipient = load_context().coordinator
+        connection.close()
+
+        self.stdout.write("ready")
+        self.stdout.flush()
+        sys.stdin.readline()
+
+        samples, errors, committed = [], {}, 0
+        started_at = time.time()
+        for number in range(options["transactions"]):
+            levels = [
+                {
+                    "level_code": f"L{position}",
+                    "label": f"Level {position}",
+                    "description": (
+                        f"Writer {options['worker']} save {number} level {position}"
+                    ),
+                }
+                for position in range(options["levels"])
+            ]
+            started = time.perf_counter()
+            try:
+                with transaction.atomic():
+                    version = create_version(record, levels, updated_by="bench")
+                Notification.objects.create(
+                    recipient=recipient,
+                    title="Scale updated",
+                    related_type="scale_record",
+                    related_id=f"{record.pk}:{version.version}",
+                )
+            except DatabaseError as exc:
+                name = type(exc).__name__
+                errors[name] = errors.get(name, 0) + 1
+            else:
+                committed += 1
+                samples.append(time.perf_counter() - started)
+        finished_at = time.time()
+        self.stdout.write(
+            json.dumps(
+                {
+                    "committed": committed,
+                    "errors": errors,
+                    "samples": samples,
+                    "startedAt": started_at,
+                    "finishedAt": finished_at,
+                }
+            )
+        )
@@ -0,0 +1,62 @@
+import logging
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import override_settings
+
+from benchmarks.harness import load_context
+from benchmarks.querycounts import LARGE_SPEC, SMALL_SPEC, evaluate, measure
+from benchmarks.seeding import spec_as_dict
+from benchmarks.utils import client_environment, write_report
+
+SCRATCH_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "check-query-counts",
+    }
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Run every API scenario against a small and a large seeded dataset in a "
+        "throwaway test database and fail when a query count exceeds its budget "
+        "in benchmarks/querycounts.py or grows with the data without a declared "
+        "formula. Intended for CI."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--output", help="Also write the JSON report here.")
+
+    def handle(self, *args, **options):
+        logging.getLogger("common.queries").setLevel(logging.ERROR)
+        old_name = connection.settings_dict["NAME"]
+        connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        try:
+            client = Client()
+            with client_environment(), override_settings(CACHES=SCRATCH_CACHES):
+                small = measure(client, SMALL_SPEC, load_context)
+                large = measure(client, LARGE_SPEC, load_context)
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+        results = evaluate(small, large)
+        failures = {name: r for name, r in results.items() if "error" in r}
+        write_report(
+            self,
+            {
+                "specs": {
+                    "small": spec_as_dict(SMALL_SPEC),
+                    "large": spec_as_dict(LARGE_SPEC),
+                },
+                "scenarios": results,
+            },
+            options["output"],
+        )
+        if failures:
+            lines = [
+                f"{name}: {r['error']} ({r['small']} -> {r['large']} queries)"
+                for name, r in failures.items()
+            ]
+            raise CommandError("Query budgets exceeded:\n" + "\n".join(lines))
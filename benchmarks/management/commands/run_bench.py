@@ -0,0 +1,82 @@
+import logging
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+
+from benchmarks.harness import (
+    BenchDataMissing,
+    default_scenarios,
+    environment_info,
+    load_context,
+    run_scenario,
+)
+from benchmarks.seeding import bench_data_counts
+from benchmarks.utils import client_environment, rolled_back, write_report
+
+
+class Command(BaseCommand):
+    help = (
+        "Drive the main API endpoints through the Django test client against the "
+        "data created by seed_bench and report p50/p95 latency, queries per "
+        "request and peak memory per scenario as JSON. Write scenarios run in a "
+        "transaction that is rolled back, so the dataset is unchanged afterwards "
+        "(on_commit work such as notification inserts is therefore not timed)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=20)
+        parser.add_argument("--warmup", type=int, default=2)
+        parser.add_argument(
+            "--only",
+            nargs="*",
+            help="Scenario names (or prefixes such as 'assignments.') to run.",
+        )
+        parser.add_argument("--list", action="store_true", help="List scenarios.")
+        parser.add_argument("--output", help="Also write the JSON report here.")
+
+    def handle(self, *args, **options):
+        try:
+            context = load_context()
+        except BenchDataMissing as exc:
+            raise CommandError(str(exc)) from exc
+        scenarios = default_scenarios(context)
+        if options["list"]:
+            for scenario in scenarios:
+                self.stdout.write(scenario.name)
+            return
+        if options["only"]:
+            scenarios = [
+                scenario
+                for scenario in scenarios
+                if any(scenario.name.startswith(name) for name in options["only"])
+            ]
+            if not scenarios:
+                raise CommandError("No scenario matches --only.")
+
+        # The per-request query log would drown the progress output; the
+        # numbers it reports are in the JSON report anyway.
+        logging.getLogger("common.queries").setLevel(logging.ERROR)
+        client = Client()
+        results = {}
+        started = time.perf_counter()
+        with client_environment():
+            for scenario in scenarios:
+                with rolled_back():
+                    results[scenario.name] = run_scenario(
+                        client,
+                        scenario,
+                        iterations=max(1, options["iterations"]),
+                        warmup=max(0, options["warmup"]),
+                    )
+                self.stderr.write(
+                    f"{scenario.name}: p50={results[scenario.name]['p50Ms']}ms "
+                    f"queries={results[scenario.name]['queriesPerRequest']}"
+                )
+        report = {
+            "environment": environment_info(),
+            "dataset": bench_data_counts(),
+            "seconds": round(time.perf_counter() - started, 2),
+            "scenarios": results,
+        }
+        write_report(self, report, options["output"])
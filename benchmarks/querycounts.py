@@ -0,0 +1,644 @@
+"""
+Query-count budgets for ``check_query_counts`` and ``tests/test_query_counts.py``.
+Every scenario is run against a small and a large seeded dataset. Its query
+count must stay within the declared budget at both sizes. A budget is constant
+unless it has a formula over the ``SeedSpec``, so a new per-row query makes the
+large run exceed it.
+"""
+
+from __future__ import annotations
+
+import secrets
+from dataclasses import dataclass, replace
+from datetime import timedelta
+from itertools import count
+from typing import Any, Callable
+
+from django.core.cache import cache
+from django.test import Client
+from django.utils import timezone
+
+from AIUseScale.models import AIUserScale, ScaleRecord
+from Assignment.models import Assignment
+from courses.models import Course
+from notifications.models import Notification
+from usersystem.models import PasswordResetToken, User
+from usersystem.views import hash_reset_token
+
+from .harness import BenchContext, Scenario, count_queries, default_scenarios
+from .seeding import BENCH_PASSWORD, BENCH_PREFIX, SeedSpec, seed_bench_data
+from .utils import rolled_back
+
+SMALL_SPEC = SeedSpec(
+    admins=1,
+    coordinators=2,
+    tutors=4,
+    courses_per_coordinator=2,
+    assignments_per_course=2,
+    tutors_per_assignment=1,
+    system_records=1,
+    versions_per_record=2,
+    levels_per_version=3,
+    template_ratio=1.0,
+    template_rows=2,
+    notifications_per_user=2,
+    user_scales_per_coordinator=2,
+)
+LARGE_SPEC = replace(
+    SMALL_SPEC,
+    admins=2,
+    coordinators=4,
+    tutors=12,
+    courses_per_coordinator=3,
+    assignments_per_course=5,
+    tutors_per_assignment=3,
+    system_records=3,
+    versions_per_record=5,
+    levels_per_version=6,
+    notifications_per_user=5,
+    user_scales_per_coordinator=4,
+)
+
+
+@dataclass(frozen=True)
+class QueryBudget:
+    limit: int
+    # Extra queries allowed for a dataset, for work that legitimately grows.
+    growth: Callable[[SeedSpec], int] | None = None
+
+    def allowed(self, spec: SeedSpec) -> int:
+        return self.limit + (self.growth(spec) if self.growth else 0)
+
+
+BUDGETS: dict[str, QueryBudget] = {
+    "auth.register": QueryBudget(3),
+    "auth.login": QueryBudget(3),
+    "auth.logout": QueryBudget(2),
+    "auth.me": QueryBudget(1),
+    "auth.me.update": QueryBudget(2),
+    "auth.change_password": QueryBudget(2),
+    "auth.password_reset": QueryBudget(6),
+    "auth.password_reset_confirm": QueryBudget(6),
+    "users.admin_list": QueryBudget(2),
+    "users.admin_update": QueryBudget(3),
+    "users.admin_status": QueryBudget(3),
+    # One row per tutor in the payload, inserted with a single bulk_create.
+    "users.admin_bulk": QueryBudget(6),
+    "users.auth_throttles": QueryBudget(1),
+    "scale_records.list": QueryBudget(6),
+    "scale_records.list.nopage": QueryBudget(5),
+    # Includes the savepoint that turns a duplicate owner/name into a 400.
+    "scale_records.create": QueryBudget(6),
+    "scale_records.retrieve": QueryBudget(5),
+    "scale_records.update": QueryBudget(11),
+    "scale_records.partial_update": QueryBudget(11),
+    "scale_records.destroy": QueryBudget(9),
+    "scale_records.sc_view": QueryBudget(9),
+    "scale_records.search": QueryBudget(3),
+    # Served from the precompressed cache after the warmup call.
+    "scale_records.diff": QueryBudget(2),
+    "scale_records.version_detail": QueryBudget(2),
+    "scale_records.save_version": QueryBudget(12),
+    "scale_records.save_version.sc": QueryBudget(13),
+    "user_scales.list": QueryBudget(3),
+    "user_scales.create": QueryBudget(4),
+    "user_scales.retrieve": QueryBudget(2),
+    "user_scales.update": QueryBudget(4),
+    "user_scales.partial_update": QueryBudget(4),
+    "user_scales.destroy": QueryBudget(3),
+    "assignments.list.admin": QueryBudget(4),
+    "assignments.list.sc": QueryBudget(3),
+    "assignments.list.tutor": QueryBudget(4),
+    "assignments.create": QueryBudget(8),
+    "assignments.retrieve": QueryBudget(3),
+    "assignments.update": QueryBudget(10),
+    "assignments.partial_update": QueryBudget(7),
+    "assignments.destroy": QueryBudget(6),
+    "assignments.retrieve_template": QueryBudget(4),
+    "assignments.save_template": QueryBudget(8),
+    "assignments.publish_template": QueryBudget(7),
+    "assignments.unpublish_template": QueryBudget(6),
+    "courses.list": QueryBudget(3),
+    "courses.create": QueryBudget(5),
+    "courses.retrieve": QueryBudget(2),
+    "courses.update": QueryBudget(5),
+    "courses.partial_update": QueryBudget(4),
+    "courses.destroy": QueryBudget(7),
+    "courses.declaration_summary": QueryBudget(2),
+    "courses.summary": QueryBudget(2),
+    # One course per coordinator, looked up and written in bulk.
+    "courses.import": QueryBudget(10),
+    "notifications.list": QueryBudget(2),
+    "notifications.read": QueryBudget(2),
+    "notifications.read_all": QueryBudget(2),
+    "dashboard.bootstrap": QueryBudget(10),
+    "dashboard.bootstrap.tutor": QueryBudget(5),
+    "exports.excel": QueryBudget(1),
+    "exports.pdf": QueryBudget(1),
+}
+
+
+def _unique(prefix: str) -> Callable[[], str]:
+    numbers = count(1)
+    return lambda: f"{BENCH_PREFIX}-{prefix}-{next(numbers)}"
+
+
+def query_scenarios(context: BenchContext) -> list[Scenario]:
+    """
+    ``run_bench`` scenarios plus every other API action. Payloads that scale
+    with the seeded data (bulk imports, tutor lists) make per-row queries show
+    up as growth between the small and the large dataset.
+    """
+    admin, coordinator, tutor = context.admin, context.coordinator, context.tutor
+    assignment = (
+        Assignment.objects.filter(course__coordinator=coordinator, has_template=True)
+        .order_by("pk")
+        .first()
+    )
+    courses = list(Course.objects.filter(coordinator=coordinator).order_by("pk"))
+    course, spare_course = courses[0], courses[-1]
+    spare_assignment = (
+        Assignment.objects.filter(course__coordinator=coordinator)
+        .exclude(pk=assignment.pk)
+        .order_by("-pk")
+        .first()
+    )
+    tutors = list(
+        User.objects.filter(
+            username__startswith=f"{BENCH_PREFIX}-tutor-", role="tutor"
+        ).order_by("username")
+    )
+    coordinators = list(
+        User.objects.filter(username__startswith=f"{BENCH_PREFIX}-sc-").order_by(
+            "username"
+        )
+    )
+    own_record = ScaleRecord.objects.owned_by(coordinator).first()
+    user_scale = AIUserScale.objects.filter(username=coordinator.username).first()
+    spare_user_scale = (
+        AIUserScale.objects.filter(username=coordinator.username)
+        .exclude(pk=user_scale.pk)
+        .first()
+    )
+    notification = Notification.objects.filter(recipient=tutor).first()
+    latest = context.system_record.versions.order_by("-version").first()
+    levels = [
+        {"id": level.level_code, "label": level.label, "description": "SC copy"}
+        for level in latest.levels.select_related("content")
+    ]
+
+    record_path = f"/scale-records/{context.system_record.pk}/"
+    assignment_path = f"/assignments/{assignment.pk}"
+    course_path = f"/courses/{course.pk}/"
+    user_scale_path = f"/aiusescale/{user_scale.pk}/"
+    tutor_ids = [tutor.pk for tutor in tutors]
+    username, course_code, scale_name = (
+        _unique("user"),
+        _unique("course"),
+        _unique("scale"),
+    )
+
+    def reset_token():
+        raw = secrets.token_urlsafe(24)
+        PasswordResetToken.objects.create(
+            user=tutor,
+            token_hash=hash_reset_token(raw),
+            expires_at=timezone.now() + timedelta(hours=1),
+        )
+        return {"token": raw, "newPassword": BENCH_PASSWORD}
+
+    def catalogue():
+        # One course per coordinator with every tutor spread over its tasks.
+        return {
+            "courses": [
+                {
+                    "code": course_code().upper(),
+                    "name": "Imported course",
+                    "term": "2030S1",
+                    "coordinator": sc.username,
+                    "assignments": [
+                        {
+                            "name": f"Imported task {index}",
+                            "type": "Essay",
+                            "tutors": [t.username for t in tutors[index::3]],
+                        }
+                        for index in range(3)
+                    ],
+                }
+                for sc in coordinators
+            ]
+        }
+
+    def user_rows():
+        return {
+            "users": [
+                {
+                    "username": username(),
+                    "password": BENCH_PASSWORD,
+                    "role": "tutor",
+                    "email": "bulk@example.com",
+                }
+                for _ in tutors
+            ]
+        }
+
+    return [
+        *default_scenarios(context),
+        # usersystem
+        Scenario(
+            "auth.register",
+            "post",
+            "/api/auth/register/",
+            None,
+            payload=lambda: {
+                "username": username(),
+                "password": BENCH_PASSWORD,
+                "role": "tutor",
+            },
+            expected_status=(201,),
+            writes=True,
+        ),
+        Scenario(
+            "auth.login",
+            "post",
+            "/api/auth/login/",
+            None,
+            payload=lambda: {"username": tutor.username, "password": BENCH_PASSWORD},
+            writes=True,
+        ),
+        Scenario(
+            "auth.logout",
+            "post",
+            "/api/auth/logout/",
+            tutor,
+            payload=lambda: {},
+            writes=True,
+            warmup=0,
+        ),
+        Scenario("auth.me", "get", "/api/auth/me/", tutor),
+        Scenario(
+            "auth.me.update",
+            "put",
+            "/api/users/me/",
+            tutor,
+            payload=lambda: {"bio": "Updated by the query budget check."},
+            writes=True,
+        ),
+        Scenario(
+            "auth.change_password",
+            "post",
+            "/api/users/me/password/",
+            tutor,
+            payload=lambda: {
+                "currentPassword": BENCH_PASSWORD,
+                "newPassword": BENCH_PASSWORD,
+            },
+            writes=True,
+        ),
+        Scenario(
+            "auth.password_reset",
+            "post",
+            "/api/auth/password/reset/",
+            None,
+            payload=lambda: {"email": tutor.email},
+            writes=True,
+        ),
+        Scenario(
+            "auth.password_reset_confirm",
+            "post",
+            "/api/auth/password/reset/confirm/",
+            None,
+            payload=reset_token,
+            writes=True,
+        ),
+        Scenario("users.admin_list", "get", "/api/admin/users/", admin),
+        Scenario(
+            "users.admin_update",
+            "put",
+            f"/api/admin/users/{tutor.pk}/",
+            admin,
+            payload=lambda: {"organization": "Bench"},
+            writes=True,
+        ),
+        Scenario(
+            "users.admin_status",
+            "post",
+            f"/api/admin/users/{tutor.pk}/status/",
+            admin,
+            payload=lambda: {"status": User.STATUS_ACTIVE},
+            writes=True,
+        ),
+        Scenario(
+            "users.admin_bulk",
+            "post",
+            "/api/admin/users/bulk/",
+            admin,
+            payload=user_rows,
+            expected_status=(201,),
+            writes=True,
+        ),
+        Scenario("users.auth_throttles", "get", "/api/admin/auth-throttles/", admin),
+        # scale records and personal scales
+        Scenario(
+            "scale_records.create",
+            "post",
+            "/scale-records/",
+            admin,
+            payload=lambda: {
+                "name": scale_name(),
+                "ownerType": ScaleRecord.OWNER_SYSTEM,
+                "isPublic": True,
+            },
+            expected_status=(201,),
+            writes=True,
+        ),
+        Scenario("scale_records.retrieve", "get", record_path, admin),
+        Scenario(
+            "scale_records.update",
+            "put",
+            record_path,
+            admin,
+            payload=lambda: {
+                "name": context.system_record.name,
+                "ownerType": ScaleRecord.OWNER_SYSTEM,
+                "isPublic": True,
+            },
+            writes=True,
+        ),
+        Scenario(
+            "scale_records.partial_update",
+            "patch",
+            record_path,
+            admin,
+            payload=lambda: {"isPublic": True},
+            writes=True,
+        ),
+        Scenario(
+            "scale_records.destroy",
+            "delete",
+            f"/scale-records/{own_record.pk}/",
+            coordinator,
+            expected_status=(204,),
+            writes=True,
+            warmup=0,
+        ),
+        Scenario(
+            "scale_records.search",
+            "get",
+            "/scale-records/search/?q=review",
+            admin,
+        ),
+        Scenario(
+            "scale_records.diff",
+            "get",
+            f"{record_path}diff/?from=1&to={latest.version}",
+            admin,
+        ),
+        Scenario(
+            "scale_records.version_detail",
+            "get",
+            f"{record_path}versions/1/",
+            admin,
+        ),
+        Scenario(
+            "scale_records.save_version.sc",
+            "post",
+            "/scale-records/save_version/",
+            coordinator,
+            payload=lambda: {
+                "scaleId": str(context.system_record.pk),
+                "levels": levels,
+            },
+            expected_status=(201,),
+            writes=True,
+        ),
+        Scenario("user_scales.list", "get", "/aiusescale/", coordinator),
+        Scenario(
+            "user_scales.create",
+            "post",
+            "/aiusescale/",
+            coordinator,
+            payload=lambda: {
+                "username": coordinator.username,
+                "name": scale_name(),
+                "level": "L1",
+            },
+            expected_status=(201,),
+            writes=True,
+        ),
+        Scenario("user_scales.retrieve", "get", user_scale_path, coordinator),
+        Scenario(
+            "user_scales.update",
+            "put",
+            user_scale_path,
+            coordinator,
+            payload=lambda: {"notes": "Updated by the query budget check."},
+            writes=True,
+        ),
+        Scenario(
+            "user_scales.partial_update",
+            "patch",
+            user_scale_path,
+            coordinator,
+            payload=lambda: {"level": "L2"},
+            writes=True,
+        ),
+        Scenario(
+            "user_scales.destroy",
+            "delete",
+            f"/aiusescale/{spare_user_scale.pk}/",
+            coordinator,
+            expected_status=(204,),
+            writes=True,
+            warmup=0,
+        ),
+        # assignments
+        Scenario(
+            "assignments.create",
+            "post",
+            "/assignments",
+            coordinator,
+            payload=lambda: {
+                "courseId": course.pk,
+                "name": "Created by the query budget check",
+                "type": "Essay",
+                "tutorIds": tutor_ids,
+            },
+            expected_status=(201,),
+            writes=True,
+        ),
+        Scenario("assignments.retrieve", "get", assignment_path, coordinator),
+        Scenario(
+            "assignments.update",
+            "put",
+            assignment_path,
+            coordinator,
+            payload=lambda: {
+                "courseId": course.pk,
+                "name": assignment.name,
+                "type": assignment.type,
+                "tutorIds": tutor_ids,
+            },
+            writes=True,
+        ),
+        Scenario(
+            "assignments.partial_update",
+            "patch",
+            assignment_path,
+            coordinator,
+            payload=lambda: {"description": "Updated by the query budget check."},
+            writes=True,
+        ),
+        Scenario(
+            "assignments.destroy",
+            "delete",
+            f"/assignments/{spare_assignment.pk}",
+            coordinator,
+            writes=True,
+            warmup=0,
+        ),
+        Scenario(
+            "assignments.retrieve_template",
+            "get",
+            f"{assignment_path}/template",
+            coordinator,
+        ),
+        Scenario(
+            "assignments.publish_template",
+            "post",
+            f"{assignment_path}/template/publish",
+            coordinator,
+            payload=lambda: {},
+            writes=True,
+        ),
+        Scenario(
+            "assignments.unpublish_template",
+            "post",
+            f"{assignment_path}/template/unpublish",
+            coordinator,
+            payload=lambda: {},
+            writes=True,
+        ),
+        # courses
+        Scenario("courses.list", "get", "/courses/", admin),
+        Scenario(
+            "courses.create",
+            "post",
+            "/courses/",
+            admin,
+            payload=lambda: {
+                "name": "Created by the query budget check",
+                "code": course_code().upper(),
+                "term": "2030S1",
+                "coordinatorId": coordinator.pk,
+            },
+            expected_status=(201,),
+            writes=True,
+        ),
+        Scenario("courses.retrieve", "get", course_path, coordinator),
+        Scenario(
+            "courses.update",
+            "put",
+            course_path,
+            admin,
+            payload=lambda: {
+                "name": course.course_name,
+                "code": course.code,
+                "term": course.semester,
+                "coordinatorId": coordinator.pk,
+            },
+            writes=True,
+        ),
+        Scenario(
+            "courses.partial_update",
+            "patch",
+            course_path,
+            admin,
+            payload=lambda: {"description": "Updated by the query budget check."},
+            writes=True,
+        ),
+        Scenario(
+            "courses.destroy",
+            "delete",
+            f"/courses/{spare_course.pk}/",
+            admin,
+            writes=True,
+            warmup=0,
+        ),
+        Scenario(
+            "courses.declaration_summary",
+            "get",
+            f"{course_path}declaration-summary/",
+            coordinator,
+        ),
+        Scenario(
+            "courses.import",
+            "post",
+            "/courses/import/",
+            admin,
+            payload=catalogue,
+            expected_status=(201,),
+            writes=True,
+        ),
+        # notifications and dashboard
+        Scenario(
+            "notifications.read",
+            "post",
+            f"/notifications/{notification.pk}/read/",
+            tutor,
+            payload=lambda: {},
+            expected_status=(204,),
+            writes=True,
+        ),
+        Scenario(
+            "notifications.read_all",
+            "post",
+            "/notifications/read-all/",
+            tutor,
+            payload=lambda: {},
+            expected_status=(204,),
+            writes=True,
+        ),
+        Scenario("dashboard.bootstrap.tutor", "get", "/bootstrap/", tutor),
+    ]
+
+
+def measure(
+    client: Client, spec: SeedSpec, load_context: Callable[[], BenchContext]
+) -> dict[str, int]:
+    """
+    Seed ``spec`` in a rolled-back transaction and count each scenario. The
+    default cache is cleared before every scenario, so only call this with a
+    throwaway cache configured.
+    """
+    counts: dict[str, int] = {}
+    with rolled_back():
+        seed_bench_data(spec)
+        for scenario in query_scenarios(load_context()):
+            # Throttle counters and cached payloads must not leak between runs.
+            cache.clear()
+            with rolled_back():
+                counts[scenario.name] = count_queries(client, scenario)
+    return counts
+
+
+def evaluate(small: dict[str, int], large: dict[str, int]) -> dict[str, Any]:
+    results: dict[str, Any] = {}
+    for name in sorted(set(small) | set(large)):
+        budget = BUDGETS.get(name)
+        entry: dict[str, Any] = {"small": small.get(name), "large": large.get(name)}
+        if budget is None:
+            entry["error"] = "no query budget declared"
+        else:
+            entry["allowedSmall"] = budget.allowed(SMALL_SPEC)
+            entry["allowedLarge"] = budget.allowed(LARGE_SPEC)
+            growth = entry["allowedLarge"] - entry["allowedSmall"]
+            if entry["small"] > entry["allowedSmall"]:
+                entry["error"] = "over budget on the small dataset"
+            elif (
+                entry["large"] > entry["allowedLarge"]
+                or entry["large"] - entry["small"] > growth
+            ):
+                entry["error"] = "grows with the dataset beyond its budget"
+        results[name] = entry
+    return results
@@ -0,0 +1,296 @@
+"""
+Deterministic bulk data for benchmarks. Everything created here is tagged with
+``BENCH_PREFIX`` (usernames, course codes, scale record names) so it can be
+found again by the harness and removed with ``clear_bench_data``.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import asdict, dataclass
+
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+
+from AIUseScale.models import (
+    AIUserScale,
+    ScaleLevel,
+    ScaleLevelContent,
+    ScaleRecord,
+    ScaleVersion,
+)
+from AIUseScale.services import build_levels, intern_level_contents
+from Assignment.models import Assignment
+from courses.models import Course
+from notifications.models import Notification
+from template.models import AssignmentTemplate
+from usersystem.models import User
+
+BENCH_PREFIX = "bench"
+BENCH_PASSWORD = "bench-password-1"
+ASSIGNMENT_TYPES = ("Essay", "Lab", "Quiz", "Project", "Reflection")
+WORDS = (
+    "analysis brainstorm citation critique dataset debugging drafting editing "
+    "feedback ideation outline paraphrase prototype refactor research review "
+    "summary testing translation visualisation"
+).split()
+
+
+@dataclass
+class SeedSpec:
+    admins: int = 2
+    coordinators: int = 20
+    tutors: int = 200
+    courses_per_coordinator: int = 5
+    assignments_per_course: int = 8
+    tutors_per_assignment: int = 3
+    system_records: int = 2
+    versions_per_record: int = 10
+    levels_per_version: int = 6
+    template_ratio: float = 0.5
+    template_rows: int = 6
+    notifications_per_user: int = 20
+    user_scales_per_coordinator: int = 3
+    seed: int = 1
+
+
+def bench_token(username: str) -> str:
+    return f"{username}-token"
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def _users(role: str, count: int, password: str) -> list[User]:
+    users = []
+    for index in range(count):
+        username = f"{BENCH_PREFIX}-{role}-{index:04d}"
+        users.append(
+            User(
+                username=username,
+                password=password,
+                role=role,
+                name=f"Bench {role.upper()} {index}",
+                email=f"{username}@example.com",
+                auth_token=bench_token(username),
+            )
+        )
+    User.objects.bulk_create(users, batch_size=500)
+    # Re-read so primary keys are set on backends that do not return them.
+    return list(
+        User.objects.filter(username__startswith=f"{BENCH_PREFIX}-{role}-").order_by(
+            "username"
+        )
+    )
+
+
+def _levels(rng: random.Random, count: int) -> list[dict]:
+    return [
+        {
+            "level_code": f"L{position}",
+            "label": f"Level {position}",
+            "title": _sentence(rng, 3),
+            "description": _sentence(rng, 25),
+            "ai_usage": _sentence(rng, 20),
+            "instructions": _sentence(rng, 15),
+            "acknowledgement": _sentence(rng, 8),
+        }
+        for position in range(count)
+    ]
+
+
+def _scale_record(rng, spec, *, name, owner_type, owner=None, is_public=False):
+    owner_id = owner.username if owner else None
+    record = ScaleRecord.objects.create(
+        name=name,
+        owner_type=owner_type,
+        owner_id=owner_id,
+        owner_user=owner,
+        is_public=is_public,
+    )
+    versions = ScaleVersion.objects.bulk_create(
+        [
+            ScaleVersion(
+                record=record,
+                version=number,
+                updated_by=owner_id or "system",
+                notes=_sentence(rng, 6),
+            )
+            for number in range(1, spec.versions_per_record + 1)
+        ]
+    )
+    levels = []
+    for version in versions:
+        values = _levels(rng, spec.levels_per_version)
+        levels.extend(build_levels(version, values, intern_level_contents(values)))
+    ScaleLevel.objects.bulk_create(levels, batch_size=1000)
+    return record
+
+
+def template_rows(rng: random.Random, count: int) -> list[dict]:
+    return [
+        {
+            "task": _sentence(rng, 4),
+            "level": f"L{rng.randrange(6)}",
+            "instructions": _sentence(rng, 12),
+            "acknowledgement": _sentence(rng, 6),
+        }
+        for _ in range(count)
+    ]
+
+
+@transaction.atomic
+def seed_bench_data(spec: SeedSpec) -> dict[str, int]:
+    rng = random.Random(spec.seed)
+    # One hash shared by every seeded user keeps seeding fast with a real hasher.
+    password = make_password(BENCH_PASSWORD)
+
+    _users("admin", spec.admins, password)
+    coordinators = _users("sc", spec.coordinators, password)
+    tutors = _users("tutor", spec.tutors, password)
+
+    courses = []
+    for coordinator in coordinators:
+        for index in range(spec.courses_per_coordinator):
+            courses.append(
+                Course(
+                    course_name=f"{_sentence(rng, 2)[:-1]} {index}",
+                    code=f"{BENCH_PREFIX.upper()}{len(courses):05d}",
+                    semester=f"{2024 + index % 3}S{index % 2 + 1}",
+                    description=_sentence(rng, 12)[:160],
+                    coordinator=coordinator,
+                )
+            )
+    Course.objects.bulk_create(courses, batch_size=500)
+    courses = list(
+        Course.objects.filter(code__startswith=BENCH_PREFIX.upper()).order_by("code")
+    )
+
+    assignments = []
+    for course in courses:
+        for index in range(spec.assignments_per_course):
+            assignments.append(
+                Assignment(
+                    course=course,
+                    name=f"Task {index + 1}: {_sentence(rng, 3)}",
+                    type=rng.choice(ASSIGNMENT_TYPES),
+                    description=_sentence(rng, 30),
+                    ai_declaration_status=rng.choice(
+                        [choice for choice, _label in Assignment.STATUS_CHOICES]
+                    ),
+                )
+            )
+    Assignment.objects.bulk_create(assignments, batch_size=500)
+    assignments = list(Assignment.objects.filter(course__in=courses).order_by("pk"))
+
+    through = Assignment.tutors.through
+    links = []
+    for assignment in assignments:
+        for tutor in rng.sample(tutors, min(spec.tutors_per_assignment, len(tutors))):
+            links.append(through(assignment_id=assignment.pk, user_id=tutor.pk))
+    through.objects.bulk_create(links, batch_size=1000, ignore_conflicts=True)
+
+    templates = [
+        AssignmentTemplate(
+            assignment=assignment,
+            rows=template_rows(rng, spec.template_rows),
+            is_published=assignment.ai_declaration_status
+            == Assignment.STATUS_PUBLISHED,
+            updated_by=BENCH_PREFIX,
+        )
+        for assignment in assignments
+        if rng.random() < spec.template_ratio
+    ]
+    AssignmentTemplate.objects.bulk_create(templates, batch_size=500)
+    Assignment.objects.filter(
+        pk__in=[template.assignment_id for template in templates]
+    ).update(has_template=True)
+
+    for index in range(spec.system_records):
+        _scale_record(
+            rng,
+            spec,
+            name=f"{BENCH_PREFIX} system scale {index}",
+            owner_type=ScaleRecord.OWNER_SYSTEM,
+            is_public=True,
+        )
+    for coordinator in coordinators:
+        _scale_record(
+            rng,
+            spec,
+            name=f"{BENCH_PREFIX} scale for {coordinator.username}",
+            owner_type=ScaleRecord.OWNER_SC,
+            owner=coordinator,
+        )
+
+    AIUserScale.objects.bulk_create(
+        [
+            AIUserScale(
+                username=coordinator.username,
+                name=f"{BENCH_PREFIX} preference {index}",
+                level=f"L{rng.randrange(spec.levels_per_version)}",
+                notes=_sentence(rng, 8),
+            )
+            for coordinator in coordinators
+            for index in range(spec.user_scales_per_coordinator)
+        ],
+        batch_size=500,
+    )
+
+    notifications = []
+    for user in [*coordinators, *tutors]:
+        for index in range(spec.notifications_per_user):
+            notifications.append(
+                Notification(
+                    recipient=user,
+                    title=f"Bench notification {index}",
+                    content=_sentence(rng, 10),
+                    related_type="assignment",
+                    related_id=str(rng.choice(assignments).pk) if assignments else "",
+                    is_read=rng.random() < 0.6,
+                )
+            )
+    Notification.objects.bulk_create(notifications, batch_size=1000)
+
+    return bench_data_counts()
+
+
+def bench_data_counts() -> dict[str, int]:
+    prefix = f"{BENCH_PREFIX}-"
+    return {
+        "users": User.objects.filter(username__startswith=prefix).count(),
+        "courses": Course.objects.filter(code__startswith=BENCH_PREFIX.upper()).count(),
+        "assignments": Assignment.objects.filter(
+            course__code__startswith=BENCH_PREFIX.upper()
+        ).count(),
+        "templates": AssignmentTemplate.objects.filter(
+            assignment__course__code__startswith=BENCH_PREFIX.upper()
+        ).count(),
+        "scaleRecords": ScaleRecord.objects.filter(
+            name__startswith=BENCH_PREFIX
+        ).count(),
+        "scaleVersions": ScaleVersion.objects.filter(
+            record__name__startswith=BENCH_PREFIX
+        ).count(),
+        "scaleLevels": ScaleLevel.objects.filter(
+            version__record__name__startswith=BENCH_PREFIX
+        ).count(),
+        "notifications": Notification.objects.filter(
+            recipient__username__startswith=prefix
+        ).count(),
+        "userScales": AIUserScale.objects.filter(username__startswith=prefix).count(),
+    }
+
+
+@transaction.atomic
+def clear_bench_data() -> None:
+    ScaleRecord.objects.filter(name__startswith=BENCH_PREFIX).delete()
+    AIUserScale.objects.filter(username__startswith=f"{BENCH_PREFIX}-").delete()
+    Course.objects.filter(code__startswith=BENCH_PREFIX.upper()).delete()
+    User.objects.filter(username__startswith=f"{BENCH_PREFIX}-").delete()
+    ScaleLevelContent.objects.filter(levels__isnull=True).delete()
+
+
+def spec_as_dict(spec: SeedSpec) -> dict:
+    return asdict(spec)
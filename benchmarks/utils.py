@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import json
+import statistics
+from contextlib import contextmanager
+from typing import Any, Iterator, Sequence
+
+from django.conf import settings
+from django.core.signals import request_finished, request_started
+from django.db import close_old_connections, transaction
+from django.test.utils import override_settings
+
+
+class _Rollback(Exception):
+    pass
+
+
+@contextmanager
+def rolled_back(using: str = "default") -> Iterator[None]:
+    """Run the block in a transaction that is always rolled back."""
+    try:
+        with transaction.atomic(using=using):
+            yield
+            raise _Rollback
+    except _Rollback:
+        pass
+
+
+@contextmanager
+def client_environment() -> Iterator[None]:
+    """
+    Let the Django test client drive real views from a management command:
+    accept its host name and keep the connection (and any open transaction)
+    alive between requests.
+    """
+    request_started.disconnect(close_old_connections)
+    request_finished.disconnect(close_old_connections)
+    try:
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]):
+            yield
+    finally:
+        request_started.connect(close_old_connections)
+        request_finished.connect(close_old_connections)
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize_ms(samples: Sequence[float]) -> dict[str, float]:
+    """Latency summary in milliseconds for samples measured in seconds."""
+    return {
+        "p50Ms": round(percentile(samples, 50) * 1000, 3),
+        "p95Ms": round(percentile(samples, 95) * 1000, 3),
+        "meanMs": round(statistics.fmean(samples) * 1000, 3) if samples else 0.0,
+    }
+
+
+def write_report(command, report: dict[str, Any], output: str | None) -> None:
+    payload = json.dumps(report, indent=2, sort_keys=True)
+    if output:
+        with open(output, "w", encoding="utf-8") as handle:
+            handle.write(payload + "\n")
+    command.stdout.write(payload)
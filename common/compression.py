@@ -0,0 +1,154 @@
+"""
+Negotiated response compression. ``CompressionMiddleware`` compresses large
+text responses on the way out. ``precompressed_response`` serves payloads
+that never change (saved scale versions, diffs between them) from bodies
+compressed once and kept in the cache. Brotli is used when the optional
+``brotli`` package is installed and the client accepts it; gzip otherwise.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Callable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_string
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+# Same BREACH mitigation as Django's GZipMiddleware.
+GZIP_MAX_RANDOM_BYTES = 100
+# Per-request compression trades ratio for speed; cached bodies are
+# compressed once, so they use the best setting.
+BROTLI_QUALITY = 5
+BROTLI_CACHED_QUALITY = 11
+PRECOMPRESSED_TIMEOUT = 7 * 24 * 60 * 60
+
+_CODING_RE = re.compile(r"^\s*([\w*-]+)\s*(?:;\s*q\s*=\s*([0-9.]+))?\s*$")
+
+
+def negotiate(accept_encoding: str) -> str | None:
+    """Best coding this server offers for an ``Accept-Encoding`` header."""
+    weights = {}
+    for part in accept_encoding.split(","):
+        match = _CODING_RE.match(part)
+        if not match:
+            continue
+        try:
+            weights[match.group(1).lower()] = float(match.group(2) or 1)
+        except ValueError:
+            continue
+    offered = ("br", "gzip") if brotli is not None else ("gzip",)
+    best, best_weight = None, 0.0
+    for coding in offered:
+        weight = weights.get(coding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = coding, weight
+    return best
+
+
+def compress(body: bytes, coding: str, *, cached: bool = False) -> bytes:
+    if coding == "br":
+        return brotli.compress(
+            body, quality=BROTLI_CACHED_QUALITY if cached else BROTLI_QUALITY
+        )
+    return compress_string(body, max_random_bytes=GZIP_MAX_RANDOM_BYTES)
+
+
+def is_compressible(response) -> bool:
+    content_type = response.get("Content-Type", "").split(";")[0].strip().lower()
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+def _mark_encoded(response, coding: str) -> None:
+    response["Content-Length"] = str(len(response.content))
+    response["Content-Encoding"] = coding
+    # The bytes differ per coding, so a strong validator would be wrong.
+    etag = response.get("ETag")
+    if etag and etag.startswith('"'):
+        response["ETag"] = "W/" + etag
+
+
+class CompressionMiddleware:
+    """
+    Compress text responses of at least ``COMPRESS_MIN_BYTES`` with the best
+    coding the client accepts. Streaming responses, responses that are
+    already encoded and binary formats (spreadsheets, PDFs) pass through.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.min_bytes = getattr(settings, "COMPRESS_MIN_BYTES", 1024)
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if (
+            response.streaming
+            or response.has_header("Content-Encoding")
+            or not is_compressible(response)
+            or len(response.content) < self.min_bytes
+        ):
+            return response
+        patch_vary_headers(response, ("Accept-Encoding",))
+        coding = negotiate(request.headers.get("Accept-Encoding", ""))
+        if coding is None:
+            return response
+        compressed = compress(response.content, coding)
+        if len(compressed) >= len(response.content):
+            return response
+        response.content = compressed
+        _mark_encoded(response, coding)
+        return response
+
+
+def precompressed_response(
+    request,
+    key: str,
+    render: Callable[[], bytes],
+    *,
+    etag: str | None = None,
+    content_type: str = "application/json",
+) -> HttpResponse:
+    """
+    Response for an immutable payload identified by ``key``. The body is
+    rendered and compressed on the first request for each coding and then
+    served from the cache, so later requests skip serialization and
+    compression entirely. ``render`` must return the same bytes every time.
+    """
+    min_bytes = getattr(settings, "COMPRESS_MIN_BYTES", 1024)
+    coding = None
+    if getattr(settings, "COMPRESS_RESPONSES", True):
+        coding = negotiate(request.headers.get("Accept-Encoding", ""))
+    cache_key = f"precompressed:{key}:{coding or 'identity'}"
+    cached = cache.get(cache_key)
+    if cached is None:
+        body = render()
+        if coding is not None and len(body) >= min_bytes:
+            compressed = compress(body, coding, cached=True)
+            if len(compressed) < len(body):
+                cached = (coding, compressed)
+        if cached is None:
+            cached = (None, body)
+        cache.set(cache_key, cached, PRECOMPRESSED_TIMEOUT)
+
+    used, body = cached
+    response = HttpResponse(body, content_type=content_type)
+    patch_vary_headers(response, ("Accept-Encoding",))
+    if etag:
+        response["ETag"] = etag
+    if used is not None:
+        _mark_encoded(response, used)
+    return response
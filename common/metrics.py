@@ -0,0 +1,375 @@
+"""
+Small in-process metrics registry rendered in the Prometheus text format.
+
+Metrics are module-level objects created with ``counter``, ``histogram`` and
+``gauge`` and updated from request code. With several worker processes, set
+``METRICS_DIR`` to a directory the workers share. Each process then writes a
+JSON snapshot of its values there at most every ``METRICS_FLUSH_SECONDS``
+and again on exit, and ``/metrics`` merges the snapshots: counters and
+histograms are summed, and gauges are summed over processes that are still
+alive. Snapshots are named by PID plus a per-process id, so a reused PID never
+overwrites or merges into another process's file. When ``/metrics`` finds a
+snapshot of a dead process it folds its counters and histograms into
+``metrics-retired.json`` and deletes the file, so the directory does not grow
+with worker restarts.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import math
+import os
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Iterable, Sequence
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+DEFAULT_LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+_registry: dict[str, "Metric"] = {}
+_lock = threading.Lock()
+
+
+class Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._values: dict[tuple[str, ...], object] = {}
+
+    def _key(self, labels: dict[str, object]) -> tuple[str, ...]:
+        if set(labels) != set(self.labels):
+            raise ValueError(f"{self.name} expects labels {self.labels}")
+        return tuple(str(labels[name]) for name in self.labels)
+
+    def snapshot(self) -> dict:
+        with _lock:
+            samples = [[list(key), _copy(v)] for key, v in self._values.items()]
+        return {
+            "type": self.kind,
+            "help": self.documentation,
+            "labels": list(self.labels),
+            "samples": samples,
+        }
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        with _lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+        _maybe_flush()
+
+
+class Gauge(Metric):
+    kind = "gauge"
+
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with _lock:
+            self._values[key] = float(value)
+        _maybe_flush()
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labels=(), buckets=DEFAULT_LATENCY_BUCKETS):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        index = next(
+            (i for i, bound in enumerate(self.buckets) if value <= bound),
+            len(self.buckets),
+        )
+        with _lock:
+            state = self._values.get(key)
+            if state is None:
+                state = {
+                    "buckets": [0] * (len(self.buckets) + 1),
+                    "sum": 0.0,
+                    "count": 0,
+                }
+                self._values[key] = state
+            state["buckets"][index] += 1
+            state["sum"] += value
+            state["count"] += 1
+        _maybe_flush()
+
+    def snapshot(self) -> dict:
+        data = super().snapshot()
+        data["buckets"] = list(self.buckets)
+        return data
+
+
+def _copy(value):
+    if isinstance(value, dict):
+        return {**value, "buckets": list(value["buckets"])}
+    return value
+
+
+def _register(metric: Metric) -> Metric:
+    with _lock:
+        existing = _registry.get(metric.name)
+        if existing is not None:
+            return existing
+        _registry[metric.name] = metric
+    return metric
+
+
+def counter(name: str, documentation: str, labels: Sequence[str] = ()) -> Counter:
+    return _register(Counter(name, documentation, labels))
+
+
+def gauge(name: str, documentation: str, labels: Sequence[str] = ()) -> Gauge:
+    return _register(Gauge(name, documentation, labels))
+
+
+def histogram(
+    name: str,
+    documentation: str,
+    labels: Sequence[str] = (),
+    buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS,
+) -> Histogram:
+    return _register(Histogram(name, documentation, labels, buckets))
+
+
+# ---- multi-process snapshots ----
+
+_last_flush = 0.0
+_RETIRED_NAME = "metrics-retired.json"
+_instance: tuple[int, str] | None = None
+
+
+def _instance_id() -> str:
+    # Regenerated after fork so preloaded workers do not share the parent's id.
+    global _instance
+    pid = os.getpid()
+    if _instance is None or _instance[0] != pid:
+        _instance = (pid, uuid.uuid4().hex[:12])
+    return _instance[1]
+
+
+def _metrics_dir() -> Path | None:
+    directory = getattr(settings, "METRICS_DIR", None)
+    return Path(directory) if directory else None
+
+
+def snapshot() -> dict:
+    return {name: metric.snapshot() for name, metric in list(_registry.items())}
+
+
+def flush() -> None:
+    """Write this process's values to ``METRICS_DIR`` (no-op when unset)."""
+    global _last_flush
+    directory = _metrics_dir()
+    if directory is None:
+        return
+    _last_flush = time.monotonic()
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        pid, instance = os.getpid(), _instance_id()
+        target = directory / f"metrics-{pid}-{instance}.json"
+        payload = {"pid": pid, "instance": instance, "metrics": snapshot()}
+        _write_json(target, payload)
+    except OSError:
+        logger.exception("Could not write metrics snapshot to %s", directory)
+
+
+def _maybe_flush() -> None:
+    interval = getattr(settings, "METRICS_FLUSH_SECONDS", 1.0)
+    if time.monotonic() - _last_flush >= interval and _metrics_dir() is not None:
+        flush()
+
+
+def _flush_at_exit() -> None:
+    try:
+        flush()
+    except Exception:
+        pass
+
+
+atexit.register(_flush_at_exit)
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _write_json(target: Path, payload: dict) -> None:
+    temp = target.parent / f".{target.stem}-{threading.get_ident()}.tmp"
+    temp.write_text(json.dumps(payload))
+    os.replace(temp, target)
+
+
+def _merge_into(merged: dict, metrics: dict, *, alive: bool) -> None:
+    for name, data in metrics.items():
+        target = merged.setdefault(name, {**data, "samples": {}})
+        if data["type"] == "gauge" and not alive:
+            continue
+        for labels, value in data["samples"]:
+            key = tuple(labels)
+            current = target["samples"].get(key)
+            if current is None:
+                target["samples"][key] = _copy(value)
+            elif isinstance(value, dict):
+                current["sum"] += value["sum"]
+                current["count"] += value["count"]
+                current["buckets"] = [
+                    a + b for a, b in zip(current["buckets"], value["buckets"])
+                ]
+            else:
+                target["samples"][key] = current + value
+
+
+def _as_snapshot(merged: dict) -> dict:
+    return {
+        name: {**data, "samples": [[list(k), v] for k, v in data["samples"].items()]}
+        for name, data in merged.items()
+    }
+
+
+def _read_payload(path: Path) -> dict | None:
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def retire_dead_snapshots(directory: Path) -> int:
+    """
+    Fold the snapshots of processes that have exited into the retired file and
+    delete them. Counters and histograms keep their totals; gauges are dropped.
+    Runs under an exclusive file lock so concurrent scrapes count each file
+    once. Returns the number of snapshots retired.
+    """
+    if fcntl is None:
+        return 0
+    with open(directory / ".retire.lock", "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        dead = []
+        for path in directory.glob("metrics-*.json"):
+            if path.name == _RETIRED_NAME:
+                continue
+            payload = _read_payload(path)
+            if payload is not None and not _pid_alive(payload.get("pid")):
+                dead.append((path, payload))
+        if not dead:
+            return 0
+        retired_path = directory / _RETIRED_NAME
+        merged: dict = {}
+        retired = _read_payload(retired_path)
+        if retired is not None:
+            _merge_into(merged, retired.get("metrics", {}), alive=False)
+        for _path, payload in dead:
+            _merge_into(merged, payload.get("metrics", {}), alive=False)
+        _write_json(retired_path, {"pid": None, "metrics": _as_snapshot(merged)})
+        for path, _payload in dead:
+            path.unlink(missing_ok=True)
+    return len(dead)
+
+
+def collect() -> dict:
+    """Values of every process that reported into ``METRICS_DIR`` plus our own."""
+    merged: dict = {}
+    _merge_into(merged, snapshot(), alive=True)
+    directory = _metrics_dir()
+    if directory is None or not directory.exists():
+        return merged
+    try:
+        retire_dead_snapshots(directory)
+    except OSError:
+        logger.exception("Could not retire dead metrics snapshots in %s", directory)
+    own = (os.getpid(), _instance_id())
+    for path in directory.glob("metrics-*.json"):
+        payload = _read_payload(path)
+        if payload is None:
+            continue
+        pid = payload.get("pid")
+        if (pid, payload.get("instance")) == own:
+            continue
+        alive = pid is not None and _pid_alive(pid)
+        _merge_into(merged, payload.get("metrics", {}), alive=alive)
+    return merged
+
+
+# ---- text exposition ----
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra=()) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    pairs.extend(f'{name}="{value}"' for name, value in extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_number(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def render(merged: dict | None = None) -> str:
+    merged = collect() if merged is None else merged
+    lines: list[str] = []
+    for name in sorted(merged):
+        data = merged[name]
+        lines.append(f"# HELP {name} {data['help']}")
+        lines.append(f"# TYPE {name} {data['type']}")
+        labels = data["labels"]
+        for key in sorted(data["samples"]):
+            value = data["samples"][key]
+            suffix = _format_labels(labels, key)
+            if data["type"] != "histogram":
+                lines.append(f"{name}{suffix} {_format_number(value)}")
+                continue
+            cumulative = 0
+            bounds = [*data["buckets"], math.inf]
+            for bound, count in zip(bounds, value["buckets"]):
+                cumulative += count
+                le = (("le", _format_number(bound)),)
+                lines.append(
+                    f"{name}_bucket{_format_labels(labels, key, le)} {cumulative}"
+                )
+            lines.append(f"{name}_sum{suffix} {_format_number(value['sum'])}")
+            lines.append(f"{name}_count{suffix} {value['count']}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+
+from common import metrics
+
+logger = logging.getLogger("common.queries")
+
+REQUEST_LATENCY = metrics.histogram(
+    "http_request_duration_seconds",
+    "Request latency by DRF view and action.",
+    ("view", "method", "status"),
+)
+REQUEST_QUERIES = metrics.histogram(
+    "http_request_db_queries",
+    "SQL queries issued per request.",
+    ("view",),
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500),
+)
+REQUEST_DB_TIME = metrics.histogram(
+    "http_request_db_seconds",
+    "Time spent in SQL per request.",
+    ("view",),
+)
+
+_IN_LIST_RE = re.compile(r"\bIN \((?:%s, )*%s\)", re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def fingerprint(sql: str) -> str:
+    """Normalise ``sql`` so queries differing only in IN-list length collide."""
+    return _WHITESPACE_RE.sub(" ", _IN_LIST_RE.sub("IN (...)", sql)).strip()
+
+
+def view_label(view_func, method: str) -> str:
+    """
+    ``ViewSet.action`` for DRF viewsets, ``View.method`` for class-based views,
+    otherwise the function name.
+    """
+    cls = getattr(view_func, "cls", None) or getattr(view_func, "view_class", None)
+    if cls is None:
+        return getattr(view_func, "__name__", "unknown")
+    actions = getattr(view_func, "actions", None) or {}
+    action = actions.get(method.lower(), method.lower())
+    return f"{cls.__name__}.{action}"
+
+
+class QueryStats:
+    def __init__(self, slow_query_ms: float) -> None:
+        self.slow_query_ms = slow_query_ms
+        self.count = 0
+        self.duration = 0.0
+        self.fingerprints: Counter[str] = Counter()
+        self.slow_queries: list[tuple[float, str]] = []
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - started
+            self.count += 1
+            self.duration += elapsed
+            self.fingerprints[fingerprint(sql)] += 1
+            if elapsed * 1000 >= self.slow_query_ms:
+                self.slow_queries.append((elapsed, sql))
+
+    @property
+    def duplicates(self) -> dict[str, int]:
+        return {sql: n for sql, n in self.fingerprints.items() if n > 1}
+
+    @property
+    def duplicate_count(self) -> int:
+        return sum(n - 1 for n in self.fingerprints.values() if n > 1)
+
+
+class QueryInstrumentationMiddleware:
+    """
+    Count the SQL queries and database time of every request through
+    ``connection.execute_wrapper``. Statements that repeat within a request
+    (the N+1 signature) are grouped by fingerprint. Requests over the
+    QUERY_LOG_THRESHOLDS are logged to ``common.queries``. When
+    SERVER_TIMING is on the totals are also returned as a ``Server-Timing``
+    header. The collected stats stay on ``request.query_stats``, and latency,
+    query count and DB time are recorded in the ``/metrics`` histograms.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        thresholds = getattr(settings, "QUERY_LOG_THRESHOLDS", {})
+        self.max_queries = thresholds.get("max_queries", 50)
+        self.max_db_ms = thresholds.get("max_db_ms", 200)
+        self.slow_query_ms = thresholds.get("slow_query_ms", 100)
+        self.max_duplicates = thresholds.get("max_duplicates", 5)
+        self.server_timing = getattr(settings, "SERVER_TIMING", False)
+
+    def __call__(self, request):
+        stats = QueryStats(self.slow_query_ms)
+        request.query_stats = stats
+        request.view_label = None
+        started = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(stats))
+            response = self.get_response(request)
+        total = time.perf_counter() - started
+        label = request.view_label or request.path
+        # Unrouted paths share one label to keep metric cardinality bounded.
+        metric_label = request.view_label or "unmatched"
+        REQUEST_LATENCY.observe(
+            total,
+            view=metric_label,
+            method=request.method,
+            status=f"{response.status_code // 100}xx",
+        )
+        REQUEST_QUERIES.observe(stats.count, view=metric_label)
+        REQUEST_DB_TIME.observe(stats.duration, view=metric_label)
+
+        if self.server_timing:
+            response["Server-Timing"] = (
+                f'db;dur={stats.duration * 1000:.2f};desc="{stats.count} queries", '
+                f'dup;desc="{stats.duplicate_count} repeated", '
+                f"total;dur={total * 1000:.2f}"
+            )
+        self._log(request, label, stats, total)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request.view_label = view_label(view_func, request.method)
+        return None
+
+    def _log(self, request, label, stats, total) -> None:
+        for elapsed, sql in stats.slow_queries:
+            logger.warning("Slow query (%.1fms) in %s: %s", elapsed * 1000, label, sql)
+        duplicates = stats.duplicate_count
+        if (
+            stats.count <= self.max_queries
+            and stats.duration * 1000 <= self.max_db_ms
+            and duplicates <= self.max_duplicates
+        ):
+            return
+        worst = sorted(stats.duplicates.items(), key=lambda item: -item[1])[:3]
+        logger.warning(
+            "%s %s (%s): %d queries, %.1fms db, %.1fms total, %d repeated%s",
+            request.method,
+            request.path,
+            label,
+            stats.count,
+            stats.duration * 1000,
+            total * 1000,
+            duplicates,
+            "".join(f"\n  {count}x {sql}" for sql, count in worst),
+        )
@@ -0,0 +1,311 @@
+from __future__ import annotations
+
+import logging
+import re
+from dataclasses import dataclass
+from typing import Iterable
+
+from django.conf import settings
+from django.db import connections, models
+from django.db.models import Q, Value
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_migrate
+from rest_framework import filters
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+@dataclass(frozen=True)
+class SearchIndex:
+    model: type[models.Model]
+    fields: tuple[str, ...]
+    # Code-like fields (e.g. "COMP30022") that token matching cannot find by an
+    # inner fragment; these keep the icontains match alongside the index.
+    substring_fields: tuple[str, ...] = ()
+
+    @property
+    def db_table(self) -> str:
+        return self.model._meta.db_table
+
+    @property
+    def name(self) -> str:
+        return f"{self.db_table}_fts"
+
+    @property
+    def columns(self) -> list[str]:
+        return [self.model._meta.get_field(field).column for field in self.fields]
+
+
+_REGISTRY: dict[str, SearchIndex] = {}
+
+
+def register_search_index(
+    model: type[models.Model],
+    fields: Iterable[str],
+    *,
+    substring_fields: Iterable[str] = (),
+) -> SearchIndex:
+    index = SearchIndex(
+        model=model, fields=tuple(fields), substring_fields=tuple(substring_fields)
+    )
+    _REGISTRY[model._meta.label_lower] = index
+    return index
+
+
+def get_search_index(model: type[models.Model]) -> SearchIndex | None:
+    return _REGISTRY.get(model._meta.label_lower)
+
+
+def search_tokens(query: str) -> list[str]:
+    return _TOKEN_RE.findall((query or "").lower())
+
+
+class BasicSearchBackend:
+    """
+    Portable fallback that keeps the previous icontains behaviour. Used for
+    engines without a native full-text index (MySQL) or when disabled.
+    """
+
+    def install(self, index: SearchIndex, connection) -> None:
+        return None
+
+    def substring_condition(self, index: SearchIndex, query: str) -> Q:
+        condition = Q()
+        for field in index.substring_fields:
+            condition |= Q(**{f"{field}__icontains": query})
+        return condition
+
+    def search(self, queryset, index: SearchIndex, query: str):
+        condition = Q()
+        for field in index.fields:
+            condition |= Q(**{f"{field}__icontains": query})
+        return queryset.filter(condition).annotate(search_rank=Value(0.0))
+
+
+class SQLiteSearchBackend(BasicSearchBackend):
+    """
+    External-content FTS5 table per index, kept in sync by triggers so that
+    bulk_create/update() writes are indexed too. Matching is token prefix based,
+    plus icontains on the index's substring fields.
+    """
+
+    def _statements(self, index: SearchIndex, connection) -> dict[str, str]:
+        qn = connection.ops.quote_name
+        fts = qn(index.name)
+        table = qn(index.db_table)
+        columns = ", ".join(qn(column) for column in index.columns)
+        new_values = ", ".join(f"new.{qn(column)}" for column in index.columns)
+        old_values = ", ".join(f"old.{qn(column)}" for column in index.columns)
+        delete_old = (
+            f"INSERT INTO {fts}({fts}, rowid, {columns}) "
+            f"VALUES('delete', old.rowid, {old_values});"
+        )
+        insert_new = (
+            f"INSERT INTO {fts}(rowid, {columns}) VALUES (new.rowid, {new_values});"
+        )
+        return {
+            index.name: (
+                f"CREATE VIRTUAL TABLE {fts} USING fts5({columns}, "
+                f"content='{index.db_table}', content_rowid='rowid', "
+                "tokenize='unicode61 remove_diacritics 2')"
+            ),
+            f"{index.name}_ai": (
+                f"CREATE TRIGGER {qn(index.name + '_ai')} AFTER INSERT ON {table} "
+                f"BEGIN {insert_new} END"
+            ),
+            f"{index.name}_ad": (
+                f"CREATE TRIGGER {qn(index.name + '_ad')} AFTER DELETE ON {table} "
+                f"BEGIN {delete_old} END"
+            ),
+            f"{index.name}_au": (
+                f"CREATE TRIGGER {qn(index.name + '_au')} AFTER UPDATE OF {columns} "
+                f"ON {table} BEGIN {delete_old} {insert_new} END"
+            ),
+        }
+
+    def install(self, index: SearchIndex, connection) -> None:
+        statements = self._statements(index, connection)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE name IN (%s)"
+                % ", ".join(["%s"] * len(statements)),
+                list(statements),
+            )
+            existing = {row[0] for row in cursor.fetchall()}
+            missing = [name for name in statements if name not in existing]
+            if not missing:
+                return
+            # Table rebuilds during migrations drop the triggers, so anything
+            # missing means the index may be stale and is rebuilt from scratch.
+            for name in missing:
+                cursor.execute(statements[name])
+            fts = connection.ops.quote_name(index.name)
+            cursor.execute(f"INSERT INTO {fts}({fts}) VALUES('rebuild')")
+
+    def build_match(self, query: str) -> str:
+        return " ".join(f'"{token}"*' for token in search_tokens(query))
+
+    def search(self, queryset, index: SearchIndex, query: str):
+        match = self.build_match(query)
+        if not match:
+            return super().search(queryset, index, query)
+        qn = connections[queryset.db].ops.quote_name
+        fts = qn(index.name)
+        table = qn(index.db_table)
+        pk_column = qn(index.model._meta.pk.column)
+        matching_pks = RawSQL(
+            f"SELECT {table}.{pk_column} FROM {table} WHERE {table}.rowid IN "
+            f"(SELECT rowid FROM {fts} WHERE {fts} MATCH %s)",
+            [match],
+        )
+        # bm25() is lower for better matches; negate so higher ranks sort first.
+        # Rows found only through a substring field have no FTS row and rank 0.
+        rank = Coalesce(
+            RawSQL(
+                f"SELECT -bm25({fts}) FROM {fts} "
+                f"WHERE {fts} MATCH %s AND {fts}.rowid = {table}.rowid",
+                [match],
+                output_field=models.FloatField(),
+            ),
+            Value(0.0),
+        )
+        condition = Q(pk__in=matching_pks) | self.substring_condition(index, query)
+        return queryset.filter(condition).annotate(search_rank=rank)
+
+
+class PostgresSearchBackend(BasicSearchBackend):
+    """
+    tsvector expression over the indexed fields backed by a GIN expression
+    index. The index is maintained by PostgreSQL itself, so nothing extra runs
+    on save.
+    """
+
+    def _config(self) -> str:
+        return getattr(settings, "SEARCH_POSTGRES_CONFIG", "simple")
+
+    def _vector(self, index: SearchIndex):
+        from django.contrib.postgres.search import SearchVector
+
+        return SearchVector(*index.fields, config=self._config())
+
+    def install(self, index: SearchIndex, connection) -> None:
+        from django.contrib.postgres.indexes import GinIndex
+
+        name = f"{index.db_table}_search"[:30]
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(
+                cursor, index.db_table
+            )
+        if name in constraints:
+            return
+        with connection.schema_editor() as editor:
+            editor.add_index(index.model, GinIndex(self._vector(index), name=name))
+
+    def search(self, queryset, index: SearchIndex, query: str):
+        from django.contrib.postgres.search import SearchQuery, SearchRank
+
+        tokens = search_tokens(query)
+        if not tokens:
+            return super().search(queryset, index, query)
+        ts_query = SearchQuery(
+            " & ".join(f"{token}:*" for token in tokens),
+            config=self._config(),
+            search_type="raw",
+        )
+        vector = self._vector(index)
+        condition = Q(search_vector=ts_query) | self.substring_condition(index, query)
+        return (
+            queryset.annotate(search_vector=vector)
+            .filter(condition)
+            .annotate(search_rank=SearchRank(vector, ts_query))
+        )
+
+
+def get_search_backend(connection) -> BasicSearchBackend:
+    if getattr(settings, "SEARCH_BACKEND", "auto") != "auto":
+        return BasicSearchBackend()
+    if connection.vendor == "sqlite":
+        return SQLiteSearchBackend()
+    if connection.vendor == "postgresql":
+        return PostgresSearchBackend()
+    return BasicSearchBackend()
+
+
+def build_snippet(text: str | None, query: str, *, radius: int = 60) -> str | None:
+    """
+    Short excerpt of ``text`` around the first matching token with matches
+    wrapped in ``**``. Returns None when no token of ``query`` occurs in it.
+    """
+    if not text:
+        return None
+    tokens = search_tokens(query)
+    if not tokens:
+        return None
+    pattern = re.compile(
+        r"\b(?:%s)\w*" % "|".join(re.escape(token) for token in tokens),
+        re.IGNORECASE | re.UNICODE,
+    )
+    first = pattern.search(text)
+    if first is None:
+        return None
+    start = max(0, first.start() - radius)
+    end = min(len(text), first.end() + radius)
+    excerpt = pattern.sub(lambda match: f"**{match.group(0)}**", text[start:end])
+    prefix = "…" if start > 0 else ""
+    suffix = "…" if end < len(text) else ""
+    return f"{prefix}{excerpt.strip()}{suffix}"
+
+
+def full_text_search(queryset, query: str, *, ranked: bool = True):
+    """
+    Filter ``queryset`` to rows matching ``query`` using the registered index for
+    its model. Adds a ``search_rank`` annotation; ``ranked`` puts the best
+    matches first and keeps the existing ordering as a tie-breaker.
+    """
+    index = get_search_index(queryset.model)
+    if index is None:
+        raise LookupError(
+            f"No search index registered for {queryset.model._meta.label}."
+        )
+    backend = get_search_backend(connections[queryset.db])
+    queryset = backend.search(queryset, index, query)
+    if ranked:
+        # Meta.ordering is not in query.order_by; pk makes equal ranks stable
+        # so pages neither repeat nor skip rows.
+        ordering = queryset.query.order_by or queryset.query.get_meta().ordering
+        queryset = queryset.order_by("-search_rank", *ordering, "pk")
+    return queryset
+
+
+class FullTextSearchFilter(filters.SearchFilter):
+    """
+    Drop-in replacement for SearchFilter on models with a registered search
+    index. Results are ranked unless the client asked for an explicit ordering.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        terms = (request.query_params.get(self.search_param) or "").strip()
+        if not terms or get_search_index(queryset.model) is None:
+            return super().filter_queryset(request, queryset, view)
+        ranked = not request.query_params.get(filters.OrderingFilter.ordering_param)
+        return full_text_search(queryset, terms, ranked=ranked)
+
+
+def install_search_indexes(sender, using="default", **kwargs) -> None:
+    connection = connections[using]
+    backend = get_search_backend(connection)
+    # Tables are missing after migrating an app backwards; nothing to index.
+    tables = set(connection.introspection.table_names())
+    for index in _REGISTRY.values():
+        if index.model._meta.app_config is not sender or index.db_table not in tables:
+            continue
+        try:
+            backend.install(index, connection)
+        except Exception:
+            logger.exception("Failed to install search index %s", index.name)
+
+
+post_migrate.connect(install_search_indexes, dispatch_uid="common.search.install")
@@ -0,0 +1,58 @@
+"""
+SQLite backend with the two connection options Django only gained in 5.1:
+``init_command`` (statements run on every new connection, used for the
+pragmas of the production profile) and ``transaction_mode`` (``BEGIN
+IMMEDIATE`` for ``atomic()`` blocks). On Django 5.1+ the environment selects
+the stock backend with the same options instead.
+"""
+
+from __future__ import annotations
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.sqlite3 import base
+from django.utils.asyncio import async_unsafe
+from django.utils.functional import cached_property
+
+TRANSACTION_MODES = ("DEFERRED", "EXCLUSIVE", "IMMEDIATE")
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    @cached_property
+    def transaction_mode(self) -> str | None:
+        mode = self.settings_dict["OPTIONS"].get("transaction_mode")
+        if mode is None:
+            return None
+        mode = mode.upper()
+        if mode not in TRANSACTION_MODES:
+            raise ImproperlyConfigured(
+                f"settings.DATABASES[{self.alias!r}]['OPTIONS']['transaction_mode'] "
+                f"is improperly configured to {mode!r}. Use one of "
+                f"{', '.join(map(repr, TRANSACTION_MODES))}, or None."
+            )
+        return mode
+
+    def get_connection_params(self):
+        params = super().get_connection_params()
+        # Handled here rather than by sqlite3.connect().
+        params.pop("init_command", None)
+        params.pop("transaction_mode", None)
+        return params
+
+    @async_unsafe
+    def get_new_connection(self, conn_params):
+        conn = super().get_new_connection(conn_params)
+        init_command = self.settings_dict["OPTIONS"].get("init_command", "")
+        for statement in init_command.split(";"):
+            if statement := statement.strip():
+                conn.execute(statement)
+        return conn
+
+    def _start_transaction_under_autocommit(self):
+        # A deferred transaction that reads before it writes cannot wait for
+        # the write lock (the busy timeout does not apply), so concurrent
+        # writers fail with "database is locked". IMMEDIATE takes the lock
+        # up front, where the busy timeout does apply.
+        if self.transaction_mode is None:
+            super()._start_transaction_under_autocommit()
+        else:
+            self.cursor().execute(f"BEGIN {self.transaction_mode}")
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import secrets
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.http import HttpResponse
+from rest_framework.views import APIView
+
+from common import metrics
+
+
+class AsyncAPIView(APIView):
+    """
+    APIView whose handlers are coroutines. Authentication, permission and
+    throttle checks still run synchronously (they may hit the database) but in
+    a worker thread, so the event loop is only held while the handler awaits.
+    Handlers must wrap their own ORM access with ``sync_to_async`` or use the
+    async queryset API.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(
+                    self, request.method.lower(), self.http_method_not_allowed
+                )
+            else:
+                handler = self.http_method_not_allowed
+
+            if iscoroutinefunction(handler):
+                response = await handler(request, *args, **kwargs)
+            else:
+                response = handler(request, *args, **kwargs)
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    async def options(self, request, *args, **kwargs):
+        # Django requires every handler of an async view to be async.
+        return super().options(request, *args, **kwargs)
+
+
+def metrics_view(request):
+    """
+    Prometheus text exposition of every metric, merged across worker
+    processes. Requires ``Authorization: Bearer <METRICS_TOKEN>``; without a
+    configured token the endpoint is only served when DEBUG is on.
+    """
+    token = getattr(settings, "METRICS_TOKEN", "")
+    if not token:
+        if not settings.DEBUG:
+            return HttpResponse("forbidden\n", status=403, content_type="text/plain")
+    else:
+        supplied = request.headers.get("Authorization", "").removeprefix("Bearer ")
+        if not secrets.compare_digest(supplied.strip(), token):
+            return HttpResponse("forbidden\n", status=403, content_type="text/plain")
+    metrics.flush()
+    return HttpResponse(
+        metrics.render(), content_type="text/plain; version=0.0.4; charset=utf-8"
+    )
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable
+from typing import Any, Iterable
 import os
 
+import django
+
 BASE_DIR = Path(__file__).resolve().parents[1]
 
 
@@ -36,10 +38,10 @@ def _split_items(raw: str | None, fallback: Iterable[str]) -> list[str]:
     return [item.strip() for item in raw.split(",") if item.strip()]
 
 
-def _build_database_config() -> dict[str, str]:
+def _build_database_config() -> dict[str, Any]:
     engine = (os.getenv("DJANGO_DB_ENGINE") or "sqlite").strip().lower()
     if engine in {"mysql", "mariadb"}:
-        return {
+        config = {
             "ENGINE": "django.db.backends.mysql",
             "NAME": os.getenv("DJANGO_DB_NAME", ""),
             "USER": os.getenv("DJANGO_DB_USER", ""),
@@ -47,8 +49,8 @@ def _build_database_config() -> dict[str, str]:
             "HOST": os.getenv("DJANGO_DB_HOST", "127.0.0.1"),
             "PORT": os.getenv("DJANGO_DB_PORT", "3306"),
         }
-    if engine in {"postgres", "postgresql"}:
-        return {
+    elif engine in {"postgres", "postgresql"}:
+        config = {
             "ENGINE": "django.db.backends.postgresql",
             "NAME": os.getenv("DJANGO_DB_NAME", ""),
             "USER": os.getenv("DJANGO_DB_USER", ""),
@@ -56,16 +58,233 @@ def _build_database_config() -> dict[str, str]:
             "HOST": os.getenv("DJANGO_DB_HOST", "127.0.0.1"),
             "PORT": os.getenv("DJANGO_DB_PORT", "5432"),
         }
-    sqlite_name = os.getenv("DJANGO_SQLITE_NAME", "db.sqlite3")
-    sqlite_path = Path(os.getenv("DJANGO_SQLITE_PATH", "") or BASE_DIR / sqlite_name)
-    if not sqlite_path.is_absolute():
-        sqlite_path = (BASE_DIR / sqlite_path).resolve()
+    else:
+        sqlite_name = os.getenv("DJANGO_SQLITE_NAME", "db.sqlite3")
+        sqlite_path = Path(
+            os.getenv("DJANGO_SQLITE_PATH", "") or BASE_DIR / sqlite_name
+        )
+        if not sqlite_path.is_absolute():
+            sqlite_path = (BASE_DIR / sqlite_path).resolve()
+        config = {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": str(sqlite_path),
+        }
+        # Stock unless asked: the production profile changes locking and
+        # durability (WAL files, BEGIN IMMEDIATE), so existing installs opt in.
+        profile = (os.getenv("DJANGO_SQLITE_PROFILE") or "stock").strip().lower()
+        if profile == "production":
+            # Django 5.1 added init_command and transaction_mode for SQLite;
+            # older versions get them from common.sqlite.
+            if django.VERSION < (5, 1):
+                config["ENGINE"] = "common.sqlite"
+            config["OPTIONS"] = _build_sqlite_options()
+        elif profile != "stock":
+            raise ValueError(
+                f"Unknown DJANGO_SQLITE_PROFILE {profile!r}; "
+                "expected production or stock."
+            )
+    return {**config, **_build_connection_settings(engine)}
+
+
+_SQLITE_SYNCHRONOUS = {"OFF", "NORMAL", "FULL", "EXTRA"}
+_SQLITE_TRANSACTION_MODES = {"DEFERRED", "IMMEDIATE", "EXCLUSIVE"}
+
+
+def _build_sqlite_options() -> dict[str, Any]:
+    # WAL lets readers run alongside the single writer, and NORMAL only syncs
+    # at checkpoints, which is still crash-safe in WAL mode. IMMEDIATE
+    # transactions take the write lock when they begin, so a writer waits
+    # out the busy timeout instead of failing with "database is locked".
+    synchronous = (os.getenv("DJANGO_SQLITE_SYNCHRONOUS") or "NORMAL").strip().upper()
+    mode = (os.getenv("DJANGO_SQLITE_TRANSACTION_MODE") or "IMMEDIATE").strip().upper()
+    if synchronous not in _SQLITE_SYNCHRONOUS:
+        raise ValueError(f"Unknown DJANGO_SQLITE_SYNCHRONOUS {synchronous!r}.")
+    if mode not in _SQLITE_TRANSACTION_MODES:
+        raise ValueError(f"Unknown DJANGO_SQLITE_TRANSACTION_MODE {mode!r}.")
+    busy_timeout_ms = _as_int(os.getenv("DJANGO_SQLITE_BUSY_TIMEOUT_MS"))
+    mmap_bytes = _as_int(os.getenv("DJANGO_SQLITE_MMAP_SIZE"))
+    cache_kib = _as_int(os.getenv("DJANGO_SQLITE_CACHE_SIZE_KIB"))
+    pragmas = (
+        "PRAGMA journal_mode=WAL",
+        f"PRAGMA synchronous={synchronous}",
+        f"PRAGMA mmap_size={128 * 2**20 if mmap_bytes is None else mmap_bytes}",
+        # Negative sizes are in KiB rather than pages.
+        f"PRAGMA cache_size=-{64 * 1024 if cache_kib is None else cache_kib}",
+    )
     return {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": str(sqlite_path),
+        "timeout": (10000 if busy_timeout_ms is None else busy_timeout_ms) / 1000,
+        "init_command": ";".join(pragmas),
+        "transaction_mode": mode,
     }
 
 
+def _build_connection_settings(engine: str) -> dict[str, Any]:
+    # Connections are closed after each request (Django's default) unless
+    # DJANGO_DB_CONN_MAX_AGE opts in to reusing them; "none" keeps them open
+    # for the life of the worker.
+    raw_age = (os.getenv("DJANGO_DB_CONN_MAX_AGE") or "").strip().lower()
+    if raw_age in {"none", "unlimited"}:
+        max_age = None
+    else:
+        max_age = 0 if not raw_age else int(raw_age)
+    options: dict[str, Any] = {}
+
+    timeout_ms = _as_int(os.getenv("DJANGO_DB_STATEMENT_TIMEOUT_MS"))
+    if timeout_ms:
+        if engine in {"postgres", "postgresql"}:
+            options["options"] = f"-c statement_timeout={timeout_ms}"
+        elif engine == "mariadb":
+            options["init_command"] = (
+                f"SET SESSION max_statement_time={timeout_ms / 1000}"
+            )
+        elif engine == "mysql":
+            options["init_command"] = f"SET SESSION max_execution_time={timeout_ms}"
+
+    if _as_bool(os.getenv("DJANGO_DB_POOL")):
+        if engine not in {"postgres", "postgresql"}:
+            raise ValueError("DJANGO_DB_POOL is only supported with PostgreSQL.")
+        if django.VERSION < (5, 1):
+            raise ValueError(
+                "DJANGO_DB_POOL needs Django 5.1 or newer (and psycopg 3 with "
+                "psycopg-pool); use DJANGO_DB_CONN_MAX_AGE instead."
+            )
+        pool = {
+            key: value
+            for key, value in (
+                ("min_size", _as_int(os.getenv("DJANGO_DB_POOL_MIN_SIZE"))),
+                ("max_size", _as_int(os.getenv("DJANGO_DB_POOL_MAX_SIZE"))),
+                ("timeout", _as_int(os.getenv("DJANGO_DB_POOL_TIMEOUT"))),
+            )
+            if value is not None
+        }
+        options["pool"] = pool or True
+        # Pooled connections go back to the pool after each request; Django
+        # refuses to combine the pool with persistent connections.
+        max_age = 0
+
+    connection: dict[str, Any] = {
+        "CONN_MAX_AGE": max_age,
+        "CONN_HEALTH_CHECKS": _as_bool(
+            os.getenv("DJANGO_DB_CONN_HEALTH_CHECKS"), max_age != 0
+        ),
+    }
+    if options:
+        connection["OPTIONS"] = options
+    return connection
+
+
+def _build_cache_config() -> dict[str, str]:
+    # The auth throttles keep their buckets here, so multi-process deployments
+    # need a shared backend (redis) for the limits to hold across workers.
+    backend = (os.getenv("DJANGO_CACHE_BACKEND") or "locmem").strip().lower()
+    location = os.getenv("DJANGO_CACHE_LOCATION", "")
+    if backend == "redis":
+        return {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": location or "redis://127.0.0.1:6379/1",
+        }
+    if backend == "file":
+        return {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": location or str(BASE_DIR / ".cache"),
+        }
+    return {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": location or "itp8-default",
+    }
+
+
+_AUTH_THROTTLE_DEFAULTS = {
+    "login_ip": "30/min",
+    "login_account": "10/min",
+    "password_reset_ip": "10/hour",
+    "password_reset_account": "3/hour",
+}
+
+
+_QUERY_LOG_DEFAULTS = {
+    "max_queries": 50,
+    "max_db_ms": 200,
+    "max_duplicates": 5,
+    "slow_query_ms": 100,
+}
+
+
+_PRUNE_RETENTION_DEFAULTS = {
+    "reset_tokens": 7,
+    # Tokens are cleared by last password login, not last use, so this logs
+    # out active users; it is opt-in as a maximum session age.
+    "auth_tokens": 0,
+    "read_notifications": 90,
+    "unread_notifications": 365,
+    "outbound_emails": 14,
+    "scale_level_contents": 1,
+}
+
+
+_PASSWORD_HASHER_POLICIES = {
+    "pbkdf2": "usersystem.hashers.TunedPBKDF2PasswordHasher",
+    "argon2": "usersystem.hashers.TunedArgon2PasswordHasher",
+    "bcrypt": "usersystem.hashers.TunedBCryptSHA256PasswordHasher",
+    "scrypt": "usersystem.hashers.TunedScryptPasswordHasher",
+}
+
+
+def _build_password_hashers(policy: str) -> list[str]:
+    # The first entry hashes new passwords; the rest only verify older hashes,
+    # which are rewritten with the preferred hasher on the next login.
+    preferred = _PASSWORD_HASHER_POLICIES.get(policy)
+    if preferred is None:
+        raise ValueError(
+            f"Unknown PASSWORD_HASHER {policy!r}; "
+            f"expected one of {', '.join(_PASSWORD_HASHER_POLICIES)}."
+        )
+    fallbacks = [
+        path for path in _PASSWORD_HASHER_POLICIES.values() if path != preferred
+    ]
+    return [
+        preferred,
+        *fallbacks,
+        "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    ]
+
+
+_JSON_BACKENDS = {
+    "stdlib": (
+        "rest_framework.renderers.JSONRenderer",
+        "rest_framework.parsers.JSONParser",
+    ),
+    "orjson": ("common.fastjson.ORJSONRenderer", "common.fastjson.ORJSONParser"),
+}
+
+
+def _build_api_codecs(backend: str) -> dict[str, list[str]]:
+    # DRF's defaults with the JSON renderer and parser swapped for ``backend``.
+    if backend not in _JSON_BACKENDS:
+        raise ValueError(
+            f"Unknown DJANGO_JSON_BACKEND {backend!r}; "
+            f"expected one of {', '.join(_JSON_BACKENDS)}."
+        )
+    renderer, parser = _JSON_BACKENDS[backend]
+    return {
+        "DEFAULT_RENDERER_CLASSES": [
+            renderer,
+            "rest_framework.renderers.BrowsableAPIRenderer",
+        ],
+        "DEFAULT_PARSER_CLASSES": [
+            parser,
+            "rest_framework.parsers.FormParser",
+            "rest_framework.parsers.MultiPartParser",
+        ],
+    }
+
+
+def _as_int(raw: str | None) -> int | None:
+    if raw is None or not raw.strip():
+        return None
+    return int(raw)
+
+
 @dataclass(slots=True)
 class AppEnvironment:
     secret_key: str
@@ -73,7 +292,8 @@ class AppEnvironment:
     allowed_hosts: list[str]
     cors_allowed_origins: list[str]
     csrf_trusted_origins: list[str]
-    database: dict[str, str]
+    database: dict[str, Any]
+    cache: dict[str, str]
     email_backend: str
     email_host: str
     email_port: int
@@ -81,9 +301,26 @@ class AppEnvironment:
     email_host_password: str
     email_use_tls: bool
     email_use_ssl: bool
+    email_timeout: int | None
     default_from_email: str
     password_reset_url: str
     password_reset_token_expiry_minutes: int
+    search_backend: str
+    password_hash_pool_size: int
+    password_hash_max_pending: int | None
+    password_hashers: list[str]
+    password_hasher_params: dict[str, int | None]
+    search_postgres_config: str
+    throttle_rates: dict[str, str | None]
+    num_proxies: int
+    api_codecs: dict[str, list[str]]
+    compress_responses: bool
+    compress_min_bytes: int
+    prune_retention_days: dict[str, int]
+    server_timing: bool
+    metrics_dir: str
+    metrics_token: str
+    query_log_thresholds: dict[str, int]
 
 
 def load_environment() -> AppEnvironment:
@@ -128,6 +365,7 @@ def load_environment() -> AppEnvironment:
         cors_allowed_origins=cors_origins,
         csrf_trusted_origins=csrf_trusted,
         database=_build_database_config(),
+        cache=_build_cache_config(),
         email_backend=email_backend,
         email_host=email_host,
         email_port=email_port,
@@ -135,6 +373,7 @@ def load_environment() -> AppEnvironment:
         email_host_password=os.getenv("EMAIL_HOST_PASSWORD", ""),
         email_use_tls=email_use_tls,
         email_use_ssl=email_use_ssl,
+        email_timeout=_as_int(os.getenv("EMAIL_TIMEOUT")) or 10,
         default_from_email=os.getenv("DEFAULT_FROM_EMAIL", "AI Use Declaration <no-reply@example.com>"),
         password_reset_url=os.getenv(
             "PASSWORD_RESET_URL",
@@ -143,6 +382,55 @@ def load_environment() -> AppEnvironment:
         password_reset_token_expiry_minutes=int(
             os.getenv("PASSWORD_RESET_TOKEN_EXPIRY_MINUTES", "30")
         ),
+        password_hash_pool_size=int(os.getenv("PASSWORD_HASH_POOL_SIZE") or 2),
+        password_hash_max_pending=_as_int(os.getenv("PASSWORD_HASH_MAX_PENDING")),
+        password_hashers=_build_password_hashers(
+            (os.getenv("PASSWORD_HASHER") or "pbkdf2").strip().lower()
+        ),
+        password_hasher_params={
+            name: _as_int(os.getenv(name))
+            for name in (
+                "PASSWORD_PBKDF2_ITERATIONS",
+                "PASSWORD_ARGON2_TIME_COST",
+                "PASSWORD_ARGON2_MEMORY_COST",
+                "PASSWORD_ARGON2_PARALLELISM",
+                "PASSWORD_BCRYPT_ROUNDS",
+                "PASSWORD_SCRYPT_WORK_FACTOR",
+                "PASSWORD_SCRYPT_BLOCK_SIZE",
+                "PASSWORD_SCRYPT_PARALLELISM",
+            )
+        },
+        search_backend=(os.getenv("DJANGO_SEARCH_BACKEND") or "auto").strip().lower(),
+        search_postgres_config=os.getenv("DJANGO_SEARCH_POSTGRES_CONFIG", "simple"),
+        # An empty variable keeps the default; "off" disables that throttle.
+        throttle_rates={
+            scope: None if rate.strip().lower() == "off" else rate.strip()
+            for scope, default in _AUTH_THROTTLE_DEFAULTS.items()
+            for rate in [os.getenv(f"THROTTLE_{scope.upper()}") or default]
+        },
+        # Reverse proxies trusted to append to X-Forwarded-For; with 0 the
+        # throttles key on REMOTE_ADDR and ignore client-supplied headers.
+        num_proxies=_as_int(os.getenv("DJANGO_NUM_PROXIES")) or 0,
+        api_codecs=_build_api_codecs(
+            (os.getenv("DJANGO_JSON_BACKEND") or "stdlib").strip().lower()
+        ),
+        compress_responses=_as_bool(os.getenv("DJANGO_COMPRESS_RESPONSES"), True),
+        compress_min_bytes=_as_int(os.getenv("DJANGO_COMPRESS_MIN_BYTES")) or 1024,
+        server_timing=_as_bool(os.getenv("DJANGO_SERVER_TIMING"), debug_flag),
+        metrics_dir=os.getenv("DJANGO_METRICS_DIR", ""),
+        # /metrics is refused without a token unless DEBUG is on.
+        metrics_token=os.getenv("DJANGO_METRICS_TOKEN", ""),
+        query_log_thresholds={
+            name: default if value is None else value
+            for name, default in _QUERY_LOG_DEFAULTS.items()
+            for value in [_as_int(os.getenv(f"QUERY_LOG_{name.upper()}"))]
+        },
+        # Days to keep each kind of row around; 0 turns that cleanup off.
+        prune_retention_days={
+            name: default if days is None else days
+            for name, default in _PRUNE_RETENTION_DEFAULTS.items()
+            for days in [_as_int(os.getenv(f"PRUNE_{name.upper()}_DAYS"))]
+        },
     )
 
 
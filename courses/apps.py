@@ -4,3 +4,12 @@ class CoursesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'courses'
     verbose_name = 'Courses'
+
+    def ready(self):
+        from common.search import register_search_index
+
+        register_search_index(
+            self.get_model('Course'),
+            ('code', 'course_name', 'semester'),
+            substring_fields=('code', 'semester'),
+        )
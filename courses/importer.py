@@ -0,0 +1,442 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any
+
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Q
+from rest_framework import serializers
+
+from Assignment.models import Assignment
+from notifications.services import build_payload, send_notification_batch
+from notifications.utils import user_display_name
+from usersystem.models import User
+
+from .models import Course
+
+
+class CatalogueImportError(ValueError):
+    """Raised when an uploaded catalogue cannot be read at all."""
+
+
+# Flat (CSV/XLSX) column headers, normalised to lowercase alphanumerics.
+_COLUMN_ALIASES = {
+    "coursecode": "code",
+    "code": "code",
+    "coursename": "name",
+    "term": "term",
+    "semester": "term",
+    "courseterm": "term",
+    "coursedescription": "description",
+    "coordinator": "coordinator",
+    "coordinatorid": "coordinator",
+    "coordinatorusername": "coordinator",
+    "assignment": "assignmentName",
+    "assignmentname": "assignmentName",
+    "type": "assignmentType",
+    "assignmenttype": "assignmentType",
+    "assignmentdescription": "assignmentDescription",
+    "duedate": "dueDate",
+    "tutors": "tutors",
+    "tutorids": "tutors",
+    "tutorusernames": "tutors",
+}
+
+_due_date_field = serializers.DateTimeField()
+
+
+@dataclass
+class ImportResult:
+    courses_created: int = 0
+    courses_matched: int = 0
+    assignments_created: int = 0
+    tutor_links: int = 0
+    courses: list[dict[str, Any]] = field(default_factory=list)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "coursesCreated": self.courses_created,
+            "coursesMatched": self.courses_matched,
+            "assignmentsCreated": self.assignments_created,
+            "tutorLinks": self.tutor_links,
+            "courses": self.courses,
+        }
+
+
+def _normalize_header(value: Any) -> str:
+    return re.sub(r"[^a-z0-9]", "", str(value or "").lower())
+
+
+def _split_refs(value: Any) -> list[str]:
+    if value in (None, ""):
+        return []
+    if isinstance(value, (list, tuple)):
+        return [str(item).strip() for item in value if str(item).strip()]
+    return [item.strip() for item in re.split(r"[;,|]", str(value)) if item.strip()]
+
+
+def _rows_to_courses(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Group flat rows (one assignment per row) into nested course payloads."""
+    grouped: dict[tuple[str, str], dict[str, Any]] = {}
+    for raw in rows:
+        row = {}
+        for key, value in raw.items():
+            target = _COLUMN_ALIASES.get(_normalize_header(key))
+            if target and value not in (None, ""):
+                row[target] = value.strip() if isinstance(value, str) else value
+        if not row:
+            continue
+        key = (str(row.get("code", "")), str(row.get("term", "")))
+        course = grouped.setdefault(
+            key,
+            {
+                "code": row.get("code", ""),
+                "term": row.get("term", ""),
+                "assignments": [],
+            },
+        )
+        for attr in ("name", "description", "coordinator"):
+            if attr in row and attr not in course:
+                course[attr] = row[attr]
+        if row.get("assignmentName"):
+            course["assignments"].append(
+                {
+                    "name": row["assignmentName"],
+                    "type": row.get("assignmentType", ""),
+                    "description": row.get("assignmentDescription", ""),
+                    "dueDate": row.get("dueDate"),
+                    "tutors": _split_refs(row.get("tutors")),
+                }
+            )
+    return list(grouped.values())
+
+
+def read_catalogue(request) -> list[dict[str, Any]]:
+    """
+    Extract course payloads from a JSON body ({"courses": [...]} or
+    {"rows": [...]}) or an uploaded .json, .csv or .xlsx file.
+    """
+    upload = request.FILES.get("file")
+    if upload is None:
+        data = request.data
+        if isinstance(data, dict) and isinstance(data.get("rows"), list):
+            return _rows_to_courses(data["rows"])
+        courses = data.get("courses") if isinstance(data, dict) else data
+        if not isinstance(courses, list):
+            raise CatalogueImportError("courses must be a list")
+        return courses
+
+    name = (upload.name or "").lower()
+    try:
+        if name.endswith(".json"):
+            data = json.load(upload)
+            return data.get("courses", []) if isinstance(data, dict) else data
+        if name.endswith(".xlsx"):
+            from openpyxl import load_workbook
+
+            workbook = load_workbook(
+                io.BytesIO(upload.read()), read_only=True, data_only=True
+            )
+            sheet_rows = workbook.active.iter_rows(values_only=True)
+            headers = next(sheet_rows, None) or ()
+            rows = [dict(zip(headers, values)) for values in sheet_rows]
+            return _rows_to_courses(rows)
+        text = io.TextIOWrapper(upload, encoding="utf-8-sig")
+        return _rows_to_courses(list(csv.DictReader(text)))
+    except CatalogueImportError:
+        raise
+    except Exception as exc:
+        raise CatalogueImportError(f"could not read {upload.name}: {exc}") from exc
+
+
+def _as_pk(value: Any) -> int | None:
+    try:
+        return int(str(value).strip())
+    except (TypeError, ValueError):
+        return None
+
+
+def _load_users(refs: set[str], role: str) -> dict[str, User]:
+    """
+    Resolve a mix of ids and usernames for one role with a single query.
+    Inactive accounts are left out, so callers report them like unknown ones.
+    """
+    if not refs:
+        return {}
+    pks = {pk for pk in (_as_pk(ref) for ref in refs) if pk is not None}
+    users = User.objects.filter(role=role, status=User.STATUS_ACTIVE).filter(
+        Q(pk__in=pks) | Q(username__in=refs)
+    )
+    lookup: dict[str, User] = {}
+    for user in users:
+        lookup[str(user.pk)] = user
+        lookup[user.username] = user
+    return lookup
+
+
+def import_catalogue(courses: list[dict[str, Any]], actor: User) -> ImportResult:
+    """
+    Validate and create the courses, assignments and tutor links described by
+    ``courses`` in a fixed number of queries. Raises serializers.ValidationError
+    with every problem found; nothing is written unless the whole upload is valid.
+    """
+    if not courses:
+        raise serializers.ValidationError({"courses": ["no courses provided"]})
+
+    errors: dict[str, list[str]] = defaultdict(list)
+    is_sc = getattr(actor, "role", None) == "sc"
+
+    coordinator_refs = set()
+    tutor_refs = set()
+    for course in courses:
+        if not isinstance(course, dict):
+            raise serializers.ValidationError(
+                {"courses": ["each course must be an object"]}
+            )
+        if course.get("coordinator") or course.get("coordinatorId"):
+            coordinator_refs.add(
+                str(course.get("coordinatorId") or course["coordinator"])
+            )
+        for assignment in course.get("assignments") or []:
+            if isinstance(assignment, dict):
+                tutor_refs.update(
+                    _split_refs(assignment.get("tutorIds") or assignment.get("tutors"))
+                )
+
+    coordinators = _load_users(coordinator_refs, "sc")
+    tutors = _load_users(tutor_refs, "tutor")
+
+    keys = [
+        (str(course.get("code") or "").strip(), str(course.get("term") or "").strip())
+        for course in courses
+    ]
+    existing = {
+        (course.code, course.semester): course
+        for course in Course.objects.filter(
+            code__in={code for code, _ in keys},
+            semester__in={term for _, term in keys},
+        ).select_related("coordinator")
+    }
+
+    seen_keys = set()
+    new_courses: list[Course] = []
+    planned: list[tuple[tuple[str, str], list[tuple[Assignment, list[User]]]]] = []
+    for index, (course, key) in enumerate(zip(courses, keys)):
+        prefix = f"courses[{index}]"
+        code, term = key
+        if not code:
+            errors[f"{prefix}.code"].append("code is required")
+        if not term:
+            errors[f"{prefix}.term"].append("term is required")
+        if key in seen_keys:
+            errors[prefix].append("course listed more than once in this upload")
+        seen_keys.add(key)
+
+        coordinator_ref = course.get("coordinatorId") or course.get("coordinator")
+        coordinator = None
+        if coordinator_ref:
+            coordinator = coordinators.get(str(coordinator_ref))
+            if coordinator is None:
+                errors[f"{prefix}.coordinator"].append(
+                    "coordinator must be an active subject coordinator"
+                )
+        if is_sc:
+            if coordinator is not None and coordinator.pk != actor.pk:
+                errors[f"{prefix}.coordinator"].append(
+                    "subject coordinators can only import their own courses"
+                )
+            coordinator = actor
+
+        current = existing.get(key)
+        if current is not None:
+            if is_sc and current.coordinator_id != actor.pk:
+                errors[prefix].append("course belongs to another coordinator")
+        elif code and term:
+            name = str(course.get("name") or "").strip()
+            description = str(course.get("description") or "")
+            if not name:
+                errors[f"{prefix}.name"].append("name is required for new courses")
+            if len(code) > 20 or len(term) > 20 or len(name) > 120:
+                errors[prefix].append(
+                    "code/term must be at most 20 characters, name 120"
+                )
+            if len(description) > 160:
+                errors[f"{prefix}.description"].append(
+                    "description must be at most 160 characters"
+                )
+            new_courses.append(
+                Course(
+                    course_name=name,
+                    code=code,
+                    semester=term,
+                    description=description,
+                    coordinator=coordinator,
+                )
+            )
+
+        planned_assignments = []
+        for a_index, item in enumerate(course.get("assignments") or []):
+            a_prefix = f"{prefix}.assignments[{a_index}]"
+            if not isinstance(item, dict):
+                errors[a_prefix].append("assignment must be an object")
+                continue
+            name = str(item.get("name") or "").strip()
+            kind = str(item.get("type") or "").strip()
+            if not name:
+                errors[f"{a_prefix}.name"].append("name is required")
+            if not kind:
+                errors[f"{a_prefix}.type"].append("type is required")
+            if len(name) > 150 or len(kind) > 60:
+                errors[a_prefix].append("name must be at most 150 characters, type 60")
+            due_date = None
+            if item.get("dueDate"):
+                try:
+                    due_date = _due_date_field.to_internal_value(item["dueDate"])
+                except serializers.ValidationError as exc:
+                    errors[f"{a_prefix}.dueDate"].extend(str(e) for e in exc.detail)
+            assigned = []
+            for ref in _split_refs(item.get("tutorIds") or item.get("tutors")):
+                tutor = tutors.get(ref)
+                if tutor is None:
+                    errors[f"{a_prefix}.tutors"].append(
+                        f'"{ref}" is not an active tutor'
+                    )
+                elif tutor not in assigned:
+                    assigned.append(tutor)
+            planned_assignments.append(
+                (
+                    Assignment(
+                        name=name,
+                        type=kind,
+                        description=str(item.get("description") or ""),
+                        due_date=due_date,
+                    ),
+                    assigned,
+                )
+            )
+        planned.append((key, planned_assignments))
+
+    if errors:
+        raise serializers.ValidationError(dict(errors))
+
+    result = ImportResult(
+        courses_created=len(new_courses),
+        courses_matched=len(courses) - len(new_courses),
+    )
+    try:
+        with transaction.atomic():
+            Course.objects.bulk_create(new_courses)
+            # Re-read by natural key: not every backend returns ids from bulk_create.
+            course_map = {
+                (course.code, course.semester): course
+                for course in Course.objects.filter(
+                    code__in={code for code, _ in keys},
+                    semester__in={term for _, term in keys},
+                )
+                if (course.code, course.semester) in seen_keys
+            }
+
+            assignments = []
+            for key, planned_assignments in planned:
+                for assignment, _assigned in planned_assignments:
+                    assignment.course = course_map[key]
+                    assignments.append(assignment)
+            if connection.features.can_return_rows_from_bulk_insert:
+                Assignment.objects.bulk_create(assignments)
+            else:
+                for assignment in assignments:
+                    assignment.save()
+
+            Through = Assignment.tutors.through
+            links = [
+                Through(assignment_id=assignment.pk, user_id=tutor.pk)
+                for _key, planned_assignments in planned
+                for assignment, assigned in planned_assignments
+                for tutor in assigned
+            ]
+            Through.objects.bulk_create(links)
+
+            result.assignments_created = len(assignments)
+            result.tutor_links = len(links)
+            _notify_tutors(planned, actor)
+    except IntegrityError:
+        # Another import created some of these courses after the check above.
+        taken = sorted(
+            f"{course.code} {course.semester}"
+            for course in Course.objects.filter(
+                code__in={course.code for course in new_courses},
+                semester__in={course.semester for course in new_courses},
+            )
+            if (course.code, course.semester) in seen_keys
+            and (course.code, course.semester) not in existing
+        )
+        if not taken:
+            raise
+        raise serializers.ValidationError(
+            {"courses": [f"course {label} already exists" for label in taken]}
+        ) from None
+
+    for key, planned_assignments in planned:
+        course = course_map[key]
+        result.courses.append(
+            {
+                "id": str(course.pk),
+                "code": course.code,
+                "term": course.semester,
+                "created": key not in existing,
+                "assignmentIds": [
+                    str(assignment.pk) for assignment, _ in planned_assignments
+                ],
+            }
+        )
+    return result
+
+
+def _notify_tutors(planned, actor) -> None:
+    """One aggregated notification per tutor covering every new assignment."""
+    per_tutor: dict[int, tuple[User, list[Assignment]]] = {}
+    for _key, planned_assignments in planned:
+        for assignment, assigned in planned_assignments:
+            for tutor in assigned:
+                per_tutor.setdefault(tutor.pk, (tutor, []))[1].append(assignment)
+    if not per_tutor:
+        return
+
+    actor_name = user_display_name(actor, default="Coordinator")
+    entries = []
+    for tutor, assignments in per_tutor.values():
+        labels = []
+        for assignment in assignments:
+            course = assignment.course
+            course_label = " ".join(
+                part for part in [course.code, course.semester] if part
+            )
+            labels.append(f"{assignment.name} ({course_label})")
+        if len(assignments) == 1:
+            content = (
+                f"{actor_name} added you to the AI declaration template for "
+                f"{labels[0]}."
+            )
+        else:
+            content = (
+                f"{actor_name} added you to the AI declaration templates for "
+                f"{len(assignments)} assignments."
+            )
+        entries.append(
+            (
+                tutor,
+                build_payload(
+                    title="Template access granted",
+                    content=content,
+                    body="\n".join(labels),
+                    related_type="assignment",
+                    related_id=str(assignments[0].pk) if len(assignments) == 1 else "",
+                ),
+            )
+        )
+    send_notification_batch(entries)
@@ -2,6 +2,7 @@ from typing import Any, MutableMapping
 
 from rest_framework import serializers
 
+from common.serializers import ReadSerializer
 from usersystem.models import User
 
 from .models import Course
@@ -95,3 +96,28 @@ class CourseSerializer(serializers.ModelSerializer):
         if not coordinator:
             return ""
         return coordinator.name or coordinator.username
+
+
+class CourseReadSerializer(ReadSerializer):
+    """
+    Read-only twin of ``CourseSerializer`` for list responses, built by
+    attribute access. Expects ``coordinator`` to be selected.
+    """
+
+    datetime_format = "%Y-%m-%d %H:%M:%S"
+
+    def to_representation(self, instance):
+        coordinator = instance.coordinator
+        return {
+            "id": str(instance.pk),
+            "name": instance.course_name,
+            "code": instance.code,
+            "term": instance.semester,
+            "description": instance.description,
+            "coordinatorId": str(coordinator.pk) if coordinator is not None else "",
+            "coordinatorName": (
+                (coordinator.name or coordinator.username) if coordinator else ""
+            ),
+            "createdAt": self.datetime(instance.created_at),
+            "updatedAt": self.datetime(instance.updated_at),
+        }
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from typing import Any
+
+from django.db.models import Count, Q, QuerySet
+
+from Assignment.models import Assignment
+
+from .models import Course
+
+DECLARATION_STATUSES = [status for status, _label in Assignment.STATUS_CHOICES]
+
+
+def annotate_declaration_counts(queryset: QuerySet[Course]) -> QuerySet[Course]:
+    """
+    Attach per-status assignment counts to each course. The counts are computed
+    by a single aggregated query grouped by course.
+    """
+    status_counts = {
+        f"{status}_count": Count(
+            "assignments",
+            filter=Q(assignments__ai_declaration_status=status),
+        )
+        for status in DECLARATION_STATUSES
+    }
+    return queryset.annotate(
+        assignment_total=Count("assignments"),
+        **status_counts,
+    )
+
+
+def build_declaration_summary(course: Course) -> dict[str, Any]:
+    counts = {
+        status: getattr(course, f"{status}_count", 0) or 0
+        for status in DECLARATION_STATUSES
+    }
+    return {
+        "courseId": str(course.pk),
+        "code": course.code,
+        "name": course.course_name,
+        "term": course.semester,
+        "total": getattr(course, "assignment_total", 0) or 0,
+        "counts": counts,
+    }
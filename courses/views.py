@@ -1,8 +1,18 @@
 from rest_framework import viewsets, filters, status
+from rest_framework.decorators import action
+from rest_framework.generics import get_object_or_404
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 from .models import Course
-from .serializer import CourseSerializer
+from .importer import CatalogueImportError, import_catalogue, read_catalogue
+from .serializer import CourseReadSerializer, CourseSerializer
+from .services import (
+    DECLARATION_STATUSES,
+    annotate_declaration_counts,
+    build_declaration_summary,
+)
+from common.responses import error_response
+from common.search import FullTextSearchFilter
 from usersystem.permissions import ActiveUserPermission, RolePermission, resolve_active_user
 
 class DefaultPagination(PageNumberPagination):
@@ -11,11 +21,11 @@ class DefaultPagination(PageNumberPagination):
     max_page_size = 100
 
 class CourseViewSet(viewsets.ModelViewSet):
-    queryset = Course.objects.all()
+    queryset = Course.objects.select_related('coordinator')
     serializer_class = CourseSerializer
     permission_classes = [ActiveUserPermission, RolePermission]
     pagination_class = DefaultPagination
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [filters.OrderingFilter, FullTextSearchFilter]
     search_fields = ['code', 'course_name', 'semester']
     ordering_fields = ['created_at', 'updated_at', 'code', 'course_name', 'semester']
     ordering = ['-created_at']
@@ -43,7 +53,46 @@ class CourseViewSet(viewsets.ModelViewSet):
             qs = qs.filter(coordinator_id=coordinator_id)
         return qs
 
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return CourseReadSerializer
+        return super().get_serializer_class()
+
     def destroy(self, request, *args, **kwargs):
         instance = self.get_object()
         self.perform_destroy(instance)
         return Response({'message': 'deleted successfully'}, status=status.HTTP_200_OK)
+
+    @action(detail=True, methods=['get'], url_path='declaration-summary')
+    def declaration_summary(self, request, pk=None):
+        queryset = annotate_declaration_counts(self.get_queryset())
+        course = get_object_or_404(queryset, pk=pk)
+        return Response(build_declaration_summary(course), status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=['get'], url_path='summary')
+    def summary(self, request):
+        queryset = annotate_declaration_counts(
+            self.filter_queryset(self.get_queryset())
+        )
+        results = [build_declaration_summary(course) for course in queryset]
+        totals = {declaration: 0 for declaration in DECLARATION_STATUSES}
+        for item in results:
+            for declaration, count in item['counts'].items():
+                totals[declaration] += count
+        return Response(
+            {
+                'results': results,
+                'total': sum(item['total'] for item in results),
+                'counts': totals,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    @action(detail=False, methods=['post'], url_path='import')
+    def bulk_import(self, request):
+        try:
+            courses = read_catalogue(request)
+        except CatalogueImportError as exc:
+            return error_response(str(exc), status_code=status.HTTP_400_BAD_REQUEST)
+        result = import_catalogue(courses, resolve_active_user(request))
+        return Response(result.as_dict(), status=status.HTTP_201_CREATED)
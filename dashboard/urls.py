@@ -0,0 +1,8 @@
+from django.urls import path
+
+from .views import BootstrapView
+
+urlpatterns = [
+    path("bootstrap", BootstrapView.as_view(), name="bootstrap"),
+    path("bootstrap/", BootstrapView.as_view(), name="bootstrap-slash"),
+]
@@ -0,0 +1,109 @@
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from AIUseScale.models import ScaleRecord
+from AIUseScale.serializer import ScaleVersionReadSerializer
+from Assignment.models import Assignment
+from Assignment.serializer import AssignmentReadSerializer
+from courses.models import Course
+from courses.serializer import CourseReadSerializer
+from notifications.models import Notification
+from usersystem.permissions import ActiveUserPermission, resolve_active_user
+from usersystem.serializer import SelfProfileSerializer
+
+ASSIGNMENT_PAGE_SIZE = 10
+MAX_ASSIGNMENT_PAGE_SIZE = 100
+
+
+class BootstrapView(APIView):
+    """
+    Everything the SPA needs after login in a single round trip. The acting
+    user and the coordinator's courses are resolved once and reused by the
+    assignment and scale lookups.
+    """
+
+    permission_classes = [ActiveUserPermission]
+
+    def get(self, request):
+        user = resolve_active_user(request)
+        role = getattr(user, "role", None)
+        courses = self._load_courses(user)
+        current_scale = (
+            self._load_current_scale(user) if role in {"admin", "sc"} else None
+        )
+
+        return Response(
+            {
+                "user": SelfProfileSerializer(user).data,
+                "unreadCount": Notification.objects.filter(
+                    recipient=user, is_read=False
+                ).count(),
+                "courses": (
+                    CourseReadSerializer(courses, many=True).data
+                    if courses is not None
+                    else []
+                ),
+                "assignments": self._load_assignments(request, user, courses),
+                "currentScale": current_scale,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    def _page_size(self, request):
+        try:
+            size = int(request.query_params.get("page_size", ASSIGNMENT_PAGE_SIZE))
+        except (TypeError, ValueError):
+            return ASSIGNMENT_PAGE_SIZE
+        return max(1, min(size, MAX_ASSIGNMENT_PAGE_SIZE))
+
+    def _load_courses(self, user):
+        role = getattr(user, "role", None)
+        if role not in {"admin", "sc"}:
+            return None
+        queryset = Course.objects.select_related("coordinator").order_by("-created_at")
+        if role == "sc":
+            queryset = queryset.filter(coordinator=user)
+        return list(queryset)
+
+    def _load_assignments(self, request, user, courses):
+        queryset = Assignment.objects.select_related("course").order_by("-created_at")
+        role = getattr(user, "role", None)
+        if role == "sc":
+            queryset = queryset.filter(course_id__in=[course.pk for course in courses])
+        elif role == "tutor":
+            queryset = queryset.filter(tutors=user)
+        elif role != "admin":
+            return {"count": 0, "results": []}
+
+        total = queryset.count()
+        page = list(queryset.prefetch_related("tutors")[: self._page_size(request)])
+        return {
+            "count": total,
+            "results": AssignmentReadSerializer(page, many=True).data,
+        }
+
+    def _load_current_scale(self, user):
+        record = None
+        if getattr(user, "role", None) == "sc":
+            record = ScaleRecord.objects.owned_by(user).order_by("-updated_at").first()
+        if record is None:
+            record = ScaleRecord.objects.system().order_by("-updated_at").first()
+        if record is None:
+            return None
+
+        latest = (
+            record.versions.prefetch_related("levels__content")
+            .order_by("-version")
+            .first()
+        )
+        return {
+            "id": str(record.pk),
+            "name": record.name,
+            "ownerType": record.owner_type,
+            "ownerId": record.owner_id,
+            "isPublic": record.is_public,
+            "currentVersion": (
+                ScaleVersionReadSerializer(latest).data if latest else None
+            ),
+        }
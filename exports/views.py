@@ -1,7 +1,9 @@
+import time
 from io import BytesIO
 from django.http import HttpResponse
 from rest_framework.views import APIView
 
+from common import metrics
 from usersystem.permissions import ActiveUserPermission
 
 from .serializer import ExportTableSerializer
@@ -13,10 +15,29 @@ from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, Tabl
 
 import pandas as pd
 
+EXPORT_DURATION = metrics.histogram(
+    "export_duration_seconds",
+    "Time taken to render an export file.",
+    ("format",),
+)
+EXPORT_BYTES = metrics.histogram(
+    "export_size_bytes",
+    "Size of rendered export files.",
+    ("format",),
+    buckets=(1e3, 1e4, 1e5, 1e6, 5e6, 1e7, 5e7),
+)
+
+
+def _record_export(fmt, started, payload):
+    EXPORT_DURATION.observe(time.perf_counter() - started, format=fmt)
+    EXPORT_BYTES.observe(len(payload), format=fmt)
+
+
 class ExportExcelView(APIView):
     permission_classes = [ActiveUserPermission]
 
     def post(self, request):
+        started = time.perf_counter()
         ser = ExportTableSerializer(data=request.data)
         ser.is_valid(raise_exception=True)
         title = ser.validated_data['title']
@@ -54,8 +75,10 @@ class ExportExcelView(APIView):
 
         bio.seek(0)
         filename = f"{title}.xlsx".replace('/', '_')
+        payload = bio.getvalue()
+        _record_export('xlsx', started, payload)
         resp = HttpResponse(
-            bio.getvalue(),
+            payload,
             content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
         )
         resp['Content-Disposition'] = f'attachment; filename="{filename}"'
@@ -65,6 +88,7 @@ class ExportExcelView(APIView):
 class ExportPDFView(APIView):
     permission_classes = [ActiveUserPermission]
     def post(self, request):
+        started = time.perf_counter()
         ser = ExportTableSerializer(data=request.data)
         ser.is_valid(raise_exception=True)
         title = ser.validated_data['title']
@@ -121,6 +145,8 @@ class ExportPDFView(APIView):
         bio.seek(0)
 
         filename = f"{title}.pdf".replace('/', '_')
-        resp = HttpResponse(bio.getvalue(), content_type='application/pdf')
+        payload = bio.getvalue()
+        _record_export('pdf', started, payload)
+        resp = HttpResponse(payload, content_type='application/pdf')
         resp['Content-Disposition'] = f'attachment; filename="{filename}"'
         return resp
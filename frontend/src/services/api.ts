@@ -283,6 +283,24 @@ export interface ScaleRecord {
   history: ScaleVersion[];
 }
 
+export interface ScaleLevelChange {
+  id: string;
+  fromPosition: number;
+  toPosition: number;
+  moved: boolean;
+  fields: Record<string, { from: string | null; to: string | null }>;
+}
+
+export interface ScaleVersionDiff {
+  recordId: string;
+  from: number;
+  to: number;
+  added: ScaleLevel[];
+  removed: ScaleLevel[];
+  changed: ScaleLevelChange[];
+  unchanged: string[];
+}
+
 export interface CreateScaleRecordRequest {
   name: string;
   ownerType: 'system' | 'sc';
@@ -309,6 +327,14 @@ export const ScaleRecordsAPI = {
   saveVersion(payload: SaveScaleVersionRequest & { updatedBy?: string }) {
     return http.post<ScaleRecord>('/scale-records/save_version/', payload);
   },
+  version(id: string, version: number) {
+    return http.get<ScaleVersion>(`/scale-records/${id}/versions/${version}/`);
+  },
+  diff(id: string, from: number, to: number) {
+    return http.get<ScaleVersionDiff>(`/scale-records/${id}/diff/`, {
+      params: { from, to },
+    });
+  },
 };
 
 export interface NotificationItem {
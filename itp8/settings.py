@@ -27,10 +27,14 @@ INSTALLED_APPS = [
     'template',
     'exports',
     'notifications',
+    'dashboard',
+    'benchmarks',
 
 ]
 
 MIDDLEWARE = [
+    # Listed first so it compresses the response every other middleware built.
+    *(['common.compression.CompressionMiddleware'] if env.compress_responses else []),
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -38,8 +42,18 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'common.middleware.QueryInstrumentationMiddleware',
 ]
 
+COMPRESS_RESPONSES = env.compress_responses
+COMPRESS_MIN_BYTES = env.compress_min_bytes
+SERVER_TIMING = env.server_timing
+METRICS_DIR = env.metrics_dir
+METRICS_TOKEN = env.metrics_token
+# max_queries, max_db_ms, max_duplicates and slow_query_ms thresholds read by
+# common.middleware.
+QUERY_LOG_THRESHOLDS = env.query_log_thresholds
+
 ROOT_URLCONF = 'itp8.urls'
 
 TEMPLATES = [
@@ -67,6 +81,9 @@ DATABASES = {
 }
 
 
+PASSWORD_HASHERS = env.password_hashers
+# Optional PASSWORD_<ALGORITHM>_<PARAMETER> cost overrides read by usersystem.hashers.
+PASSWORD_HASHER_PARAMS = env.password_hasher_params
 
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -114,9 +131,14 @@ REST_FRAMEWORK = {
         'usersystem.authentication.BearerTokenAuthentication',
         'rest_framework.authentication.SessionAuthentication',
         'rest_framework.authentication.BasicAuthentication',
-    )
+    ),
+    'DEFAULT_THROTTLE_RATES': env.throttle_rates,
+    'NUM_PROXIES': env.num_proxies,
+    **env.api_codecs,
 }
 
+CACHES = {'default': env.cache}
+
 
 
 STATIC_URL = 'static/'
@@ -132,10 +154,17 @@ EMAIL_HOST_USER = env.email_host_user
 EMAIL_HOST_PASSWORD = env.email_host_password
 EMAIL_USE_TLS = env.email_use_tls
 EMAIL_USE_SSL = env.email_use_ssl
+EMAIL_TIMEOUT = env.email_timeout
 DEFAULT_FROM_EMAIL = env.default_from_email
 
 PASSWORD_RESET_TOKEN_EXPIRY_MINUTES = env.password_reset_token_expiry_minutes
 PASSWORD_RESET_URL = env.password_reset_url
+PRUNE_RETENTION_DAYS = env.prune_retention_days
+PASSWORD_HASH_POOL_SIZE = env.password_hash_pool_size
+PASSWORD_HASH_MAX_PENDING = env.password_hash_max_pending
+
+SEARCH_BACKEND = env.search_backend
+SEARCH_POSTGRES_CONFIG = env.search_postgres_config
 
 CORS_ALLOWED_ORIGINS = env.cors_allowed_origins
 CSRF_TRUSTED_ORIGINS = env.csrf_trusted_origins
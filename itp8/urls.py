@@ -1,7 +1,10 @@
 from django.contrib import admin
 from django.urls import include, path
 
+from common.views import metrics_view
+
 from usersystem.views import (
+    AdminUserBulkView,
     AdminUserDetailView,
     AdminUserListView,
     AdminUserStatusView,
@@ -16,6 +19,12 @@ from usersystem.views import (
 urlpatterns = [
     path('admin/users', AdminUserListView.as_view(), name='admin-user-list'),
     path('admin/users/', AdminUserListView.as_view(), name='admin-user-list-slash'),
+    path('admin/users/bulk', AdminUserBulkView.as_view(), name='admin-user-bulk'),
+    path(
+        'admin/users/bulk/',
+        AdminUserBulkView.as_view(),
+        name='admin-user-bulk-slash',
+    ),
     path(
         'admin/users/<int:user_id>',
         AdminUserDetailView.as_view(),
@@ -76,5 +85,7 @@ urlpatterns = [
     path('', include('Assignment.urls')),
     path('', include('courses.urls')),
     path('', include('notifications.urls')),
+    path('', include('dashboard.urls')),
     path('export/', include('exports.urls')),  # export/excel/ or export/pdf/
+    path('metrics', metrics_view, name='metrics'),
 ]
@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import Notification
+from .models import Notification, OutboundEmail
 
 
 @admin.register(Notification)
@@ -8,3 +8,18 @@ class NotificationAdmin(admin.ModelAdmin):
     list_display = ("title", "recipient", "related_type", "is_read", "created_at")
     list_filter = ("related_type", "is_read", "created_at")
     search_fields = ("title", "content", "recipient__username", "recipient__name")
+
+
+@admin.register(OutboundEmail)
+class OutboundEmailAdmin(admin.ModelAdmin):
+    list_display = (
+        "subject",
+        "to_address",
+        "category",
+        "status",
+        "attempts",
+        "created_at",
+    )
+    list_filter = ("status", "category")
+    search_fields = ("to_address", "subject")
+    exclude = ("body",)
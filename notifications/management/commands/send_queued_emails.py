@@ -0,0 +1,57 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from notifications.outbox import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_MAX_ATTEMPTS,
+    claim_batch,
+    deliver_batch,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Deliver queued outbound emails in batches over one mail connection. "
+        "Runs once by default; --loop keeps polling the outbox."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+        parser.add_argument("--max-attempts", type=int, default=DEFAULT_MAX_ATTEMPTS)
+        parser.add_argument("--loop", action="store_true")
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=2.0,
+            help="Seconds to sleep between polls when the outbox is empty.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options["batch_size"])
+        totals = {"sent": 0, "retried": 0, "failed": 0}
+        try:
+            while True:
+                close_old_connections()
+                batch = claim_batch(batch_size)
+                report = deliver_batch(batch, max_attempts=options["max_attempts"])
+                for key in totals:
+                    totals[key] += getattr(report, key)
+                if report.claimed:
+                    self.stdout.write(
+                        f"claimed={report.claimed} sent={report.sent} "
+                        f"retried={report.retried} failed={report.failed}"
+                    )
+                if not options["loop"]:
+                    if report.claimed < batch_size:
+                        break
+                elif report.claimed < batch_size:
+                    time.sleep(options["interval"])
+        except KeyboardInterrupt:
+            pass
+        self.stdout.write(
+            self.style.SUCCESS(
+                "sent={sent} retried={retried} failed={failed}".format(**totals)
+            )
+        )
@@ -0,0 +1,115 @@
+import asyncio
+import email
+from email import policy
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+
+
+class SMTPSink:
+    """
+    Minimal SMTP server that accepts every message and prints or stores it.
+    Only meant for local debugging; there is no auth, TLS or size limit.
+    """
+
+    def __init__(self, stdout, outdir: Path | None = None, delay: float = 0.0):
+        self.stdout = stdout
+        self.outdir = outdir
+        self.delay = delay
+        self.received = 0
+
+    async def handle(self, reader, writer):
+        await self._reply(writer, "220 smtp-sink ready")
+        sender, recipients = None, []
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            command = line.decode("utf-8", "replace").strip()
+            verb = command.split(" ", 1)[0].upper()
+            if verb == "EHLO":
+                await self._reply(writer, "250-smtp-sink", "250 8BITMIME")
+            elif verb == "HELO":
+                await self._reply(writer, "250 smtp-sink")
+            elif verb == "MAIL":
+                sender, recipients = command[10:].strip(), []
+                await self._reply(writer, "250 OK")
+            elif verb == "RCPT":
+                recipients.append(command[8:].strip())
+                await self._reply(writer, "250 OK")
+            elif verb == "DATA":
+                await self._reply(writer, "354 End data with <CR><LF>.<CR><LF>")
+                data = await self._read_data(reader)
+                if self.delay:
+                    await asyncio.sleep(self.delay)
+                self._deliver(sender, recipients, data)
+                await self._reply(writer, "250 OK queued")
+            elif verb in {"RSET", "NOOP"}:
+                if verb == "RSET":
+                    sender, recipients = None, []
+                await self._reply(writer, "250 OK")
+            elif verb == "QUIT":
+                await self._reply(writer, "221 Bye")
+                break
+            else:
+                await self._reply(writer, "502 Command not implemented")
+        writer.close()
+
+    async def _reply(self, writer, *lines):
+        writer.write("".join(f"{line}\r\n" for line in lines).encode())
+        await writer.drain()
+
+    async def _read_data(self, reader) -> bytes:
+        lines = []
+        while True:
+            line = await reader.readline()
+            if not line or line in {b".\r\n", b".\n"}:
+                break
+            # Undo SMTP dot-stuffing.
+            lines.append(line[1:] if line.startswith(b"..") else line)
+        return b"".join(lines)
+
+    def _deliver(self, sender, recipients, data: bytes) -> None:
+        self.received += 1
+        message = email.message_from_bytes(data, policy=policy.default)
+        self.stdout.write(
+            f"#{self.received} from={sender} to={', '.join(recipients)} "
+            f"subject={message['subject']!r}"
+        )
+        if self.outdir is not None:
+            path = self.outdir / f"{self.received:05d}.eml"
+            path.write_bytes(data)
+
+
+class Command(BaseCommand):
+    help = (
+        "Run a local SMTP server that accepts and logs every message, for use "
+        "with EMAIL_HOST=127.0.0.1 and EMAIL_USE_TLS=false while developing."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default="127.0.0.1")
+        parser.add_argument("--port", type=int, default=1025)
+        parser.add_argument("--outdir", help="Also save each message as .eml here.")
+        parser.add_argument(
+            "--delay",
+            type=float,
+            default=0.0,
+            help="Seconds to wait before accepting each message (simulates slow SMTP).",
+        )
+
+    def handle(self, *args, **options):
+        outdir = Path(options["outdir"]) if options["outdir"] else None
+        if outdir is not None:
+            outdir.mkdir(parents=True, exist_ok=True)
+        sink = SMTPSink(self.stdout, outdir=outdir, delay=options["delay"])
+        try:
+            asyncio.run(self._serve(sink, options["host"], options["port"]))
+        except KeyboardInterrupt:
+            pass
+
+    async def _serve(self, sink, host, port):
+        server = await asyncio.start_server(sink.handle, host, port)
+        self.stdout.write(f"SMTP sink listening on {host}:{port}")
+        async with server:
+            await server.serve_forever()
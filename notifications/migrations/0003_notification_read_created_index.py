@@ -0,0 +1,20 @@
+# Generated by Django 5.0.6 on 2026-10-19 15:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notifications", "0002_outboundemail"),
+        ("usersystem", "0010_passwordresettoken_expires_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                fields=["is_read", "created_at"], name="notificatio_is_read_3a06ff_idx"
+            ),
+        ),
+    ]
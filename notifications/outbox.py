@@ -0,0 +1,178 @@
+"""
+Email outbox: handlers call ``queue_email`` inside their transaction and the
+``send_queued_emails`` command delivers the rows in batches over a single SMTP
+connection, retrying failures with exponential backoff.
+"""
+
+from __future__ import annotations
+
+import logging
+import smtplib
+from dataclasses import dataclass, field
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import connection, transaction
+from django.utils import timezone
+
+from common import metrics
+
+from .models import OutboundEmail
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_MAX_ATTEMPTS = 5
+RETRY_BASE_SECONDS = 30
+# Rows claimed by a worker that died mid-batch become eligible again after this.
+CLAIM_TIMEOUT = timedelta(minutes=10)
+
+DELIVERIES = metrics.counter(
+    "outbound_email_deliveries_total",
+    "Outbox delivery attempts by outcome.",
+    ("result",),
+)
+
+
+def queue_email(
+    to_address: str,
+    subject: str,
+    body: str,
+    *,
+    category: str = "",
+    from_email: str | None = None,
+) -> OutboundEmail:
+    return OutboundEmail.objects.create(
+        to_address=to_address,
+        subject=subject,
+        body=body,
+        category=category,
+        from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+    )
+
+
+@dataclass
+class DeliveryReport:
+    claimed: int = 0
+    sent: int = 0
+    retried: int = 0
+    failed: int = 0
+    errors: list[str] = field(default_factory=list)
+
+
+def retry_delay(attempts: int) -> timedelta:
+    return timedelta(seconds=RETRY_BASE_SECONDS * 2 ** max(0, attempts - 1))
+
+
+def claim_batch(batch_size: int = DEFAULT_BATCH_SIZE) -> list[OutboundEmail]:
+    """
+    Mark up to ``batch_size`` due rows as sending and return them. Concurrent
+    workers skip rows another worker has locked where the database supports it.
+    """
+    now = timezone.now()
+    due = OutboundEmail.objects.filter(
+        status=OutboundEmail.STATUS_PENDING, next_attempt_at__lte=now
+    ) | OutboundEmail.objects.filter(
+        status=OutboundEmail.STATUS_SENDING, claimed_at__lt=now - CLAIM_TIMEOUT
+    )
+    with transaction.atomic():
+        if connection.features.has_select_for_update_skip_locked:
+            due = due.select_for_update(skip_locked=True)
+        batch = list(due.order_by("next_attempt_at", "id")[:batch_size])
+        if batch:
+            OutboundEmail.objects.filter(pk__in=[row.pk for row in batch]).update(
+                status=OutboundEmail.STATUS_SENDING, claimed_at=now
+            )
+    return batch
+
+
+def _build_message(row: OutboundEmail, smtp) -> EmailMessage:
+    return EmailMessage(
+        subject=row.subject,
+        body=row.body,
+        from_email=row.from_email or settings.DEFAULT_FROM_EMAIL,
+        to=[row.to_address],
+        connection=smtp,
+    )
+
+
+def _mark_sent(row: OutboundEmail) -> None:
+    # The body is cleared once delivered; reset mails carry a live token.
+    OutboundEmail.objects.filter(pk=row.pk).update(
+        status=OutboundEmail.STATUS_SENT,
+        sent_at=timezone.now(),
+        attempts=row.attempts + 1,
+        body="",
+        last_error="",
+        claimed_at=None,
+    )
+
+
+def _mark_failed(row: OutboundEmail, error: Exception, max_attempts: int) -> bool:
+    attempts = row.attempts + 1
+    give_up = attempts >= max_attempts
+    changes = {
+        "status": OutboundEmail.STATUS_PENDING,
+        "attempts": attempts,
+        "next_attempt_at": timezone.now() + retry_delay(attempts),
+        "last_error": f"{type(error).__name__}: {error}"[:2000],
+        "claimed_at": None,
+    }
+    if give_up:
+        # Never sent again, so drop the body as _mark_sent does.
+        changes.update(status=OutboundEmail.STATUS_FAILED, body="")
+    OutboundEmail.objects.filter(pk=row.pk).update(**changes)
+    return give_up
+
+
+def deliver_batch(
+    batch: list[OutboundEmail], *, max_attempts: int = DEFAULT_MAX_ATTEMPTS
+) -> DeliveryReport:
+    """
+    Send ``batch`` over one backend connection. Each message is sent on its own
+    so a rejected recipient only fails that row; a dropped connection is
+    reopened once per message before the row counts as failed.
+    """
+    report = DeliveryReport(claimed=len(batch))
+    if not batch:
+        return report
+    smtp = get_connection(fail_silently=False)
+    try:
+        smtp.open()
+    except Exception as exc:
+        logger.warning("Could not connect to the mail server: %s", exc)
+        for row in batch:
+            _record_failure(report, row, exc, max_attempts)
+        return report
+    try:
+        for row in batch:
+            message = _build_message(row, smtp)
+            try:
+                try:
+                    smtp.send_messages([message])
+                except smtplib.SMTPServerDisconnected:
+                    smtp.close()
+                    smtp.open()
+                    smtp.send_messages([message])
+            except Exception as exc:
+                _record_failure(report, row, exc, max_attempts)
+                continue
+            _mark_sent(row)
+            report.sent += 1
+            DELIVERIES.inc(result="sent")
+    finally:
+        smtp.close()
+    return report
+
+
+def _record_failure(report, row, exc, max_attempts) -> None:
+    gave_up = _mark_failed(row, exc, max_attempts)
+    DELIVERIES.inc(result="failed" if gave_up else "retried")
+    if gave_up:
+        report.failed += 1
+        logger.error("Giving up on outbound email %s: %s", row.pk, exc)
+    else:
+        report.retried += 1
+        logger.warning("Outbound email %s will be retried: %s", row.pk, exc)
+    report.errors.append(f"{row.pk}: {exc}")
@@ -1,14 +1,21 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, Optional, Set
+from typing import Iterable, Optional, Sequence, Set
 
 from django.db import transaction
 
+from common import metrics
 from usersystem.models import User
 
 from .models import Notification
 
+FANOUT_SIZE = metrics.histogram(
+    "notification_fanout_recipients",
+    "Notifications created per fan-out batch.",
+    buckets=(1, 2, 5, 10, 25, 50, 100, 250, 500, 1000),
+)
+
 
 @dataclass
 class NotificationPayload:
@@ -19,16 +26,22 @@ class NotificationPayload:
     related_id: str = ""
 
 
+def _is_deliverable(candidate: Optional[User]) -> bool:
+    if candidate is None:
+        return False
+    if getattr(candidate, "status", User.STATUS_ACTIVE) != User.STATUS_ACTIVE:
+        return False
+    return getattr(candidate, "pk", None) is not None
+
+
 def _normalize_recipients(recipients: Iterable[Optional[User]]) -> list[User]:
     normalized: list[User] = []
     seen: Set[int] = set()
     for candidate in recipients:
-        if candidate is None:
+        if not _is_deliverable(candidate):
             continue
-        if getattr(candidate, "status", User.STATUS_ACTIVE) != User.STATUS_ACTIVE:
-            continue
-        pk = getattr(candidate, "pk", None)
-        if pk is None or pk in seen:
+        pk = candidate.pk
+        if pk in seen:
             continue
         seen.add(pk)
         normalized.append(candidate)
@@ -52,7 +65,25 @@ def send_notifications(
     if not users:
         return
 
-    payload = NotificationPayload(
+    payload = build_payload(
+        title=title,
+        content=content,
+        body=body,
+        related_type=related_type,
+        related_id=related_id,
+    )
+    send_notification_batch([(user, payload) for user in users])
+
+
+def build_payload(
+    *,
+    title: str,
+    content: str,
+    body: str = "",
+    related_type: str = "",
+    related_id: Optional[str] = None,
+) -> NotificationPayload:
+    return NotificationPayload(
         title=title.strip(),
         content=content.strip(),
         body=(body or "").strip(),
@@ -60,19 +91,31 @@ def send_notifications(
         related_id=str(related_id or "").strip(),
     )
 
-    def _create_entries():
-        Notification.objects.bulk_create(
-            [
-                Notification(
-                    recipient=user,
-                    title=payload.title,
-                    content=payload.content,
-                    body=payload.body,
-                    related_type=payload.related_type,
-                    related_id=payload.related_id,
-                )
-                for user in users
-            ]
+
+def send_notification_batch(
+    entries: Sequence[tuple[Optional[User], NotificationPayload]],
+) -> None:
+    """
+    Dispatch individually worded notifications with a single bulk insert once
+    the surrounding transaction commits. Inactive or missing users are skipped.
+    """
+    notifications = [
+        Notification(
+            recipient=user,
+            title=payload.title,
+            content=payload.content,
+            body=payload.body,
+            related_type=payload.related_type,
+            related_id=payload.related_id,
         )
+        for user, payload in entries
+        if _is_deliverable(user)
+    ]
+    if not notifications:
+        return
+
+    def _create_entries():
+        Notification.objects.bulk_create(notifications)
+        FANOUT_SIZE.observe(len(notifications))
 
     transaction.on_commit(_create_entries)
@@ -0,0 +1,24 @@
+import pytest
+from django.core.cache import cache
+
+from usersystem import hashing
+
+
+@pytest.fixture(autouse=True)
+def _isolated_services(settings, monkeypatch):
+    """
+    Private cache and fast, in-process password hashing for every test, so
+    throttle counters and cached payloads never leak between tests.
+    """
+    settings.CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "tests",
+        }
+    }
+    settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+    settings.PASSWORD_HASH_POOL_SIZE = 0
+    monkeypatch.setattr(hashing, "_pool", None)
+    cache.clear()
+    yield
+    cache.clear()
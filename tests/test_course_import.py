@@ -0,0 +1,97 @@
+import pytest
+from rest_framework import serializers
+
+from Assignment.models import Assignment
+from courses.importer import import_catalogue
+from courses.models import Course
+from usersystem.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def admin():
+    return User.objects.create(username="import-admin", role="admin")
+
+
+@pytest.fixture
+def tutors():
+    return [
+        User.objects.create(username="tutor-a", role="tutor"),
+        User.objects.create(
+            username="tutor-b", role="tutor", status=User.STATUS_INACTIVE
+        ),
+    ]
+
+
+def _course(**extra):
+    return {
+        "code": "COMP30022",
+        "term": "2030S1",
+        "name": "Software Project",
+        **extra,
+    }
+
+
+def _errors(excinfo):
+    return {
+        key: [str(item) for item in value]
+        for key, value in excinfo.value.detail.items()
+    }
+
+
+def test_import_creates_courses_assignments_and_links(admin, tutors):
+    payload = _course(
+        assignments=[{"name": "Essay", "type": "Essay", "tutors": ["tutor-a"]}]
+    )
+    result = import_catalogue([payload], admin)
+    assert (result.courses_created, result.assignments_created, result.tutor_links) == (
+        1,
+        1,
+        1,
+    )
+    assignment = Assignment.objects.get(name="Essay")
+    assert [user.username for user in assignment.tutors.all()] == ["tutor-a"]
+
+
+def test_description_length_is_validated_per_row(admin):
+    with pytest.raises(serializers.ValidationError) as excinfo:
+        import_catalogue([_course(description="x" * 161)], admin)
+    assert _errors(excinfo) == {
+        "courses[0].description": ["description must be at most 160 characters"]
+    }
+    assert not Course.objects.exists()
+
+
+def test_inactive_users_are_reported_like_unknown_ones(admin, tutors):
+    User.objects.create(
+        username="old-coordinator", role="sc", status=User.STATUS_INACTIVE
+    )
+    payload = _course(
+        coordinator="old-coordinator",
+        assignments=[{"name": "Essay", "type": "Essay", "tutors": ["tutor-b"]}],
+    )
+    with pytest.raises(serializers.ValidationError) as excinfo:
+        import_catalogue([payload], admin)
+    assert _errors(excinfo) == {
+        "courses[0].coordinator": ["coordinator must be an active subject coordinator"],
+        "courses[0].assignments[0].tutors": ['"tutor-b" is not an active tutor'],
+    }
+
+
+def test_concurrent_import_of_the_same_course_is_a_validation_error(admin, monkeypatch):
+    Course.objects.create(
+        course_name="Other import", code="COMP30022", semester="2030S1"
+    )
+    lookup = Course.objects.filter
+
+    def miss_first_lookup(*args, **kwargs):
+        # The pre-check runs before the other import commits its course.
+        monkeypatch.setattr(Course.objects, "filter", lookup)
+        return Course.objects.none()
+
+    monkeypatch.setattr(Course.objects, "filter", miss_first_lookup)
+    with pytest.raises(serializers.ValidationError) as excinfo:
+        import_catalogue([_course(), _course(code="INFO10001")], admin)
+    assert _errors(excinfo) == {"courses": ["course COMP30022 2030S1 already exists"]}
+    assert list(Course.objects.values_list("code", flat=True)) == ["COMP30022"]
@@ -0,0 +1,31 @@
+import pytest
+
+from config.environment import _build_connection_settings
+
+
+@pytest.fixture
+def db_env(monkeypatch):
+    for name in ("DJANGO_DB_CONN_MAX_AGE", "DJANGO_DB_CONN_HEALTH_CHECKS"):
+        monkeypatch.delenv(name, raising=False)
+    return monkeypatch
+
+
+@pytest.mark.parametrize("engine", ["sqlite", "postgresql", "mysql"])
+def test_connections_are_not_reused_by_default(db_env, engine):
+    settings = _build_connection_settings(engine)
+    assert (settings["CONN_MAX_AGE"], settings["CONN_HEALTH_CHECKS"]) == (0, False)
+
+
+@pytest.mark.parametrize(
+    "value, expected", [("60", (60, True)), ("none", (None, True)), ("0", (0, False))]
+)
+def test_reuse_is_opt_in_and_turns_on_health_checks(db_env, value, expected):
+    db_env.setenv("DJANGO_DB_CONN_MAX_AGE", value)
+    settings = _build_connection_settings("postgresql")
+    assert (settings["CONN_MAX_AGE"], settings["CONN_HEALTH_CHECKS"]) == expected
+
+
+def test_health_checks_can_be_turned_off(db_env):
+    db_env.setenv("DJANGO_DB_CONN_MAX_AGE", "60")
+    db_env.setenv("DJANGO_DB_CONN_HEALTH_CHECKS", "false")
+    assert _build_connection_settings("postgresql")["CONN_HEALTH_CHECKS"] is False
@@ -0,0 +1,38 @@
+import pytest
+from django.contrib.auth.hashers import check_password
+
+from itp8 import settings as project_settings
+from usersystem import hashing
+from usersystem.hashing import HashPoolSaturated, PasswordHashPool, hash_passwords
+
+PASSWORDS = [f"bulk-password-{index}" for index in range(20)]
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    pool = PasswordHashPool(workers=2, max_pending=4)
+    monkeypatch.setattr(hashing, "_pool", pool)
+    yield pool
+    pool.shutdown()
+
+
+def test_small_batches_hash_inline(pool):
+    hashes = hash_passwords(PASSWORDS[:3])
+    assert [check_password(raw, h) for raw, h in zip(PASSWORDS, hashes)] == [True] * 3
+    assert pool.stats()["submitted"] == 0
+
+
+def test_bulk_hashing_uses_one_job_per_pool_worker(pool, settings):
+    # Workers load the project settings, not the test overrides.
+    settings.PASSWORD_HASHERS = project_settings.PASSWORD_HASHERS
+    hashes = hash_passwords(PASSWORDS)
+    assert all(check_password(raw, h) for raw, h in zip(PASSWORDS, hashes))
+    stats = pool.stats()
+    assert (stats["submitted"], stats["completed"], stats["pending"]) == (2, 2, 0)
+
+
+def test_bulk_hashing_respects_the_pool_backlog(pool):
+    pool.max_pending = 1
+    with pytest.raises(HashPoolSaturated):
+        hash_passwords(PASSWORDS)
+    assert pool.stats()["rejected"] == 1
@@ -0,0 +1,112 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from common import metrics
+
+REQUESTS = metrics.counter("test_requests_total", "Test counter.", ("kind",))
+LATENCY = metrics.histogram("test_latency_seconds", "Test histogram.", buckets=(1,))
+WORKERS = metrics.gauge("test_workers", "Test gauge.")
+METRICS_URL = "/metrics"
+
+
+@pytest.fixture(autouse=True)
+def _reset_test_metrics():
+    for metric in (REQUESTS, LATENCY, WORKERS):
+        metric._values.clear()
+
+
+@pytest.fixture
+def metrics_dir(settings, tmp_path):
+    settings.METRICS_DIR = str(tmp_path)
+    return tmp_path
+
+
+def _dead_pid():
+    process = subprocess.Popen([sys.executable, "-c", ""])
+    process.wait()
+    return process.pid
+
+
+def _write_snapshot(directory, pid, requests, latency, workers):
+    data = {
+        "test_requests_total": {
+            **REQUESTS.snapshot(),
+            "samples": [[["api"], requests]],
+        },
+        "test_latency_seconds": {
+            **LATENCY.snapshot(),
+            "samples": [[[], {"buckets": latency, "sum": 0.5, "count": sum(latency)}]],
+        },
+        "test_workers": {**WORKERS.snapshot(), "samples": [[[], workers]]},
+    }
+    payload = {"pid": pid, "instance": "other", "metrics": data}
+    path = directory / f"metrics-{pid}-other.json"
+    path.write_text(json.dumps(payload))
+    return path
+
+
+def _value(merged, name, labels=()):
+    return dict(merged[name]["samples"])[tuple(labels)]
+
+
+def test_snapshots_merge_across_processes(metrics_dir):
+    REQUESTS.inc(kind="api")
+    WORKERS.set(1)
+    _write_snapshot(metrics_dir, os.getppid(), 2.0, [1, 0], 1.0)
+    _write_snapshot(metrics_dir, _dead_pid(), 4.0, [0, 3], 1.0)
+
+    merged = metrics.collect()
+    assert _value(merged, "test_requests_total", ["api"]) == 7.0
+    latency = _value(merged, "test_latency_seconds")
+    assert (latency["buckets"], latency["count"]) == ([1, 3], 4)
+    # Gauges only count processes that are still running.
+    assert _value(merged, "test_workers") == 2.0
+
+
+def test_dead_snapshots_are_retired_once(metrics_dir):
+    dead = _write_snapshot(metrics_dir, _dead_pid(), 4.0, [0, 3], 5.0)
+    assert _value(metrics.collect(), "test_requests_total", ["api"]) == 4.0
+    assert not dead.exists()
+    retired = json.loads((metrics_dir / "metrics-retired.json").read_text())
+    assert retired["metrics"]["test_workers"]["samples"] == []
+
+    second = _write_snapshot(metrics_dir, _dead_pid(), 1.0, [1, 0], 5.0)
+    merged = metrics.collect()
+    assert not second.exists()
+    assert _value(merged, "test_requests_total", ["api"]) == 5.0
+    assert _value(merged, "test_latency_seconds")["buckets"] == [1, 3]
+
+
+def test_render_outputs_cumulative_histogram_buckets():
+    LATENCY.observe(0.5)
+    LATENCY.observe(3)
+    text = metrics.render()
+    assert 'test_latency_seconds_bucket{le="1.0"} 1' in text
+    assert 'test_latency_seconds_bucket{le="+Inf"} 2' in text
+    assert "test_latency_seconds_count 2" in text
+
+
+def test_metrics_need_a_token_outside_debug(client, settings):
+    settings.DEBUG = False
+    settings.METRICS_TOKEN = ""
+    assert client.get(METRICS_URL).status_code == 403
+
+    settings.DEBUG = True
+    assert client.get(METRICS_URL).status_code == 200
+
+
+def test_metrics_token_is_checked(client, settings):
+    settings.DEBUG = True
+    settings.METRICS_TOKEN = "scrape-token"
+    assert client.get(METRICS_URL).status_code == 403
+    wrong = client.get(METRICS_URL, HTTP_AUTHORIZATION="Bearer nope")
+    assert wrong.status_code == 403
+
+    response = client.get(METRICS_URL, HTTP_AUTHORIZATION="Bearer scrape-token")
+    assert response.status_code == 200
+    assert response["Content-Type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE test_requests_total counter" in response.content.decode()
@@ -0,0 +1,105 @@
+import smtplib
+from datetime import timedelta
+
+import pytest
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.utils import timezone
+
+from notifications.models import OutboundEmail
+from notifications.outbox import (
+    CLAIM_TIMEOUT,
+    claim_batch,
+    deliver_batch,
+    queue_email,
+    retry_delay,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def queued():
+    return queue_email("tutor@example.com", "Reset", "token: secret", category="reset")
+
+
+@pytest.fixture
+def smtp_errors(monkeypatch):
+    """Exceptions raised by the next sends, in order; then sends succeed."""
+    errors = []
+    send = EmailBackend.send_messages
+
+    def send_messages(self, messages):
+        if errors:
+            raise errors.pop(0)
+        return send(self, messages)
+
+    monkeypatch.setattr(EmailBackend, "send_messages", send_messages)
+    return errors
+
+
+def _run(**kwargs):
+    return deliver_batch(claim_batch(), **kwargs)
+
+
+def _make_due(row):
+    OutboundEmail.objects.filter(pk=row.pk).update(next_attempt_at=timezone.now())
+
+
+def test_retry_delay_doubles_per_attempt():
+    assert [retry_delay(n).total_seconds() for n in range(1, 5)] == [30, 60, 120, 240]
+
+
+def test_delivered_rows_drop_their_body(queued, smtp_errors):
+    report = _run()
+    assert (report.claimed, report.sent) == (1, 1)
+    queued.refresh_from_db()
+    assert (queued.status, queued.attempts, queued.body) == ("sent", 1, "")
+    assert mail.outbox[0].body == "token: secret"
+
+
+def test_failures_back_off_until_the_row_is_due(queued, smtp_errors):
+    smtp_errors.append(smtplib.SMTPRecipientsRefused({}))
+    before = timezone.now()
+    report = _run()
+    assert (report.retried, report.failed) == (1, 0)
+
+    queued.refresh_from_db()
+    assert (queued.status, queued.attempts) == ("pending", 1)
+    assert queued.body == "token: secret"
+    assert queued.last_error.startswith("SMTPRecipientsRefused")
+    assert queued.next_attempt_at >= before + timedelta(seconds=30)
+    assert claim_batch() == []
+
+    _make_due(queued)
+    assert _run().sent == 1
+    assert mail.outbox[0].to == ["tutor@example.com"]
+
+
+def test_last_attempt_gives_up_and_drops_the_body(queued, smtp_errors):
+    smtp_errors.extend([OSError("refused"), OSError("refused")])
+    assert _run(max_attempts=2).retried == 1
+    _make_due(queued)
+    report = _run(max_attempts=2)
+    assert (report.retried, report.failed) == (0, 1)
+
+    queued.refresh_from_db()
+    assert (queued.status, queued.attempts, queued.body) == ("failed", 2, "")
+    assert queued.last_error == "OSError: refused"
+    _make_due(queued)
+    assert claim_batch() == []
+
+
+def test_dropped_connection_is_reopened_once(queued, smtp_errors):
+    smtp_errors.append(smtplib.SMTPServerDisconnected("gone"))
+    report = _run()
+    assert (report.sent, report.retried) == (1, 0)
+
+
+def test_stale_claims_are_picked_up_again(queued):
+    OutboundEmail.objects.filter(pk=queued.pk).update(
+        status=OutboundEmail.STATUS_SENDING,
+        claimed_at=timezone.now() - CLAIM_TIMEOUT - timedelta(seconds=1),
+    )
+    assert [row.pk for row in claim_batch()] == [queued.pk]
+    assert claim_batch() == []
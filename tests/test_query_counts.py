@@ -0,0 +1,81 @@
+"""
+Query-count regression tests: every API action is run against the small and
+the large seeded dataset and must stay within its budget in
+``benchmarks.querycounts``. A new per-row query shows up as growth between the
+two runs and fails unless the budget declares it.
+"""
+
+import pytest
+from django.core.cache import cache
+from django.test import Client
+from django.urls import URLPattern, URLResolver, get_resolver, resolve
+from rest_framework.routers import APIRootView
+
+from benchmarks.harness import load_context, prepare, send, warm_up
+from benchmarks.querycounts import BUDGETS, LARGE_SPEC, SMALL_SPEC, query_scenarios
+from benchmarks.seeding import seed_bench_data
+from benchmarks.utils import rolled_back
+
+pytestmark = pytest.mark.django_db
+
+HTTP_METHODS = ("get", "post", "put", "patch", "delete")
+
+
+def _count(spec, name, assert_max_queries) -> int:
+    with rolled_back():
+        seed_bench_data(spec)
+        scenarios = {s.name: s for s in query_scenarios(load_context())}
+        scenario = scenarios[name]
+        client = Client()
+        warm_up(client, scenario)
+        kwargs = prepare(scenario)
+        with assert_max_queries(BUDGETS[name].allowed(spec)) as captured:
+            send(client, scenario, kwargs)
+    cache.clear()
+    return len(captured)
+
+
+@pytest.mark.parametrize("name", sorted(BUDGETS))
+def test_query_budget(name, django_assert_max_num_queries):
+    small = _count(SMALL_SPEC, name, django_assert_max_num_queries)
+    large = _count(LARGE_SPEC, name, django_assert_max_num_queries)
+    budget = BUDGETS[name]
+    growth = budget.allowed(LARGE_SPEC) - budget.allowed(SMALL_SPEC)
+    assert large - small <= growth, f"{name}: {small} -> {large} queries"
+
+
+def test_every_scenario_has_a_budget():
+    seed_bench_data(SMALL_SPEC)
+    names = [scenario.name for scenario in query_scenarios(load_context())]
+    assert len(names) == len(set(names))
+    assert set(names) == set(BUDGETS)
+
+
+def _route_actions(patterns):
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from _route_actions(pattern.url_patterns)
+            continue
+        if not isinstance(pattern, URLPattern):
+            continue
+        view = getattr(pattern.callback, "cls", None)
+        if view is None or issubclass(view, APIRootView):
+            continue
+        actions = getattr(pattern.callback, "actions", None)
+        if actions:
+            yield from ((view, action) for action in actions.values())
+        else:
+            yield from ((view, m) for m in HTTP_METHODS if hasattr(view, m))
+
+
+def _scenario_action(scenario):
+    callback = resolve(scenario.path.split("?")[0]).func
+    actions = getattr(callback, "actions", None)
+    return callback.cls, actions[scenario.method] if actions else scenario.method
+
+
+def test_every_api_action_has_a_scenario():
+    seed_bench_data(SMALL_SPEC)
+    covered = {_scenario_action(s) for s in query_scenarios(load_context())}
+    missing = set(_route_actions(get_resolver().url_patterns)) - covered
+    assert not missing, sorted(f"{view.__name__}.{action}" for view, action in missing)
@@ -0,0 +1,175 @@
+"""
+Scale record access through the API: coordinators see the system scales and
+their own records only, may only change their own, and saving over a system
+scale forks it into a single personal record.
+"""
+
+import pytest
+
+from AIUseScale.models import ScaleRecord
+from benchmarks.harness import load_context
+from benchmarks.querycounts import SMALL_SPEC
+from benchmarks.seeding import bench_token, seed_bench_data
+from notifications.models import Notification
+from usersystem.models import User
+
+pytestmark = pytest.mark.django_db
+
+RECORDS_URL = "/scale-records/"
+
+
+@pytest.fixture
+def context():
+    seed_bench_data(SMALL_SPEC)
+    return load_context()
+
+
+@pytest.fixture
+def other_record(context):
+    """A record owned by a coordinator other than ``context.coordinator``."""
+    return (
+        ScaleRecord.objects.filter(owner_type=ScaleRecord.OWNER_SC)
+        .exclude(owner_user=context.coordinator)
+        .first()
+    )
+
+
+def _auth(user):
+    return {"HTTP_AUTHORIZATION": f"Bearer {bench_token(user.username)}"}
+
+
+def _levels(record):
+    version = record.versions.order_by("-version").first()
+    return [
+        {
+            "id": level.level_code,
+            "label": level.label,
+            "title": f"{level.title} (edited)",
+            "description": level.description,
+            "aiUsage": level.ai_usage,
+            "instructions": level.instructions,
+            "acknowledgement": level.acknowledgement,
+        }
+        for level in version.levels.select_related("content")
+    ]
+
+
+def _save_version(client, user, record):
+    return client.post(
+        f"{RECORDS_URL}save_version/",
+        {"scaleId": str(record.pk), "levels": _levels(record)},
+        content_type="application/json",
+        **_auth(user),
+    )
+
+
+def _listed_ids(client, user):
+    response = client.get(RECORDS_URL, {"nopage": "1"}, **_auth(user))
+    assert response.status_code == 200
+    return {row["id"] for row in response.json()}
+
+
+def test_coordinators_list_system_and_own_records(client, context, other_record):
+    listed = _listed_ids(client, context.coordinator)
+    own = ScaleRecord.objects.owned_by(context.coordinator)
+    expected = {str(pk) for pk in own.values_list("pk", flat=True)}
+    expected |= {
+        str(pk) for pk in ScaleRecord.objects.system().values_list("pk", flat=True)
+    }
+    assert listed == expected
+    assert str(other_record.pk) not in listed
+
+
+def test_admins_list_every_record(client, context):
+    assert len(_listed_ids(client, context.admin)) == ScaleRecord.objects.count()
+
+
+@pytest.mark.parametrize(
+    "suffix", ["", "versions/1/", "diff/?from=1&to=2"], ids=str.strip
+)
+def test_other_coordinators_records_are_not_found(
+    client, context, other_record, suffix
+):
+    url = f"{RECORDS_URL}{other_record.pk}/{suffix}"
+    assert client.get(url, **_auth(context.coordinator)).status_code == 404
+    assert client.get(url, **_auth(context.admin)).status_code == 200
+
+
+def test_coordinators_cannot_change_other_records(client, context, other_record):
+    url = f"{RECORDS_URL}{other_record.pk}/"
+    auth = _auth(context.coordinator)
+    response = client.patch(
+        url, {"name": "Taken over"}, content_type="application/json", **auth
+    )
+    assert response.status_code == 404
+    assert client.delete(url, **auth).status_code == 404
+    assert _save_version(client, context.coordinator, other_record).status_code == 403
+    other_record.refresh_from_db()
+    assert other_record.name != "Taken over"
+    assert other_record.versions.count() == SMALL_SPEC.versions_per_record
+
+
+def test_coordinators_cannot_change_system_records(client, context):
+    record = context.system_record
+    response = client.patch(
+        f"{RECORDS_URL}{record.pk}/",
+        {"name": "Renamed"},
+        content_type="application/json",
+        **_auth(context.coordinator),
+    )
+    assert response.status_code == 403
+
+
+@pytest.mark.parametrize("role", ["anonymous", "tutor"])
+def test_records_need_an_admin_or_coordinator(client, context, role):
+    auth = {} if role == "anonymous" else _auth(context.tutor)
+    record = context.system_record
+    assert client.get(RECORDS_URL, **auth).status_code == 403
+    assert client.get(f"{RECORDS_URL}{record.pk}/", **auth).status_code == 403
+    response = client.post(
+        f"{RECORDS_URL}save_version/",
+        {"scaleId": str(record.pk), "levels": _levels(record)},
+        content_type="application/json",
+        **auth,
+    )
+    assert response.status_code == 403
+    assert record.versions.count() == SMALL_SPEC.versions_per_record
+
+
+def test_saving_a_system_scale_forks_one_personal_record(client, context):
+    coordinator = context.coordinator
+    ScaleRecord.objects.owned_by(coordinator).delete()
+    system = context.system_record
+
+    first = _save_version(client, coordinator, system)
+    second = _save_version(client, coordinator, system)
+    assert (first.status_code, second.status_code) == (201, 201)
+
+    fork = ScaleRecord.objects.owned_by(coordinator).get()
+    assert first.json()["id"] == second.json()["id"] == str(fork.pk)
+    assert (fork.name, fork.owner_id) == (system.name, coordinator.username)
+    versions = fork.versions.order_by("version").values_list("version", flat=True)
+    assert list(versions) == [1, 2]
+    assert system.versions.count() == SMALL_SPEC.versions_per_record
+
+
+def test_personal_saves_notify_the_coordinators_tutors(
+    client, context, django_capture_on_commit_callbacks
+):
+    coordinator = context.coordinator
+    record = ScaleRecord.objects.owned_by(coordinator).first()
+    course_tutors = set(
+        User.objects.filter(
+            role="tutor", assignments__course__coordinator=coordinator
+        ).values_list("pk", flat=True)
+    )
+    assert course_tutors
+
+    with django_capture_on_commit_callbacks(execute=True):
+        assert _save_version(client, coordinator, record).status_code == 201
+    notified = set(
+        Notification.objects.filter(
+            title="Coordinator AI use scale updated", related_id=str(record.pk)
+        ).values_list("recipient", flat=True)
+    )
+    assert notified == course_tutors | {coordinator.pk}
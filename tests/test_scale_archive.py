@@ -0,0 +1,133 @@
+import gzip
+import io
+import re
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from AIUseScale.archive import COLUMNS, CONTENT, MAGIC, _read_frames, _write_frame
+from AIUseScale.models import ScaleLevel, ScaleLevelContent, ScaleRecord
+from benchmarks.querycounts import SMALL_SPEC
+from benchmarks.seeding import seed_bench_data
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def archive(tmp_path):
+    seed_bench_data(SMALL_SPEC)
+    path = tmp_path / "scales.bin"
+    call_command("dump_scales", str(path), "--batch-size", "2", stdout=io.StringIO())
+    return path
+
+
+def _catalogue():
+    records = ScaleRecord.objects.order_by("pk").values_list(
+        "pk", "name", "owner_type", "owner_user", "is_public", "created_at"
+    )
+    levels = ScaleLevel.objects.order_by("pk").values_list(
+        "pk",
+        "version__record",
+        "version__version",
+        "version__updated_at",
+        "position",
+        "level_code",
+        "content__digest",
+    )
+    return list(records), list(levels)
+
+
+def _load(path, *args):
+    out = io.StringIO()
+    call_command("load_scales", str(path), "--batch-size", "2", *args, stdout=out)
+    return dict(
+        line.split(": ") for line in out.getvalue().splitlines() if ": " in line
+    )
+
+
+def _rewrite(path, edit):
+    """Rewrite the archive at ``path`` with ``edit(frames)`` applied."""
+    with gzip.open(path, "rb") as archive:
+        assert archive.read(len(MAGIC)) == MAGIC
+        frames = list(_read_frames(archive))
+    with open(path, "wb") as stream, gzip.GzipFile(fileobj=stream, mode="wb") as out:
+        out.write(MAGIC)
+        for kind, rows in edit(frames):
+            _write_frame(out, kind, rows)
+
+
+def test_dump_and_load_round_trip(archive):
+    expected = _catalogue()
+    ScaleRecord.objects.all().delete()
+    ScaleLevelContent.objects.all().delete()
+
+    counts = _load(archive)
+    assert _catalogue() == expected
+    assert counts["records"] == str(len(expected[0]))
+    assert counts["levels"] == str(len(expected[1]))
+    assert (counts["replacedRecords"], counts["unmatchedOwners"]) == ("0", "0")
+
+
+def test_existing_records_need_replace(archive):
+    expected = _catalogue()
+    with pytest.raises(CommandError, match="use --replace"):
+        _load(archive)
+
+    counts = _load(archive, "--replace")
+    assert counts["replacedRecords"] == str(len(expected[0]))
+    assert _catalogue() == expected
+
+
+def test_owner_name_clashes_are_reported(archive):
+    record = ScaleRecord.objects.filter(owner_type=ScaleRecord.OWNER_SC).first()
+    owner = record.owner_user
+    record.delete()
+    ScaleRecord.objects.create(
+        name=record.name,
+        owner_type=ScaleRecord.OWNER_SC,
+        owner_id=owner.username,
+        owner_user=owner,
+    )
+    before = _catalogue()
+
+    clash = re.escape(f"'{record.name}' ({owner.username})")
+    with pytest.raises(CommandError, match=clash):
+        _load(archive, "--replace")
+    assert _catalogue() == before
+
+
+@pytest.mark.parametrize("keep", [1, 3], ids=["first-frame", "no-end-frame"])
+def test_truncated_archives_load_nothing(archive, keep):
+    _rewrite(archive, lambda frames: frames[:keep])
+    ScaleRecord.objects.all().delete()
+    with pytest.raises(CommandError, match="ends before its END frame"):
+        _load(archive)
+    assert not ScaleRecord.objects.exists()
+
+
+def test_cut_off_archives_are_rejected(archive):
+    with gzip.open(archive, "rb") as stream:
+        data = stream.read()
+    archive.write_bytes(gzip.compress(data[:-5]))
+    ScaleRecord.objects.all().delete()
+    with pytest.raises(CommandError, match="truncated"):
+        _load(archive)
+    assert not ScaleRecord.objects.exists()
+
+
+def test_tampered_content_is_rejected(archive):
+    label = COLUMNS[CONTENT].index("label")
+
+    def tamper(frames):
+        kind, rows = frames[0]
+        assert kind == CONTENT
+        rows[0][label] += " (edited)"
+        return frames
+
+    _rewrite(archive, tamper)
+    ScaleRecord.objects.all().delete()
+    ScaleLevelContent.objects.all().delete()
+    with pytest.raises(CommandError, match="does not match its text"):
+        _load(archive)
+    assert not ScaleLevelContent.objects.exists()
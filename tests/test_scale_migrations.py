@@ -0,0 +1,102 @@
+"""
+Data migrations of ai_use_scale run forwards over existing rows and back
+again: 0006 links SC records to their coordinator and 0008 renames duplicate
+names per owner before adding the unique constraint.
+"""
+
+import pytest
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+
+pytestmark = pytest.mark.django_db(transaction=True)
+
+APP = "ai_use_scale"
+BEFORE_LINK = [(APP, "0005_alter_scalelevel_uid")]
+AFTER_LINK = [(APP, "0006_scalerecord_owner_user")]
+BEFORE_RENAME = [(APP, "0007_scale_level_content")]
+AFTER_RENAME = [(APP, "0008_scalerecord_owner_name_unique")]
+
+
+@pytest.fixture
+def migrate():
+    """Migrate to ``targets`` and return the historical app registry."""
+
+    def run(targets):
+        executor = MigrationExecutor(connection)
+        executor.migrate(targets)
+        executor.loader.build_graph()
+        users = executor.loader.graph.leaf_nodes("usersystem")
+        return executor.loader.project_state([*targets, *users]).apps
+
+    yield run
+    executor = MigrationExecutor(connection)
+    executor.migrate(executor.loader.graph.leaf_nodes())
+
+
+def _record(apps, name, owner_id, owner_type="sc"):
+    ScaleRecord = apps.get_model(APP, "ScaleRecord")
+    return ScaleRecord.objects.create(
+        name=name, owner_type=owner_type, owner_id=owner_id
+    )
+
+
+def test_link_owners_matches_usernames_and_pks(migrate):
+    apps = migrate(BEFORE_LINK)
+    User = apps.get_model("usersystem", "User")
+    coordinator = User.objects.create(username="coord", role="sc")
+    by_name = _record(apps, "By name", "coord")
+    by_pk = _record(apps, "By pk", str(coordinator.pk))
+    unknown = _record(apps, "Unknown", "nobody")
+    system = _record(apps, "System", None, owner_type="system")
+
+    apps = migrate(AFTER_LINK)
+    ScaleRecord = apps.get_model(APP, "ScaleRecord")
+    rows = {
+        row.pk: (row.owner_user_id, row.owner_id) for row in ScaleRecord.objects.all()
+    }
+    assert rows == {
+        by_name.pk: (coordinator.pk, "coord"),
+        by_pk.pk: (coordinator.pk, "coord"),
+        unknown.pk: (None, "nobody"),
+        system.pk: (None, None),
+    }
+
+    apps = migrate(BEFORE_LINK)
+    ScaleRecord = apps.get_model(APP, "ScaleRecord")
+    assert ScaleRecord.objects.count() == 4
+
+
+def test_rename_duplicates_suffixes_repeated_names_per_owner(migrate):
+    apps = migrate(BEFORE_RENAME)
+    User = apps.get_model("usersystem", "User")
+    ScaleRecord = apps.get_model(APP, "ScaleRecord")
+    first, second = (
+        User.objects.create(username=name, role="sc") for name in ("first", "second")
+    )
+    names = ["Scale", "Scale", "Scale (2)", "Scale"]
+    created = [
+        ScaleRecord.objects.create(
+            name=name, owner_type="sc", owner_id="first", owner_user=first
+        )
+        for name in names
+    ]
+    other = ScaleRecord.objects.create(
+        name="Scale", owner_type="sc", owner_id="second", owner_user=second
+    )
+
+    apps = migrate(AFTER_RENAME)
+    ScaleRecord = apps.get_model(APP, "ScaleRecord")
+    renamed = dict(ScaleRecord.objects.values_list("pk", "name"))
+    assert [renamed[row.pk] for row in created] == [
+        "Scale",
+        "Scale (3)",
+        "Scale (2)",
+        "Scale (4)",
+    ]
+    assert renamed[other.pk] == "Scale"
+
+    apps = migrate(BEFORE_RENAME)
+    ScaleRecord = apps.get_model(APP, "ScaleRecord")
+    ScaleRecord.objects.create(
+        name="Scale", owner_type="sc", owner_id="first", owner_user_id=first.pk
+    )
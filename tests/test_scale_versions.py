@@ -0,0 +1,120 @@
+import pytest
+from django.db import transaction
+from django.db.transaction import TransactionManagementError
+
+from AIUseScale.models import ScaleLevelContent, ScaleRecord
+from AIUseScale.services import create_version, diff_levels, intern_level_contents
+from benchmarks.harness import load_context
+from benchmarks.querycounts import SMALL_SPEC
+from benchmarks.seeding import bench_token, seed_bench_data
+
+LEVELS = [
+    {"level_code": "L0", "label": "No AI", "description": "Work without AI."},
+    {"level_code": "L1", "label": "Ideas", "description": "AI for brainstorming."},
+]
+
+
+@pytest.fixture
+def record():
+    return ScaleRecord.objects.create(name="Scale", owner_type=ScaleRecord.OWNER_SYSTEM)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_versions_are_only_written_inside_a_transaction(record):
+    with pytest.raises(TransactionManagementError):
+        create_version(record, LEVELS, updated_by="admin")
+    with pytest.raises(TransactionManagementError):
+        intern_level_contents(LEVELS)
+    assert not record.versions.exists()
+
+    with transaction.atomic():
+        version = create_version(record, LEVELS, updated_by="admin")
+    assert version.version == 1
+    assert ScaleLevelContent.objects.count() == 2
+
+
+def _level(code, label, **fields):
+    return {"level_code": code, "label": label, "description": "", **fields}
+
+
+@pytest.fixture
+def two_versions(record):
+    """v1 -> v2: L0 edited and moved, L1 moved, L2 removed, L3 added, L4 kept."""
+    with transaction.atomic():
+        create_version(
+            record,
+            [
+                _level("L0", "No AI", ai_usage="None"),
+                _level("L1", "Ideas"),
+                _level("L2", "Drafting"),
+                _level("L4", "Full AI"),
+            ],
+            updated_by="admin",
+        )
+        create_version(
+            record,
+            [
+                _level("L1", "Ideas"),
+                _level("L0", "No AI", ai_usage="Not at all"),
+                _level("L3", "Editing"),
+                _level("L4", "Full AI"),
+            ],
+            updated_by="admin",
+        )
+    return record
+
+
+def _levels_of(record, number):
+    version = record.versions.get(version=number)
+    return list(version.levels.select_related("content").order_by("position"))
+
+
+@pytest.mark.django_db
+def test_diff_levels_matches_levels_by_code(two_versions):
+    diff = diff_levels(_levels_of(two_versions, 1), _levels_of(two_versions, 2))
+    assert [level.level_code for level in diff["added"]] == ["L3"]
+    assert [level.level_code for level in diff["removed"]] == ["L2"]
+    assert [level.level_code for level in diff["unchanged"]] == ["L4"]
+    changed = {
+        level.level_code: (fields, moved)
+        for _old, level, fields, moved in diff["changed"]
+    }
+    assert changed == {
+        "L1": ({}, True),
+        "L0": ({"ai_usage": ("None", "Not at all")}, True),
+    }
+
+
+@pytest.mark.django_db
+def test_diff_endpoint_payload_and_caching(client, two_versions):
+    seed_bench_data(SMALL_SPEC)
+    auth = {
+        "HTTP_AUTHORIZATION": f"Bearer {bench_token(load_context().admin.username)}"
+    }
+    url = f"/scale-records/{two_versions.pk}/diff/"
+
+    response = client.get(url, {"from": 1, "to": 2}, **auth)
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["recordId"], body["from"], body["to"]) == (str(two_versions.pk), 1, 2)
+    assert [level["id"] for level in body["added"]] == ["L3"]
+    assert [level["id"] for level in body["removed"]] == ["L2"]
+    assert body["unchanged"] == ["L4"]
+    assert body["changed"] == [
+        {"id": "L1", "fromPosition": 1, "toPosition": 0, "moved": True, "fields": {}},
+        {
+            "id": "L0",
+            "fromPosition": 0,
+            "toPosition": 1,
+            "moved": True,
+            "fields": {"aiUsage": {"from": "None", "to": "Not at all"}},
+        },
+    ]
+    assert "immutable" in response["Cache-Control"]
+
+    cached = client.get(
+        url, {"from": 1, "to": 2}, HTTP_IF_NONE_MATCH=response["ETag"], **auth
+    )
+    assert cached.status_code == 304
+    assert client.get(url, {"from": 1, "to": 3}, **auth).status_code == 404
+    assert client.get(url, {"from": "x", "to": 2}, **auth).status_code == 400
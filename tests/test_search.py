@@ -0,0 +1,60 @@
+import pytest
+from django.db import connection
+
+from Assignment.models import Assignment
+from common.search import full_text_search, get_search_backend
+from courses.models import Course
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def course():
+    return Course.objects.create(
+        course_name="Software Project", code="COMP30022", semester="2030S1"
+    )
+
+
+def _names(queryset):
+    return [row.name for row in queryset]
+
+
+def test_sqlite_uses_the_fts_backend():
+    assert type(get_search_backend(connection)).__name__ == "SQLiteSearchBackend"
+
+
+def test_token_prefix_match(course):
+    Assignment.objects.create(course=course, name="Reflective essay", type="Essay")
+    Assignment.objects.create(course=course, name="Lab report", type="Report")
+    assert _names(full_text_search(Assignment.objects.all(), "refl")) == [
+        "Reflective essay"
+    ]
+
+
+def test_assignment_names_keep_infix_matches(course):
+    Assignment.objects.create(course=course, name="Reflective essay", type="Essay")
+    Assignment.objects.create(course=course, name="Lab report", type="Report")
+    assert _names(full_text_search(Assignment.objects.all(), "say")) == [
+        "Reflective essay"
+    ]
+
+
+def test_course_codes_keep_infix_matches(course):
+    Course.objects.create(course_name="Other", code="INFO10001", semester="2030S1")
+    found = full_text_search(Course.objects.all(), "30022")
+    assert [row.code for row in found] == ["COMP30022"]
+
+
+def test_equal_ranks_fall_back_to_meta_ordering_then_pk(course):
+    rows = [
+        Assignment.objects.create(course=course, name="Weekly quiz", type="Quiz")
+        for _ in range(5)
+    ]
+    # Same created_at for all rows, so only the pk tie-breaker orders them.
+    Assignment.objects.filter(pk__in=[row.pk for row in rows]).update(
+        created_at=rows[0].created_at
+    )
+    found = full_text_search(Assignment.objects.all(), "quiz")
+    assert found.query.order_by == ("-search_rank", "-created_at", "pk")
+    pages = [list(found[start : start + 2]) for start in range(0, 5, 2)]
+    assert [row.pk for page in pages for row in page] == sorted(row.pk for row in rows)
@@ -0,0 +1,87 @@
+import pytest
+from rest_framework.test import APIRequestFactory
+
+from usersystem.throttling import LoginIPThrottle, TokenBucketThrottle, throttle_stats
+
+LOGIN_URL = "/api/auth/login/"
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(TokenBucketThrottle, "timer", lambda self: now[0])
+    return now
+
+
+@pytest.fixture
+def throttle(monkeypatch):
+    """A 3/min login_ip throttle; each call checks one request from one IP."""
+    monkeypatch.setattr(LoginIPThrottle, "rate", "3/min", raising=False)
+    request = APIRequestFactory().post(LOGIN_URL, REMOTE_ADDR="203.0.113.7")
+    bucket = LoginIPThrottle()
+
+    def allow():
+        return bucket.allow_request(request, None)
+
+    allow.bucket = bucket
+    return allow
+
+
+def test_bucket_allows_a_burst_then_rejects(clock, throttle):
+    assert [throttle() for _ in range(4)] == [True, True, True, False]
+    assert throttle_stats()["login_ip"] == 1
+
+
+def test_rejection_reports_the_wait_for_one_token(clock, throttle):
+    for _ in range(3):
+        throttle()
+    clock[0] += 5
+    assert not throttle()
+    assert throttle.bucket.wait() == pytest.approx(15)
+
+
+def test_tokens_refill_at_the_rate(clock, throttle):
+    for _ in range(3):
+        throttle()
+    assert not throttle()
+    clock[0] += 20
+    assert [throttle(), throttle()] == [True, False]
+
+
+def test_idle_bucket_is_full_again_after_one_period(clock, throttle):
+    for _ in range(3):
+        throttle()
+    clock[0] += 60
+    assert [throttle() for _ in range(4)] == [True, True, True, False]
+
+
+@pytest.mark.django_db
+def test_login_returns_429_per_account_across_ips(client, clock):
+    # login_account allows 10 attempts a minute for one username.
+    statuses = [
+        client.post(
+            LOGIN_URL,
+            {"username": "Ghost", "password": "guess"},
+            content_type="application/json",
+            REMOTE_ADDR=f"198.51.100.{index}",
+        ).status_code
+        for index in range(11)
+    ]
+    assert statuses == [401] * 10 + [429]
+
+    response = client.post(
+        LOGIN_URL,
+        {"username": "ghost ", "password": "guess"},
+        content_type="application/json",
+    )
+    assert response.status_code == 429
+    assert int(response["Retry-After"]) == 6
+
+    clock[0] += 6
+    response = client.post(
+        LOGIN_URL,
+        {"username": "ghost", "password": "guess"},
+        content_type="application/json",
+    )
+    assert response.status_code == 401
+    assert throttle_stats()["login_account"] == 2
@@ -0,0 +1,50 @@
+"""
+Password hashers whose cost parameters come from the PASSWORD_HASHER_PARAMS
+setting, so the hashing policy can be tuned per deployment. Changing a
+parameter makes ``must_update`` report stored hashes as outdated, and they are
+upgraded the next time their owner logs in.
+"""
+
+from django.conf import settings
+from django.contrib.auth import hashers
+
+
+def _setting(name, default):
+    value = getattr(settings, "PASSWORD_HASHER_PARAMS", {}).get(name)
+    return default if value is None else value
+
+
+class TunedPBKDF2PasswordHasher(hashers.PBKDF2PasswordHasher):
+    iterations = _setting(
+        "PASSWORD_PBKDF2_ITERATIONS", hashers.PBKDF2PasswordHasher.iterations
+    )
+
+
+class TunedArgon2PasswordHasher(hashers.Argon2PasswordHasher):
+    time_cost = _setting(
+        "PASSWORD_ARGON2_TIME_COST", hashers.Argon2PasswordHasher.time_cost
+    )
+    memory_cost = _setting(
+        "PASSWORD_ARGON2_MEMORY_COST", hashers.Argon2PasswordHasher.memory_cost
+    )
+    parallelism = _setting(
+        "PASSWORD_ARGON2_PARALLELISM", hashers.Argon2PasswordHasher.parallelism
+    )
+
+
+class TunedBCryptSHA256PasswordHasher(hashers.BCryptSHA256PasswordHasher):
+    rounds = _setting(
+        "PASSWORD_BCRYPT_ROUNDS", hashers.BCryptSHA256PasswordHasher.rounds
+    )
+
+
+class TunedScryptPasswordHasher(hashers.ScryptPasswordHasher):
+    work_factor = _setting(
+        "PASSWORD_SCRYPT_WORK_FACTOR", hashers.ScryptPasswordHasher.work_factor
+    )
+    block_size = _setting(
+        "PASSWORD_SCRYPT_BLOCK_SIZE", hashers.ScryptPasswordHasher.block_size
+    )
+    parallelism = _setting(
+        "PASSWORD_SCRYPT_PARALLELISM", hashers.ScryptPasswordHasher.parallelism
+    )
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Sequence
+
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.contrib.auth.hashers import check_password, make_password, verify_password
+
+from common import metrics
+
+logger = logging.getLogger(__name__)
+
+# Below this many passwords the cost of starting worker processes outweighs
+# the parallel speed-up, so hashing stays in the request thread.
+INLINE_HASH_THRESHOLD = 16
+
+# Jobs that sat in the async hash pool queue longer than this are logged.
+SLOW_QUEUE_WARNING_SECONDS = 1.0
+
+HASH_QUEUE_TIME = metrics.histogram(
+    "password_hash_queue_seconds",
+    "Time password hash jobs waited for a pool worker.",
+)
+HASH_JOBS = metrics.counter(
+    "password_hash_jobs_total",
+    "Password hash pool jobs by outcome.",
+    ("result",),
+)
+
+
+def _init_worker() -> None:
+    import django
+
+    django.setup()
+
+
+def _make_passwords(passwords: Sequence[str]) -> list[str]:
+    return [make_password(raw) for raw in passwords]
+
+
+def hash_passwords(passwords: Sequence[str]) -> list[str]:
+    """
+    Hash many raw passwords. Large batches are split into one job per worker
+    of the shared hash pool (``get_hash_pool``), so bulk imports share its
+    process and backlog limits with logins. Order of the returned hashes
+    matches the input. Raises ``HashPoolSaturated`` when the pool is full.
+    """
+    pool = get_hash_pool()
+    if pool.workers == 0 or len(passwords) < INLINE_HASH_THRESHOLD:
+        return _make_passwords(passwords)
+    size = -(-len(passwords) // pool.workers)
+    batches = [
+        list(passwords[start : start + size])
+        for start in range(0, len(passwords), size)
+    ]
+    hashed = async_to_sync(pool.run_all)(_make_passwords, batches)
+    return [encoded for batch in hashed for encoded in batch]
+
+
+def verify_and_upgrade(user, raw_password: str) -> bool:
+    """
+    Check ``raw_password`` against ``user``. When the stored hash was made by
+    an older hasher or with outdated cost parameters, it is replaced with one
+    from the current policy.
+    """
+
+    def _upgrade(raw: str) -> None:
+        user.password = make_password(raw)
+        user.save(update_fields=["password"])
+
+    return check_password(raw_password, user.password, setter=_upgrade)
+
+
+class HashPoolSaturated(RuntimeError):
+    """Raised when the password hash pool already has its maximum backlog."""
+
+
+def _timed_call(func: Callable, *args):
+    # Runs in the worker; the start time lets the caller measure queue time.
+    started = time.time()
+    return started, func(*args)
+
+
+class PasswordHashPool:
+    """
+    Shared, bounded process pool for password hashing from async views.
+
+    ``PASSWORD_HASH_POOL_SIZE`` worker processes do the hashing so the event
+    loop and request threads stay free. At most ``PASSWORD_HASH_MAX_PENDING``
+    jobs may be queued or running; anything beyond that is rejected straight
+    away rather than piling up behind a login storm. A pool size of 0 hashes
+    in the default thread executor instead, which is handy for development.
+    """
+
+    def __init__(self, workers: int, max_pending: int) -> None:
+        self.workers = max(0, workers)
+        self.max_pending = max(1, max_pending)
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._submitted = 0
+        self._completed = 0
+        self._rejected = 0
+        self._failed = 0
+        self._queue_total = 0.0
+        self._queue_max = 0.0
+
+    def _get_executor(self) -> ProcessPoolExecutor | None:
+        if self.workers == 0:
+            return None
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                )
+            return self._executor
+
+    def _reserve(self) -> None:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._rejected += 1
+                HASH_JOBS.inc(result="rejected")
+                raise HashPoolSaturated("password hashing is at capacity")
+            self._pending += 1
+            self._submitted += 1
+
+    def _release(self, queued: float | None) -> None:
+        with self._lock:
+            self._pending -= 1
+            if queued is not None:
+                self._completed += 1
+                self._queue_total += queued
+                self._queue_max = max(self._queue_max, queued)
+            else:
+                self._failed += 1
+        if queued is None:
+            HASH_JOBS.inc(result="failed")
+            return
+        HASH_JOBS.inc(result="completed")
+        HASH_QUEUE_TIME.observe(queued)
+
+    async def run(self, func: Callable, *args):
+        self._reserve()
+        submitted = time.time()
+        queued = None
+        try:
+            executor = self._get_executor()
+            loop = asyncio.get_running_loop()
+            started, result = await loop.run_in_executor(
+                executor, _timed_call, func, *args
+            )
+            queued = max(0.0, started - submitted)
+            return result
+        except BrokenProcessPool:
+            # A crashed worker poisons the executor; start a fresh one next time.
+            self.shutdown()
+            raise
+        finally:
+            self._release(queued)
+            if queued is not None and queued > SLOW_QUEUE_WARNING_SECONDS:
+                logger.warning("Password hash waited %.2fs in the pool queue", queued)
+
+    async def run_all(self, func: Callable, batches: Sequence) -> list:
+        """``run`` for every batch concurrently; each batch is one job."""
+        return await asyncio.gather(*(self.run(func, batch) for batch in batches))
+
+    def stats(self) -> dict[str, float | int]:
+        with self._lock:
+            completed = self._completed
+            return {
+                "workers": self.workers,
+                "maxPending": self.max_pending,
+                "pending": self._pending,
+                "submitted": self._submitted,
+                "completed": completed,
+                "failed": self._failed,
+                "rejected": self._rejected,
+                "queueMsAvg": (
+                    round(self._queue_total / completed * 1000, 3) if completed else 0.0
+                ),
+                "queueMsMax": round(self._queue_max * 1000, 3),
+            }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+_pool: PasswordHashPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_hash_pool() -> PasswordHashPool:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            workers = int(getattr(settings, "PASSWORD_HASH_POOL_SIZE", 1) or 0)
+            max_pending = int(
+                getattr(settings, "PASSWORD_HASH_MAX_PENDING", 0) or max(workers, 1) * 8
+            )
+            _pool = PasswordHashPool(workers, max_pending)
+        return _pool
+
+
+def hash_pool_stats() -> dict[str, float | int]:
+    return get_hash_pool().stats()
+
+
+async def amake_password(raw_password: str) -> str:
+    return await get_hash_pool().run(make_password, raw_password)
+
+
+async def acheck_password(raw_password: str, encoded: str) -> bool:
+    is_correct, _ = await get_hash_pool().run(verify_password, raw_password, encoded)
+    return is_correct
+
+
+async def averify_and_upgrade(user, raw_password: str) -> bool:
+    """Async counterpart of ``verify_and_upgrade`` that hashes in the pool."""
+    pool = get_hash_pool()
+    is_correct, must_update = await pool.run(
+        verify_password, raw_password, user.password
+    )
+    if is_correct and must_update:
+        user.password = await pool.run(make_password, raw_password)
+        await user.asave(update_fields=["password"])
+    return is_correct
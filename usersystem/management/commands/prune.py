@@ -0,0 +1,147 @@
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from AIUseScale.models import ScaleLevelContent
+from notifications.models import Notification, OutboundEmail
+from usersystem.models import PasswordResetToken, User
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete expired or used password reset tokens, old notifications, "
+        "delivered outbox emails and unreferenced scale level text. Clearing "
+        "auth tokens by last password login is opt-in (PRUNE_AUTH_TOKENS_DAYS). "
+        "Retention comes from PRUNE_RETENTION_DAYS; work is done in small "
+        "batches so no statement holds locks for long."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--pause",
+            type=float,
+            default=0.0,
+            help="Seconds to sleep between batches to give other writers room.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only count the rows that would be removed.",
+        )
+
+    def handle(self, *args, **options):
+        self.batch_size = max(1, options["batch_size"])
+        self.pause = options["pause"]
+        self.dry_run = options["dry_run"]
+        retention = settings.PRUNE_RETENTION_DAYS
+        now = timezone.now()
+
+        def cutoff(name):
+            days = retention.get(name) or 0
+            return now - timedelta(days=days) if days > 0 else None
+
+        results = {}
+        reset_cutoff = cutoff("reset_tokens")
+        if reset_cutoff:
+            results["reset_tokens"] = self._delete(
+                PasswordResetToken.objects.filter(
+                    Q(expires_at__lt=reset_cutoff) | Q(used_at__lt=reset_cutoff)
+                )
+            )
+        read_cutoff = cutoff("read_notifications")
+        if read_cutoff:
+            results["read_notifications"] = self._delete(
+                Notification.objects.filter(is_read=True, created_at__lt=read_cutoff)
+            )
+        unread_cutoff = cutoff("unread_notifications")
+        if unread_cutoff:
+            results["unread_notifications"] = self._delete(
+                Notification.objects.filter(is_read=False, created_at__lt=unread_cutoff)
+            )
+        email_cutoff = cutoff("outbound_emails")
+        if email_cutoff:
+            results["outbound_emails"] = self._delete(
+                OutboundEmail.objects.filter(
+                    status__in=[OutboundEmail.STATUS_SENT, OutboundEmail.STATUS_FAILED],
+                    created_at__lt=email_cutoff,
+                )
+            )
+        content_cutoff = cutoff("scale_level_contents")
+        if content_cutoff:
+            results["scale_level_contents"] = self._delete_locked(
+                ScaleLevelContent.objects.filter(
+                    levels__isnull=True, created_at__lt=content_cutoff
+                )
+            )
+        token_cutoff = cutoff("auth_tokens")
+        if token_cutoff:
+            results["auth_tokens"] = self._update(
+                User.objects.filter(
+                    auth_token__isnull=False, last_login_at__lt=token_cutoff
+                ),
+                auth_token=None,
+            )
+
+        verb = "would remove" if self.dry_run else "removed"
+        for name, count in results.items():
+            self.stdout.write(f"{name}: {verb} {count}")
+        self.stdout.write(self.style.SUCCESS(f"total: {sum(results.values())}"))
+
+    def _batches(self, queryset):
+        # Select a bounded set of keys first so each write is a short
+        # primary-key statement instead of one long range lock.
+        keys = queryset.order_by().values_list("pk", flat=True)
+        while True:
+            batch = list(keys[: self.batch_size])
+            if not batch:
+                return
+            yield batch
+            if len(batch) < self.batch_size:
+                return
+            if self.pause:
+                time.sleep(self.pause)
+
+    def _delete(self, queryset):
+        if self.dry_run:
+            return queryset.count()
+        total = 0
+        for batch in self._batches(queryset):
+            # Re-apply the filter so rows that stopped matching are kept.
+            deleted, _ = queryset.filter(pk__in=batch).delete()
+            total += deleted
+        return total
+
+    def _delete_locked(self, queryset):
+        # Content rows can be reused by a concurrent save_version, which locks
+        # the rows it reuses (see intern_level_contents). Lock the batch first
+        # and re-check it in the same transaction so nothing that just gained
+        # a reference is deleted.
+        if self.dry_run:
+            return queryset.count()
+        total = 0
+        model = queryset.model
+        for batch in self._batches(queryset):
+            with transaction.atomic():
+                locked = list(
+                    model.objects.select_for_update()
+                    .filter(pk__in=batch)
+                    .order_by("pk")
+                    .values_list("pk", flat=True)
+                )
+                deleted, _ = queryset.filter(pk__in=locked).delete()
+            total += deleted
+        return total
+
+    def _update(self, queryset, **values):
+        if self.dry_run:
+            return queryset.count()
+        total = 0
+        for batch in self._batches(queryset):
+            total += queryset.model.objects.filter(pk__in=batch).update(**values)
+        return total
@@ -0,0 +1,19 @@
+# Generated by Django 5.0.6 on 2026-10-19 15:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("usersystem", "0009_passwordresettoken"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="passwordresettoken",
+            index=models.Index(
+                fields=["expires_at"], name="usersystem__expires_aeaac0_idx"
+            ),
+        ),
+    ]
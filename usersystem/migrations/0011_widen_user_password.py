@@ -0,0 +1,18 @@
+# Generated by Django 5.0.6 on 2026-10-19 17:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("usersystem", "0010_passwordresettoken_expires_index"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="user",
+            name="password",
+            field=models.CharField(max_length=256),
+        ),
+    ]
@@ -13,7 +13,8 @@ class User(models.Model):
     STATUS_INACTIVE = "inactive"
 
     username = models.CharField(max_length=120, unique=True)
-    password = models.CharField(max_length=120)
+    # Encoded hashes outgrow 128 chars with scrypt or larger cost parameters.
+    password = models.CharField(max_length=256)
     role = models.CharField(max_length=30, choices=ROLE_CHOICES)
     name = models.CharField(max_length=120, blank=True)
     email = models.EmailField(max_length=255, blank=True)
@@ -46,6 +47,7 @@ class PasswordResetToken(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [models.Index(fields=['expires_at'])]
 
     def __str__(self):
         status = 'used' if self.used_at else 'active'
@@ -4,11 +4,18 @@ from typing import Iterable, Sequence
 
 from rest_framework.permissions import BasePermission
 
+from common import metrics
 from usersystem.models import User
 
 
 _CACHE_ATTR = "_cached_active_user"
 
+AUTH_CACHE_LOOKUPS = metrics.counter(
+    "auth_user_cache_total",
+    "resolve_active_user calls answered from the per-request cache (hit) or not.",
+    ("result",),
+)
+
 
 def _normalize_user(candidate) -> User | None:
     if isinstance(candidate, User):
@@ -43,7 +50,9 @@ def _resolve_from_authorization(header_value: str | None) -> User | None:
 def resolve_active_user(request) -> User | None:
     cached = getattr(request, _CACHE_ATTR, None)
     if cached is not None or hasattr(request, _CACHE_ATTR):
+        AUTH_CACHE_LOOKUPS.inc(result="hit")
         return cached
+    AUTH_CACHE_LOOKUPS.inc(result="miss")
 
     user = getattr(request, "user", None)
     resolved = _normalize_user(user)
@@ -70,3 +70,31 @@ class SelfProfileSerializer(serializers.ModelSerializer):
         data = super().to_representation(instance)
         data["id"] = str(instance.id)
         return data
+
+
+class BulkUserRowSerializer(serializers.Serializer):
+    """
+    Validates one row of a bulk import. Username uniqueness is checked by the
+    view for the whole upload at once rather than per row.
+    """
+
+    username = serializers.CharField(max_length=120)
+    password = serializers.CharField(min_length=6, max_length=128, write_only=True)
+    role = serializers.ChoiceField(choices=User.ROLE_CHOICES)
+    name = serializers.CharField(max_length=120, required=False, allow_blank=True)
+    email = serializers.EmailField(max_length=255, required=False, allow_blank=True)
+    status = serializers.ChoiceField(
+        choices=[User.STATUS_ACTIVE, User.STATUS_INACTIVE],
+        required=False,
+    )
+    phone = serializers.CharField(max_length=50, required=False, allow_blank=True)
+    organization = serializers.CharField(
+        max_length=120, required=False, allow_blank=True
+    )
+    bio = serializers.CharField(required=False, allow_blank=True)
+
+    def validate_username(self, value):
+        value = value.strip()
+        if not value:
+            raise serializers.ValidationError("username cannot be empty")
+        return value
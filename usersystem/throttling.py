@@ -0,0 +1,153 @@
+"""
+Token-bucket throttles for the unauthenticated auth endpoints.
+
+Each bucket holds up to ``num`` tokens and refills at ``num`` per period, using
+the ``num/period`` rates from ``REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"]``. So
+short bursts are allowed, but sustained guessing is held to the rate. The
+views that use these throttles skip authentication, so no database or hashing
+work happens before the check.
+
+A bucket is stored as a single integer, its theoretical arrival time in
+milliseconds (GCRA), and only changed through ``cache.add``/``incr``/``decr``.
+Concurrent requests therefore each take their own token instead of all
+reading the same count. The buckets are only global when every server process
+uses the same cache: the default locmem cache is per process, so deployments
+running more than one worker need DJANGO_CACHE_BACKEND=redis (or another
+shared cache with atomic ``incr``).
+
+Client IPs come from DRF's ``get_ident``, which trusts X-Forwarded-For only up
+to ``REST_FRAMEWORK["NUM_PROXIES"]`` hops (DJANGO_NUM_PROXIES, default 0, which
+means REMOTE_ADDR). Set it to the number of reverse proxies in front of the app.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+
+from django.core.cache import cache as default_cache
+from rest_framework.throttling import SimpleRateThrottle
+
+from common import metrics
+
+logger = logging.getLogger(__name__)
+
+THROTTLE_SCOPES = (
+    "login_ip",
+    "login_account",
+    "password_reset_ip",
+    "password_reset_account",
+)
+
+_REJECTED_KEY = "auth-throttle:rejected:%s"
+
+THROTTLE_REJECTIONS = metrics.counter(
+    "auth_throttle_rejections_total",
+    "Login and password reset requests rejected by a throttle.",
+    ("scope",),
+)
+
+
+def _record_rejection(scope: str) -> None:
+    THROTTLE_REJECTIONS.inc(scope=scope)
+    key = _REJECTED_KEY % scope
+    try:
+        default_cache.incr(key)
+    except ValueError:
+        default_cache.add(key, 0, timeout=None)
+        default_cache.incr(key)
+
+
+def throttle_stats() -> dict[str, int]:
+    """Rejected request counts per scope since the cache was last cleared."""
+    keys = [_REJECTED_KEY % scope for scope in THROTTLE_SCOPES]
+    counts = default_cache.get_many(keys)
+    return {scope: counts.get(_REJECTED_KEY % scope, 0) for scope in THROTTLE_SCOPES}
+
+
+class TokenBucketThrottle(SimpleRateThrottle):
+    cache = default_cache
+    cache_format = "auth-throttle:%(scope)s:%(ident)s"
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        # One token is worth ``interval`` ms and a full bucket ``burst`` ms.
+        interval = max(1, round(self.duration * 1000 / self.num_requests))
+        burst = interval * self.num_requests
+        now = int(self.timer() * 1000)
+        timeout = math.ceil(self.duration) + 1
+
+        arrival = self._take_token(interval, now, timeout)
+        if arrival - interval < now:
+            # The bucket had refilled since the last request; move the arrival
+            # time up to now. Racing requests may each add the gap, which only
+            # ever makes the bucket stricter.
+            arrival = self.cache.incr(self.key, now - (arrival - interval))
+        if arrival - now > burst:
+            self.cache.decr(self.key, interval)
+            self.wait_seconds = (arrival - now - burst) / 1000
+            _record_rejection(self.scope)
+            logger.info("Auth throttle %s rejected %s", self.scope, self.key)
+            return False
+        # Keep the bucket while it is in use; once idle for a whole period it
+        # is full again and may expire.
+        self.cache.touch(self.key, timeout)
+        return True
+
+    def _take_token(self, interval: int, now: int, timeout: int) -> int:
+        self.cache.add(self.key, now, timeout)
+        try:
+            return self.cache.incr(self.key, interval)
+        except ValueError:
+            # Expired or evicted between add() and incr(): start a new bucket.
+            self.cache.set(self.key, now + interval, timeout)
+            return now + interval
+
+    def wait(self):
+        return getattr(self, "wait_seconds", None)
+
+    def _format_key(self, ident: str) -> str:
+        return self.cache_format % {"scope": self.scope, "ident": ident}
+
+
+class IPThrottle(TokenBucketThrottle):
+    def get_cache_key(self, request, view):
+        return self._format_key(self.get_ident(request))
+
+
+class AccountThrottle(TokenBucketThrottle):
+    """Keyed on the account named in the request body, whoever sends it."""
+
+    account_fields: tuple[str, ...] = ("username",)
+
+    def get_cache_key(self, request, view):
+        for field in self.account_fields:
+            value = request.data.get(field)
+            if isinstance(value, str) and value.strip():
+                account = f"{field}:{value.strip().lower()}"
+                digest = hashlib.sha256(account.encode()).hexdigest()[:32]
+                return self._format_key(digest)
+        return None
+
+
+class LoginIPThrottle(IPThrottle):
+    scope = "login_ip"
+
+
+class LoginAccountThrottle(AccountThrottle):
+    scope = "login_account"
+
+
+class PasswordResetIPThrottle(IPThrottle):
+    scope = "password_reset_ip"
+
+
+class PasswordResetAccountThrottle(AccountThrottle):
+    scope = "password_reset_account"
+    account_fields = ("email", "username")
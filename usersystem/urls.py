@@ -1,6 +1,8 @@
 from django.urls import path
 
 from .views import (
+    AdminAuthThrottleView,
+    AdminUserBulkView,
     AdminUserDetailView,
     AdminUserListView,
     AdminUserStatusView,
@@ -30,8 +32,12 @@ urlpatterns = [
     path("users/me/password/", CurrentUserPasswordView.as_view()),
     path("admin/users", AdminUserListView.as_view()),
     path("admin/users/", AdminUserListView.as_view()),
+    path("admin/users/bulk", AdminUserBulkView.as_view()),
+    path("admin/users/bulk/", AdminUserBulkView.as_view()),
     path("admin/users/<int:user_id>", AdminUserDetailView.as_view()),
     path("admin/users/<int:user_id>/", AdminUserDetailView.as_view()),
     path("admin/users/<int:user_id>/status", AdminUserStatusView.as_view()),
     path("admin/users/<int:user_id>/status/", AdminUserStatusView.as_view()),
+    path("admin/auth-throttles", AdminAuthThrottleView.as_view()),
+    path("admin/auth-throttles/", AdminAuthThrottleView.as_view()),
 ]
@@ -1,25 +1,47 @@
+import csv
 import hashlib
+import io
+import json
 import logging
 import secrets
 from datetime import timedelta
 from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
+from asgiref.sync import sync_to_async
 from django.conf import settings
-from django.contrib.auth.hashers import check_password, make_password
-from django.core.mail import BadHeaderError, send_mail
-from django.db import transaction
+from django.db import IntegrityError, transaction
 from django.utils import timezone
 from rest_framework import permissions, status
 from rest_framework.generics import get_object_or_404
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from smtplib import SMTPException
 
 from common.responses import error_response
-
+from common.views import AsyncAPIView
+from notifications.outbox import queue_email
+
+from .hashing import (
+    HashPoolSaturated,
+    acheck_password,
+    amake_password,
+    averify_and_upgrade,
+    hash_passwords,
+)
 from .models import PasswordResetToken, User
 from .permissions import ActiveUserPermission, RolePermission, resolve_active_user
-from .serializer import ManagedUserSerializer, SelfProfileSerializer, UserSerializer
+from .serializer import (
+    BulkUserRowSerializer,
+    ManagedUserSerializer,
+    SelfProfileSerializer,
+    UserSerializer,
+)
+from .throttling import (
+    LoginAccountThrottle,
+    LoginIPThrottle,
+    PasswordResetAccountThrottle,
+    PasswordResetIPThrottle,
+    throttle_stats,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +71,15 @@ def issue_token(user: User) -> str:
     raise RuntimeError("Failed to allocate authentication token.")
 
 
+def hashing_busy():
+    response = error_response(
+        "server busy, please retry shortly",
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+    )
+    response["Retry-After"] = "1"
+    return response
+
+
 def hash_reset_token(raw: str) -> str:
     return hashlib.sha256(raw.encode("utf-8")).hexdigest()
 
@@ -67,7 +98,7 @@ def build_reset_link(token: str) -> str:
 
 
 def dispatch_password_reset_email(user: User, raw_token: str) -> None:
-    # Email the reset instructions; swallow missing email addresses gracefully.
+    # Queue the reset instructions for the outbox worker; skip users without email.
     if not user.email:
         logger.info("Skipping password reset email because user has no email set.")
         return
@@ -79,24 +110,18 @@ def dispatch_password_reset_email(user: User, raw_token: str) -> None:
         f"{reset_link}\n\n"
         "If you did not request a reset, you can ignore this email."
     )
-    try:
-        send_mail(
-            subject,
-            message,
-            settings.DEFAULT_FROM_EMAIL,
-            [user.email],
-            fail_silently=False,
-        )
-    except (SMTPException, BadHeaderError) as exc:
-        logger.exception("Failed to send password reset email: user=%s", user.id, exc_info=exc)
+    queue_email(user.email, subject, message, category="password_reset")
 
 
 def invalidate_user_tokens(user: User) -> None:
     # Mark any previous tokens as used so only the latest one stays active.
+    # Expired tokens are already unusable and are left for `manage.py prune`.
+    now = timezone.now()
     PasswordResetToken.objects.filter(
         user=user,
         used_at__isnull=True,
-    ).update(used_at=timezone.now())
+        expires_at__gt=now,
+    ).update(used_at=now)
 
 class RegisterView(APIView):
     permission_classes = [permissions.AllowAny]
@@ -117,10 +142,14 @@ class RegisterView(APIView):
             code=status.HTTP_201_CREATED,
         )
 
-class LoginView(APIView):
+
+class LoginView(AsyncAPIView):
+    # No authentication so the throttles run before any database access.
+    authentication_classes = []
     permission_classes = [permissions.AllowAny]
+    throttle_classes = [LoginIPThrottle, LoginAccountThrottle]
 
-    def post(self, request):
+    async def post(self, request):
         username = (request.data.get("username") or "").strip()
         password = (request.data.get("password") or "")
 
@@ -131,14 +160,18 @@ class LoginView(APIView):
             )
 
         try:
-            user = User.objects.get(username=username)
+            user = await User.objects.aget(username=username)
         except User.DoesNotExist:
             return error_response(
                 "username or password incorrect",
                 status_code=status.HTTP_401_UNAUTHORIZED,
             )
 
-        if not check_password(password, user.password):
+        try:
+            verified = await averify_and_upgrade(user, password)
+        except HashPoolSaturated:
+            return hashing_busy()
+        if not verified:
             return error_response(
                 "username or password incorrect",
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -168,7 +201,7 @@ class LoginView(APIView):
                 status_code=status.HTTP_403_FORBIDDEN,
             )
 
-        token = issue_token(user)
+        token = await sync_to_async(issue_token)(user)
 
         return Response(
             {
@@ -192,7 +225,9 @@ class LogoutView(APIView):
 
 
 class PasswordResetRequestView(APIView):
+    authentication_classes = []
     permission_classes = [permissions.AllowAny]
+    throttle_classes = [PasswordResetIPThrottle, PasswordResetAccountThrottle]
 
     def post(self, request):
         email = (request.data.get("email") or "").strip()
@@ -230,24 +265,17 @@ class PasswordResetRequestView(APIView):
                     token_hash=token_hash,
                     expires_at=expires_at,
                 )
-            try:
                 dispatch_password_reset_email(user, raw_token)
-            except (SMTPException, BadHeaderError) as exc:
-                logger.warning(
-                    "Password reset email dispatch failed for user=%s",
-                    user.id,
-                    exc_info=exc,
-                )
 
         return success(
             msg="If an account matches the provided details, a reset email has been sent."
         )
 
 
-class PasswordResetConfirmView(APIView):
+class PasswordResetConfirmView(AsyncAPIView):
     permission_classes = [permissions.AllowAny]
 
-    def post(self, request):
+    async def post(self, request):
         token = (request.data.get("token") or "").strip()
         new_password = (request.data.get("newPassword") or "").strip()
         if not token or not new_password:
@@ -262,10 +290,10 @@ class PasswordResetConfirmView(APIView):
             )
 
         token_hash = hash_reset_token(token)
-        reset_entry = (
+        reset_entry = await (
             PasswordResetToken.objects.select_related("user")
             .filter(token_hash=token_hash)
-            .first()
+            .afirst()
         )
         if (
             not reset_entry
@@ -277,14 +305,22 @@ class PasswordResetConfirmView(APIView):
                 status_code=status.HTTP_400_BAD_REQUEST,
             )
 
-        user = reset_entry.user
-        user.password = make_password(new_password)
-        user.save(update_fields=["password"])
-
-        reset_entry.mark_used()
-        invalidate_user_tokens(user)
+        try:
+            encoded = await amake_password(new_password)
+        except HashPoolSaturated:
+            return hashing_busy()
+        await sync_to_async(self._apply_reset)(reset_entry, encoded)
         return success(msg="password reset")
 
+    @staticmethod
+    def _apply_reset(reset_entry, encoded):
+        user = reset_entry.user
+        with transaction.atomic():
+            user.password = encoded
+            user.save(update_fields=["password"])
+            reset_entry.mark_used()
+            invalidate_user_tokens(user)
+
 
 class AdminUserListView(APIView):
     permission_classes = [ActiveUserPermission, RolePermission]
@@ -330,6 +366,167 @@ class AdminUserDetailView(APIView):
         return Response(data, status=status.HTTP_200_OK)
 
 
+class AdminUserBulkView(APIView):
+    permission_classes = [ActiveUserPermission, RolePermission]
+    required_roles = ['admin']
+    max_rows = 5000
+    batch_size = 500
+
+    def post(self, request):
+        try:
+            rows = self._read_rows(request)
+        except ValueError as exc:
+            return error_response(str(exc), status_code=status.HTTP_400_BAD_REQUEST)
+        if not rows:
+            return error_response(
+                "no users provided", status_code=status.HTTP_400_BAD_REQUEST
+            )
+        if len(rows) > self.max_rows:
+            return error_response(
+                f"at most {self.max_rows} users can be imported per request",
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
+
+        results = []
+        pending = []
+        seen = set()
+        for index, row in enumerate(rows, start=1):
+            serializer = BulkUserRowSerializer(data=row)
+            if not serializer.is_valid():
+                results.append(
+                    self._row_error(index, row.get("username"), serializer.errors)
+                )
+                continue
+            data = serializer.validated_data
+            if data["username"] in seen:
+                results.append(
+                    self._row_error(
+                        index, data["username"], {"username": ["duplicate in upload"]}
+                    )
+                )
+                continue
+            seen.add(data["username"])
+            pending.append((index, data))
+            results.append(None)
+
+        existing = set(
+            User.objects.filter(username__in=seen).values_list("username", flat=True)
+        )
+        accepted = []
+        for index, data in pending:
+            if data["username"] in existing:
+                results[index - 1] = self._row_error(
+                    index, data["username"], {"username": ["username already exists"]}
+                )
+            else:
+                accepted.append((index, data))
+
+        try:
+            hashes = hash_passwords([data["password"] for _index, data in accepted])
+        except HashPoolSaturated:
+            return hashing_busy()
+        users = [
+            User(**{**data, "password": hashed})
+            for (_index, data), hashed in zip(accepted, hashes)
+        ]
+
+        created = set()
+        for start in range(0, len(users), self.batch_size):
+            batch = users[start:start + self.batch_size]
+            created.update(self._create_batch(batch))
+
+        created_ids = dict(
+            User.objects.filter(username__in=created).values_list("username", "id")
+        )
+        for index, data in accepted:
+            username = data["username"]
+            if username in created_ids:
+                results[index - 1] = {
+                    "row": index,
+                    "username": username,
+                    "status": "created",
+                    "id": str(created_ids[username]),
+                }
+            else:
+                results[index - 1] = self._row_error(
+                    index, username, {"username": ["username already exists"]}
+                )
+
+        payload = {
+            "created": len(created_ids),
+            "failed": len(results) - len(created_ids),
+            "results": results,
+        }
+        if not created_ids:
+            return error_response(
+                "no users imported",
+                status_code=status.HTTP_400_BAD_REQUEST,
+                data=payload,
+            )
+        return Response(payload, status=status.HTTP_201_CREATED)
+
+    def _create_batch(self, batch):
+        try:
+            with transaction.atomic():
+                User.objects.bulk_create(batch)
+            return {user.username for user in batch}
+        except IntegrityError:
+            # A concurrent request claimed one of the usernames; retry row by
+            # row so the rest of the batch still goes in.
+            created = set()
+            for user in batch:
+                user.pk = None
+                try:
+                    with transaction.atomic():
+                        user.save(force_insert=True)
+                except IntegrityError:
+                    continue
+                created.add(user.username)
+            return created
+
+    def _row_error(self, index, username, errors):
+        return {
+            "row": index,
+            "username": username or "",
+            "status": "error",
+            "errors": errors,
+        }
+
+    def _read_rows(self, request):
+        upload = request.FILES.get("file")
+        if upload is not None:
+            name = (upload.name or "").lower()
+            if name.endswith(".json"):
+                return self._normalize_rows(json.load(upload))
+            text = io.TextIOWrapper(upload, encoding="utf-8-sig")
+            return self._normalize_rows(list(csv.DictReader(text)))
+
+        data = request.data
+        if isinstance(data, dict) and isinstance(data.get("csv"), str):
+            return self._normalize_rows(list(csv.DictReader(io.StringIO(data["csv"]))))
+        if isinstance(data, dict):
+            data = data.get("users", [])
+        return self._normalize_rows(data)
+
+    def _normalize_rows(self, rows):
+        if isinstance(rows, dict):
+            rows = rows.get("users", [])
+        if not isinstance(rows, list):
+            raise ValueError("users must be a list")
+        normalized = []
+        for row in rows:
+            if not isinstance(row, dict):
+                raise ValueError("each user must be an object")
+            normalized.append(
+                {
+                    str(key).strip(): value.strip() if isinstance(value, str) else value
+                    for key, value in row.items()
+                    if key and value not in (None, "")
+                }
+            )
+        return normalized
+
+
 class AdminUserStatusView(APIView):
     permission_classes = [ActiveUserPermission, RolePermission]
     required_roles = ['admin']
@@ -355,6 +552,20 @@ class AdminUserStatusView(APIView):
         return Response(data, status=status.HTTP_200_OK)
 
 
+class AdminAuthThrottleView(APIView):
+    permission_classes = [ActiveUserPermission, RolePermission]
+    required_roles = ['admin']
+
+    def get(self, request):
+        return Response(
+            {
+                "rates": settings.REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"],
+                "rejected": throttle_stats(),
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
 class CurrentUserView(APIView):
     permission_classes = [ActiveUserPermission]
 
@@ -378,11 +589,11 @@ class CurrentUserView(APIView):
         return Response(response_serializer.data, status=status.HTTP_200_OK)
 
 
-class CurrentUserPasswordView(APIView):
+class CurrentUserPasswordView(AsyncAPIView):
     permission_classes = [ActiveUserPermission]
 
-    def post(self, request):
-        user = resolve_active_user(request)
+    async def post(self, request):
+        user = await sync_to_async(resolve_active_user)(request)
         current_password = (request.data.get("currentPassword") or "").strip()
         new_password = (request.data.get("newPassword") or "").strip()
 
@@ -396,13 +607,15 @@ class CurrentUserPasswordView(APIView):
                 "new password must contain at least 6 characters",
                 status_code=status.HTTP_400_BAD_REQUEST,
             )
-        if not check_password(current_password, user.password):
-            return error_response(
-                "current password incorrect",
-                status_code=status.HTTP_400_BAD_REQUEST,
-            )
-
-        user.password = make_password(new_password)
-        user.save(update_fields=["password"])
+        try:
+            if not await acheck_password(current_password, user.password):
+                return error_response(
+                    "current password incorrect",
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                )
+            user.password = await amake_password(new_password)
+        except HashPoolSaturated:
+            return hashing_busy()
+        await user.asave(update_fields=["password"])
 
         return success(msg="password updated")